@@ -0,0 +1,137 @@
+"""
+Parquet/Arrow ingestion for Student Marks Analyzer.
+Reads only the name and subject columns from a Parquet file and copies the
+Arrow buffers straight into a StudentTable: names keep Arrow's UTF-8 data and
+offsets, and each subject column is cast to uint8 and interleaved into the
+marks matrix with one strided copy. No per-student Python objects are built.
+"""
+
+from array import array
+
+from marks_table import MarksTable, PackedNames, StudentTable, roster_subjects
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; only needed for Parquet input
+    pa = None
+
+
+def pyarrow_available():
+    """Return True if pyarrow can be used by this loader."""
+    return pa is not None
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Reading Parquet rosters requires pyarrow (pip install pyarrow)")
+
+
+def _is_numeric(field):
+    return pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+
+
+def _packed_names(column):
+    names = column.combine_chunks().cast(pa.string())
+    if names.null_count:
+        raise ValueError("Student names must not be missing")
+    _, offsets_buffer, data_buffer = names.buffers()
+    start = names.offset * 4
+    offsets = array('I')
+    offsets.frombytes(memoryview(offsets_buffer)[start:start + 4 * (len(names) + 1)])
+    first, last = offsets[0], offsets[-1]
+    if first:
+        offsets = array('I', (offset - first for offset in offsets))
+    blob = bytes(memoryview(data_buffer)[first:last]) if data_buffer is not None else b''
+    return PackedNames(blob, offsets)
+
+
+def _uint8_marks(column, subject):
+    """Return a column's marks as bytes, or None if they are not whole numbers 0-100."""
+    if column.null_count:
+        raise ValueError(f"'{subject}' has missing marks")
+    try:
+        marks = column.combine_chunks().cast(pa.uint8())
+    except pa.ArrowInvalid:  # fractional or outside 0-255
+        return None
+    if len(marks) and pc.max(marks).as_py() > 100:
+        return None
+    return bytes(memoryview(marks.buffers()[1])[marks.offset:marks.offset + len(marks)])
+
+
+def _float_column(column):
+    values = column.combine_chunks().cast(pa.float64())
+    result = array('d')
+    result.frombytes(memoryview(values.buffers()[1])[values.offset * 8:(values.offset + len(values)) * 8])
+    return result
+
+
+def table_from_arrow(table, subjects=None, name_column='Name'):
+    """
+    Convert an Arrow table into a roster for the analyzers.
+
+    Args:
+        table (pyarrow.Table): One row per student
+        subjects (sequence): Subject columns to use; defaults to every column but the names
+        name_column (str): Column holding student names
+
+    Returns:
+        StudentTable, or a MarksTable if any marks are fractional
+
+    Raises:
+        ValueError: If a column is missing or holds missing/out-of-range values
+    """
+    _require_pyarrow()
+    if subjects is None:
+        subjects = roster_subjects(table.schema.names, name_column)
+    missing = [column for column in (name_column, *subjects) if column not in table.column_names]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    columns = [table.column(subject) for subject in subjects]
+    for subject, column in zip(subjects, columns):
+        field = table.schema.field(subject)
+        if not _is_numeric(field):
+            raise ValueError(f"Marks must be numbers, but '{subject}' is not a numeric column")
+        # Nulls make min/max return None, and NaN compares false with any bound
+        if column.null_count:
+            raise ValueError(f"'{subject}' has missing marks")
+        if pa.types.is_floating(field.type) and pc.any(pc.is_nan(column)).as_py():
+            raise ValueError(f"'{subject}' has marks that are not numbers")
+        if len(column) and (pc.min(column).as_py() < 0 or pc.max(column).as_py() > 100):
+            raise ValueError(f"Marks must be between 0 and 100, but '{subject}' is not")
+
+    names = _packed_names(table.column(name_column))
+    packed = [_uint8_marks(column, subject) for subject, column in zip(subjects, columns)]
+    if any(marks is None for marks in packed):
+        return MarksTable(subjects, names, [_float_column(column) for column in columns])
+
+    width = len(subjects)
+    marks = bytearray(len(names) * width)
+    for j, column in enumerate(packed):
+        marks[j::width] = column
+    return StudentTable(subjects, names, marks)
+
+
+def read_parquet(source, subjects=None, name_column='Name'):
+    """
+    Read a Parquet roster, loading only the name and subject columns.
+
+    Args:
+        source: Path or binary file object (e.g. a Streamlit upload)
+        subjects (sequence): Subject columns to read; defaults to every column but the names
+        name_column (str): Column holding student names
+
+    Returns:
+        StudentTable, or a MarksTable if any marks are fractional
+    """
+    _require_pyarrow()
+    parquet = pq.ParquetFile(source)
+    schema = parquet.schema_arrow
+    if subjects is None:
+        subjects = roster_subjects(schema.names, name_column)
+    missing = [column for column in (name_column, *subjects) if column not in schema.names]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    return table_from_arrow(parquet.read(columns=[name_column, *subjects]), subjects, name_column)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for Student Marks Analyzer.
+Generates synthetic rosters, times the analysis engines, the console display,
+grading and the Streamlit DataFrame builders, and reports throughput and peak
+memory. Results can be saved as a JSON baseline and compared against later.
+
+Usage:
+    python benchmark_analyzer.py
+    python benchmark_analyzer.py --sizes 1000 10000000 --compact --save baseline.json
+    python benchmark_analyzer.py --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from array import array
+from contextlib import redirect_stdout
+from datetime import datetime
+from random import Random
+
+from engines import analyze_roster
+from grading import DEFAULT_SCALE, get_grade
+from marks_table import DEFAULT_SUBJECTS, StudentTable, subjects_of
+from parallel_analyzer import analyze_sharded
+from ranking import student_ranks
+from results_query import ResultsQuery
+from streaming_analyzer import analyze_stream
+from student_marks_analyzer import analyze_student_marks, display_analysis
+from vectorized_analyzer import analyze_student_marks_vectorized, numpy_available
+
+try:
+    import dataframes
+except ImportError:  # pandas is only needed for the Streamlit table builders
+    dataframes = None
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+REGRESSION_TOLERANCE = 0.10
+PAGE_SIZE = 50  # the apps' default "Students per page"
+
+# Byte values below 202 map two-to-one onto marks 0-100; higher values are
+# dropped so every mark is equally likely
+_MARK_BYTES = 2 * 101
+_MARKS_TABLE = bytes(value % 101 for value in range(256))
+_REJECTED = bytes(range(_MARK_BYTES, 256))
+
+
+def _random_marks(rng, count):
+    """count uniformly distributed marks from 0 to 100, as bytes."""
+    marks = bytearray()
+    while len(marks) < count:
+        needed = count - len(marks)
+        size = needed * 256 // _MARK_BYTES + 64
+        # Random.randbytes is Python 3.9+; this is how it is implemented
+        chunk = rng.getrandbits(size * 8).to_bytes(size, 'little')
+        marks += chunk.translate(_MARKS_TABLE, _REJECTED)
+    return bytes(marks[:count])
+
+
+def make_roster(size, subjects=DEFAULT_SUBJECTS, seed=0, compact=False):
+    """
+    Build a reproducible synthetic roster.
+
+    Args:
+        size (int): Number of students
+        subjects (sequence): Subject names
+        seed (int): Random seed, so every run sees the same marks
+        compact (bool): Return a StudentTable instead of a dict; needed to fit
+                        rosters of ten million students in memory
+
+    Returns:
+        dict or StudentTable: {'StudentNNNNNNN': [marks...]}
+    """
+    width = len(subjects)
+    marks = _random_marks(Random(seed), size * width)
+    names = [f"Student{i:07d}" for i in range(size)]
+    if compact:
+        return StudentTable(subjects, names, array('B', marks))
+    view = memoryview(marks)
+    return {name: view[i * width:(i + 1) * width].tolist() for i, name in enumerate(names)}
+
+
+def _display(roster, results):
+    with open(os.devnull, 'w') as sink, redirect_stdout(sink):
+        display_analysis(results)
+
+
+def _headline(roster, results):
+    lazy = analyze_student_marks(roster)
+    return lazy['class_topper'], len(lazy['failed_students'])
+
+
+def _grades(roster, results):
+    return [get_grade(average) for average in results['student_averages'].values()]
+
+
+_views = {}
+
+
+def _roster_views(roster, results):
+    """Query, ranks and failures for a roster, built once as the apps cache them."""
+    if _views.get('roster') is not roster:
+        _views.clear()
+        _views.update(roster=roster, query=ResultsQuery(roster, results), ranks=student_ranks(roster),
+                      failed=frozenset(results['failed_students']))
+    return _views
+
+
+def _marks_page(roster, results):
+    views = _roster_views(roster, results)
+    positions, _ = views['query'].page_positions(page_size=PAGE_SIZE)
+    return dataframes.marks_page_dataframe(views['query'], positions, views['failed'], views['ranks'])
+
+
+def _averages_page(roster, results):
+    query = _roster_views(roster, results)['query']
+    positions, _ = query.page_positions(page_size=PAGE_SIZE)
+    return dataframes.averages_page_dataframe(query, positions)
+
+
+def benchmark_cases():
+    """
+    Every benchmark that can run with the installed libraries.
+
+    Returns:
+        dict: {name: function(roster, results)}
+    """
+    cases = {
+        'analyze_student_marks': lambda roster, results: analyze_student_marks(roster).to_dict(),
+        'analyze_headline': _headline,
+        'analyze_roster': lambda roster, results: analyze_roster(roster),
+        'analyze_stream': lambda roster, results: analyze_stream(roster.items(), subjects_of(roster)),
+        'analyze_sharded': lambda roster, results: analyze_sharded(roster),
+        'display_analysis': _display,
+        'get_grade': _grades,
+        'grade_all': lambda roster, results: DEFAULT_SCALE.grade_all(results['student_averages'].values()),
+        'grade_counts': lambda roster, results: DEFAULT_SCALE.counts(results['student_averages'].values()),
+        'student_ranks': lambda roster, results: student_ranks(roster),
+        'results_query': lambda roster, results: ResultsQuery(roster, results),
+    }
+    if numpy_available():
+        cases['analyze_vectorized'] = lambda roster, results: analyze_student_marks_vectorized(roster)
+    if dataframes is not None:
+        cases['marks_page_dataframe'] = _marks_page
+        cases['averages_page_dataframe'] = _averages_page
+        cases['summary_dataframe'] = lambda roster, results: dataframes.summary_dataframe(roster)
+        cases['distribution_dataframe'] = lambda roster, results: dataframes.distribution_dataframe(roster)
+    return cases
+
+
+def _time(func, roster, results, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(roster, results)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(func, roster, results):
+    tracemalloc.start()
+    try:
+        func(roster, results)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, cases=None, repeat=3, compact=False, memory=True, report=print):
+    """
+    Time each case at each roster size.
+
+    Args:
+        sizes (sequence): Roster sizes to generate
+        cases (sequence): Case names to run; defaults to all available
+        repeat (int): Runs per measurement; the fastest is kept
+        compact (bool): Use StudentTable rosters
+        memory (bool): Also measure peak memory with tracemalloc (slower)
+        report: Called with one formatted line per measurement, or None
+
+    Returns:
+        list: One {'case', 'size', 'seconds', 'throughput', 'peak_bytes'} dict per measurement
+
+    Cases share one LazyResults per roster, so a section is only built if a
+    case reads it; the first run of the first case to read it pays for it,
+    which only shows in the reported time when repeat is 1. The page cases
+    likewise share the roster's ResultsQuery and ranks, as the apps cache
+    them, and time only what one rerun renders.
+    """
+    available = benchmark_cases()
+    selected = list(available) if cases is None else list(cases)
+    unknown = [name for name in selected if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown or unavailable benchmark cases: {', '.join(unknown)}")
+
+    measurements = []
+    for size in sizes:
+        roster = make_roster(size, compact=compact)
+        results = analyze_student_marks(roster)
+        for name in selected:
+            func = available[name]
+            seconds = _time(func, roster, results, repeat)
+            entry = {
+                'case': name,
+                'size': size,
+                'seconds': seconds,
+                'throughput': size / seconds if seconds else None,
+                'peak_bytes': _peak_memory(func, roster, results) if memory else None
+            }
+            measurements.append(entry)
+            if report:
+                report(format_entry(entry))
+    return measurements
+
+
+def format_entry(entry):
+    peak = entry['peak_bytes']
+    peak_text = f"{peak / 1e6:10.1f} MB" if peak is not None else f"{'-':>13}"
+    return (f"{entry['case']:<24}{entry['size']:>10,}{entry['seconds']:>12.4f}s"
+            f"{entry['throughput'] or 0:>16,.0f}/s{peak_text}")
+
+
+def environment():
+    """Details stored with a baseline so comparisons can be judged fairly."""
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+    }
+    if numpy_available():
+        import numpy
+        info['numpy'] = numpy.__version__
+    if dataframes is not None:
+        info['pandas'] = dataframes.pd.__version__
+    return info
+
+
+def save_baseline(measurements, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'results': measurements}, f, indent=2)
+
+
+def load_baseline(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(measurements, baseline, tolerance=REGRESSION_TOLERANCE):
+    """
+    Compare measurements against a saved baseline.
+
+    Returns:
+        list: One {'case', 'size', 'baseline', 'current', 'ratio', 'regressed'}
+              dict per measurement present in both runs
+    """
+    previous = {(entry['case'], entry['size']): entry for entry in baseline['results']}
+    rows = []
+    for entry in measurements:
+        old = previous.get((entry['case'], entry['size']))
+        if old is None or not old['seconds']:
+            continue
+        ratio = entry['seconds'] / old['seconds']
+        rows.append({
+            'case': entry['case'],
+            'size': entry['size'],
+            'baseline': old['seconds'],
+            'current': entry['seconds'],
+            'ratio': ratio,
+            'regressed': ratio > 1 + tolerance
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Student Marks Analyzer engines")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="roster sizes to generate (default: 1e3 to 1e6)")
+    parser.add_argument('--cases', nargs='+', help="benchmark cases to run (default: all available)")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per measurement; the fastest is kept")
+    parser.add_argument('--compact', action='store_true', help="use StudentTable rosters (for 1e7 students)")
+    parser.add_argument('--no-memory', action='store_true', help="skip peak-memory measurement")
+    parser.add_argument('--save', metavar='PATH', help="write results as a JSON baseline")
+    parser.add_argument('--compare', metavar='PATH', help="compare against a JSON baseline")
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                        help="allowed slowdown before a case counts as a regression (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    print(f"{'case':<24}{'students':>10}{'time':>13}{'throughput':>18}{'peak memory':>13}")
+    print("-" * 78)
+    measurements = run_benchmarks(args.sizes, args.cases, args.repeat, args.compact, not args.no_memory)
+
+    if args.save:
+        save_baseline(measurements, args.save)
+        print(f"\nBaseline saved to {args.save}")
+
+    if args.compare:
+        rows = compare(measurements, load_baseline(args.compare), args.tolerance)
+        print(f"\nComparison with {args.compare}:")
+        for row in rows:
+            flag = "  REGRESSION" if row['regressed'] else ""
+            print(f"{row['case']:<24}{row['size']:>10,}{row['baseline']:>12.4f}s{row['current']:>12.4f}s"
+                  f"{row['ratio']:>8.2f}x{flag}")
+        if any(row['regressed'] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Bitmap index for Student Marks Analyzer.
+Keeps one bitset per subject marking the students below the pass mark, and
+one per grade band of student averages. Bitsets are Python ints with bit i
+for the i-th student, so compound questions such as "failed Math and Science
+but passed English" are a few bitwise ANDs and ORs over the whole roster
+instead of a rescan of every mark.
+"""
+
+import re
+from bisect import bisect_right
+
+from grading import DEFAULT_BANDS
+from marks_table import PASS_MARK, MarksTable, subjects_of
+
+_SET_BIT = re.compile(b'1')
+
+
+def _bitset(flags):
+    """Turn a b'0'/b'1' string (student 0 first) into an int bitset."""
+    return int(flags[::-1], 2) if flags else 0
+
+
+def _fail_flags(column, pass_mark):
+    """b'1' for every mark below the pass mark, b'0' otherwise."""
+    if isinstance(column, memoryview):
+        marks = column.tobytes()
+    else:
+        try:
+            marks = bytes(iter(column))
+        except (TypeError, ValueError):  # fractional or out-of-byte-range marks
+            return bytes(49 if mark < pass_mark else 48 for mark in column)
+    return marks.translate(bytes(49 if mark < pass_mark else 48 for mark in range(256)))
+
+
+class BitmapIndex:
+    """
+    Per-subject failure bitsets and per-grade-band bitsets for a roster.
+
+    Building the index reads each column once; every query after that is
+    bitwise arithmetic on n-bit integers, costing O(n / 30) machine words.
+    """
+
+    __slots__ = ('names', 'subjects', 'grades', 'pass_mark', 'all', '_failed', '_bands')
+
+    def __init__(self, names, subjects, failed, bands, pass_mark=PASS_MARK):
+        self.names = names
+        self.subjects = tuple(subjects)
+        self.pass_mark = pass_mark
+        self.all = (1 << len(names)) - 1
+        self._failed = failed
+        self._bands = bands
+        self.grades = tuple(bands)
+
+    @classmethod
+    def from_students(cls, students, subjects=None, pass_mark=PASS_MARK, bands=DEFAULT_BANDS):
+        """
+        Index a roster.
+
+        Args:
+            students (dict or MarksTable): {'StudentName': [marks...]}
+            subjects (sequence): Subject names for a plain dict
+            pass_mark (int): Marks below this value count as a fail
+            bands (sequence): (lower bound, grade) pairs for student averages, best first
+
+        Returns:
+            BitmapIndex
+        """
+        subjects = tuple(subjects or subjects_of(students))
+        if isinstance(students, MarksTable):
+            names = students.names
+            columns = students.columns
+        else:
+            names = list(students)
+            columns = list(zip(*students.values())) or [() for _ in subjects]
+
+        failed = {
+            subject: _bitset(_fail_flags(column, pass_mark))
+            for subject, column in zip(subjects, columns)
+        }
+
+        # One grade code per student, then one translate per band
+        lowers = [lower for lower, _ in reversed(bands)]
+        width = len(subjects)
+        codes = bytes(
+            max(bisect_right(lowers, round(total / width, 2)) - 1, 0)
+            for total in map(sum, zip(*columns))
+        )
+        band_bits = {}
+        for code, (_, grade) in enumerate(reversed(bands)):
+            flags = codes.translate(bytes(49 if value == code else 48 for value in range(256)))
+            band_bits[grade] = _bitset(flags)
+        return cls(names, subjects, failed, dict(reversed(band_bits.items())), pass_mark)
+
+    def failed(self, subject):
+        """Students below the pass mark in a subject."""
+        return self._failed[subject]
+
+    def passed(self, subject):
+        """Students at or above the pass mark in a subject."""
+        return self.all & ~self._failed[subject]
+
+    def failed_any(self):
+        """Students who failed at least one subject."""
+        bits = 0
+        for subject_bits in self._failed.values():
+            bits |= subject_bits
+        return bits
+
+    def band(self, grade):
+        """Students whose average falls in a grade band."""
+        return self._bands[grade]
+
+    def query(self, failed=(), passed=(), grades=()):
+        """
+        Students matching every condition.
+
+        Args:
+            failed (iterable): Subjects the student must have failed
+            passed (iterable): Subjects the student must have passed
+            grades (iterable): Grades, any of which the student's average may fall in
+
+        Returns:
+            int: Bitset of matching students
+        """
+        bits = self.all
+        for subject in failed:
+            bits &= self._failed[subject]
+        for subject in passed:
+            bits &= ~self._failed[subject]
+        if grades:
+            band_bits = 0
+            for grade in grades:
+                band_bits |= self._bands[grade]
+            bits &= band_bits
+        return bits
+
+    def names_of(self, bits):
+        """Names of the students in a bitset, in roster order."""
+        flags = bin(bits)[:1:-1].encode()
+        return [self.names[match.start()] for match in _SET_BIT.finditer(flags)]
+
+    @staticmethod
+    def count(bits):
+        return bin(bits).count('1')
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return f"BitmapIndex(subjects={self.subjects!r}, students={len(self)})"
@@ -0,0 +1,95 @@
+"""
+DataFrame builders shared by the Streamlit apps.
+Kept free of Streamlit calls so the tables can be built (and benchmarked)
+outside a running app.
+"""
+
+import pandas as pd
+
+from grading import DEFAULT_SCALE
+from marks_table import as_marks_table
+from ranking import AVERAGE
+from sketches import distribution_summary, subject_histograms
+
+
+def marks_dataframe(results, students):
+    """One row per student: name, a column per subject and average, for the small-class charts."""
+    table = as_marks_table(students)
+    names = list(table.names)
+    data = {'Student': names}
+    for subject, column in zip(table.subjects, table.columns):
+        data[subject] = column
+    data['Average'] = [results['student_averages'][name] for name in names]
+    return pd.DataFrame(data)
+
+
+def marks_page_dataframe(query, positions, failed=(), ranks=None):
+    """
+    The marks table for one page of students, built only for the rows shown.
+
+    Args:
+        query (ResultsQuery): Sorted indexes over the roster
+        positions (sequence): Roster positions on the page, in display order
+        failed (set): Names of students who failed a subject
+        ranks (dict): student_ranks output, to add the rank columns
+    """
+    names = [query.names[i] for i in positions]
+    data = {'Student': names}
+    for subject, column in zip(query.subjects, query.columns):
+        data[subject] = [column[i] for i in positions]
+    data['Average'] = [query.averages[i] for i in positions]
+    if ranks:
+        overall = ranks[AVERAGE]
+        data['Rank'] = [overall['competition'][i] for i in positions]
+        data['Dense Rank'] = [overall['dense'][i] for i in positions]
+        data['Percentile'] = [overall['percentile'][i] for i in positions]
+        for subject in query.subjects:
+            data[f'{subject} Rank'] = [ranks[subject]['competition'][i] for i in positions]
+    data['Status'] = ['❌ Failed' if name in failed else '✅ Passed' for name in names]
+    return pd.DataFrame(data)
+
+
+def averages_page_dataframe(query, positions, scale=DEFAULT_SCALE):
+    """Student, average and grade for one page of students."""
+    averages = [query.averages[i] for i in positions]
+    return pd.DataFrame({
+        'Student': [query.names[i] for i in positions],
+        'Average': averages,
+        'Grade': scale.grade_all(averages)
+    }, columns=['Student', 'Average', 'Grade'])
+
+
+def summary_dataframe(students, stats=None):
+    """Average, highest and lowest mark per subject (or the given cached rows)."""
+    if stats is None:
+        stats = as_marks_table(students).subject_stats()
+    return pd.DataFrame(stats)
+
+
+def distribution_dataframe(students, rows=None, scale=DEFAULT_SCALE):
+    """Quartiles and grade counts per subject (or the given cached rows)."""
+    if rows is None:
+        rows = distribution_summary(subject_histograms(students), scale.bands)
+    return pd.DataFrame(rows)
+
+
+def histogram_dataframe(histograms, width=10):
+    """Students per mark range for each subject, one row per (subject, range)."""
+    rows = [
+        {'Subject': subject, 'Marks': f"{first}-{last}", 'Students': count}
+        for subject, histogram in histograms.items()
+        for first, last, count in histogram.bins(width)
+    ]
+    return pd.DataFrame(rows, columns=['Subject', 'Marks', 'Students'])
+
+
+def box_dataframe(histograms):
+    """Lowest mark, quartiles and highest mark per subject, for precomputed box plots."""
+    rows = []
+    for subject, histogram in histograms.items():
+        q1, median, q3 = histogram.quartiles()
+        rows.append({
+            'Subject': subject, 'Min': histogram.minimum, 'Q1': q1,
+            'Median': median, 'Q3': q3, 'Max': histogram.maximum
+        })
+    return pd.DataFrame(rows, columns=['Subject', 'Min', 'Q1', 'Median', 'Q3', 'Max'])
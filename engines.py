@@ -0,0 +1,124 @@
+"""
+Analysis engine registry for Student Marks Analyzer.
+One entry point, analyze_roster, for every UI. It picks the registered
+engine best suited to the roster's size and the installed libraries:
+the pure-Python analyzer for small classes, the NumPy engine for larger
+ones, and the process-pool engine for very large rosters when NumPy is
+missing. Every engine returns lazily computed results, so callers only pay
+for the sections they read. Set engine= or the MARKS_ENGINE environment
+variable to override.
+"""
+
+import os
+
+from marks_table import PASS_MARK
+from parallel_analyzer import analyze_sharded
+from student_marks_analyzer import analyze_student_marks
+from vectorized_analyzer import analyze_student_marks_vectorized, numpy_available
+
+AUTO = 'auto'
+ENGINE_VARIABLE = 'MARKS_ENGINE'
+
+
+class Engine:
+    """A registered analysis function and the conditions for choosing it."""
+
+    __slots__ = ('name', 'analyze', 'available', 'preferred', 'min_size', 'requirement')
+
+    def __init__(self, name, analyze, available=None, min_size=0, requirement='', preferred=None):
+        self.name = name
+        self.analyze = analyze
+        self.available = available or (lambda: True)
+        self.preferred = preferred or (lambda: True)
+        self.min_size = min_size
+        self.requirement = requirement
+
+    def __repr__(self):
+        return f"Engine({self.name!r}, min_size={self.min_size})"
+
+
+# Auto mode uses the engine with the largest min_size that fits the roster;
+# registration order only breaks ties
+ENGINES = {}
+
+
+def register_engine(name, analyze, available=None, min_size=0, requirement='', preferred=None):
+    """
+    Add an engine to the registry.
+
+    Args:
+        name (str): Name used with engine= and MARKS_ENGINE
+        analyze: Function (students, subjects, pass_mark) -> results mapping
+        available: Function returning False when the engine cannot run here
+        min_size (int): Smallest roster the engine is automatically chosen for
+        requirement (str): What the engine needs, for error messages
+        preferred: Function returning False when auto mode should pass the
+                   engine over for a faster one, although it can still be
+                   chosen by name
+    """
+    ENGINES[name] = Engine(name, analyze, available, min_size, requirement, preferred)
+
+
+def available_engines():
+    """Names of the engines that can run in this environment."""
+    return [name for name, engine in ENGINES.items() if engine.available()]
+
+
+def select_engine(students, engine=None):
+    """
+    Choose the engine for a roster.
+
+    Args:
+        students (dict or MarksTable): The roster to analyze
+        engine (str): Engine name, or None/'auto' to use MARKS_ENGINE or pick by size
+
+    Returns:
+        Engine: The engine to use
+
+    Raises:
+        ValueError: If the requested engine is unknown or cannot run here
+    """
+    engine = engine or os.environ.get(ENGINE_VARIABLE) or AUTO
+    if engine != AUTO:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'; choose from {', '.join([AUTO, *ENGINES])}")
+        chosen = ENGINES[engine]
+        if not chosen.available():
+            raise ValueError(f"Engine '{engine}' is not available here (requires {chosen.requirement})")
+        return chosen
+
+    size = len(students)
+    candidates = [
+        candidate for candidate in ENGINES.values()
+        if size >= candidate.min_size and candidate.available() and candidate.preferred()
+    ]
+    if not candidates:
+        raise ValueError("No analysis engine is available")
+    # max() keeps the first of equal thresholds
+    return max(candidates, key=lambda candidate: candidate.min_size)
+
+
+def analyze_roster(students, subjects=None, pass_mark=PASS_MARK, engine=None):
+    """
+    Analyze a roster with the most suitable engine.
+
+    Args:
+        students (dict or MarksTable): {'StudentName': [marks...]}
+        subjects (sequence): Subject names for a plain dict
+        pass_mark (int): Marks below this value count as a fail
+        engine (str): 'python', 'vectorized', 'sharded', or None/'auto'
+
+    Returns:
+        Mapping: The results of analyze_student_marks, whichever engine ran
+    """
+    return select_engine(students, engine).analyze(students, subjects, pass_mark)
+
+
+register_engine('vectorized', analyze_student_marks_vectorized, lambda: numpy_available(),
+                min_size=100, requirement='NumPy')
+# Splitting and pickling the shards alone takes the parent about as long as the
+# vectorized engine's whole analysis, so with NumPy installed sharding never pays
+register_engine('sharded', analyze_sharded, lambda: (os.cpu_count() or 1) > 1,
+                min_size=200_000, requirement='more than one CPU',
+                preferred=lambda: not numpy_available())
+register_engine('python', analyze_student_marks)
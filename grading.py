@@ -0,0 +1,106 @@
+"""
+Grade bands for Student Marks Analyzer.
+A GradeScale is a table of (lower bound, grade) bands that each school can
+set for itself. Averages are graded by binary search over the bounds, and a
+whole column of averages is graded or counted with one searchsorted call
+when NumPy is installed, instead of an if/elif ladder per student.
+"""
+
+from bisect import bisect_right
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; bulk grading then uses bisect per value
+    np = None
+
+# Lower bound of each grade, best grade first
+DEFAULT_BANDS = ((90, 'A+'), (80, 'A'), (70, 'B'), (60, 'C'), (50, 'D'), (0, 'F'))
+
+
+class GradeScale:
+    """
+    Grade bands, e.g. ((90, 'A+'), (80, 'A'), ..., (0, 'F')).
+
+    An average gets the grade of the highest lower bound it reaches; anything
+    below the lowest bound gets the lowest grade.
+    """
+
+    __slots__ = ('bands', '_lowers', '_grades')
+
+    def __init__(self, bands=DEFAULT_BANDS):
+        bands = tuple(sorted(((lower, grade) for lower, grade in bands), key=lambda band: band[0], reverse=True))
+        if not bands:
+            raise ValueError("A grade scale needs at least one band")
+        lowers = [lower for lower, _ in bands]
+        if len(set(lowers)) != len(lowers):
+            raise ValueError("Grade bands must have distinct lower bounds")
+        self.bands = bands
+        # Ascending bounds for bisect/searchsorted, with grades in the same order
+        self._lowers = lowers[::-1]
+        self._grades = [grade for _, grade in reversed(bands)]
+
+    @classmethod
+    def parse(cls, text):
+        """
+        Build a scale from text such as "A+=90, A=80, B=70, C=60, D=50, F=0".
+
+        Raises:
+            ValueError: If an entry is not GRADE=NUMBER
+        """
+        bands = []
+        for entry in text.split(','):
+            if not entry.strip():
+                continue
+            grade, separator, lower = entry.partition('=')
+            if not separator or not grade.strip():
+                raise ValueError(f"Expected GRADE=LOWER_BOUND, got '{entry.strip()}'")
+            bands.append((float(lower), grade.strip()))
+        return cls(bands)
+
+    def __str__(self):
+        return ", ".join(f"{grade}={lower:g}" for lower, grade in self.bands)
+
+    def __eq__(self, other):
+        return isinstance(other, GradeScale) and self.bands == other.bands
+
+    def __hash__(self):
+        return hash(self.bands)
+
+    @property
+    def grades(self):
+        """Grade names, best first."""
+        return tuple(grade for _, grade in self.bands)
+
+    def grade(self, average):
+        """Grade for a single average."""
+        return self._grades[max(bisect_right(self._lowers, average) - 1, 0)]
+
+    def _codes(self, averages):
+        """Band index (0 = lowest grade) for every average, as a NumPy array."""
+        if not isinstance(averages, np.ndarray):
+            averages = np.fromiter(averages, dtype=np.float64)
+        codes = np.searchsorted(self._lowers, averages, side='right') - 1
+        return np.maximum(codes, 0)
+
+    def grade_all(self, averages):
+        """Grades for a whole column of averages."""
+        if np is None:
+            return [self.grade(average) for average in averages]
+        return np.asarray(self._grades, dtype=object)[self._codes(averages)].tolist()
+
+    def counts(self, averages):
+        """Number of averages in each band, best grade first."""
+        if np is None:
+            found = Counter(self.grade(average) for average in averages)
+            return {grade: found[grade] for grade in self.grades}
+        totals = np.bincount(self._codes(averages), minlength=len(self._grades))
+        return {grade: int(totals[i]) for i, grade in reversed(list(enumerate(self._grades)))}
+
+
+DEFAULT_SCALE = GradeScale()
+
+
+def get_grade(average, scale=DEFAULT_SCALE):
+    """Convert average to grade"""
+    return scale.grade(average)
@@ -0,0 +1,75 @@
+"""
+Group-by analysis for Student Marks Analyzer.
+Computes the usual metrics for every section, grade or school in one pass
+over the roster: each student is folded into a RunningAnalysis per group,
+found by hashing their group key, instead of slicing the roster and
+re-running the analyzer once per group.
+"""
+
+from marks_table import PASS_MARK, subjects_of
+from streaming_analyzer import RunningAnalysis
+
+
+def _key_function(group_of):
+    """Accept a {name: key} mapping or a function of the student name."""
+    if callable(group_of):
+        return group_of
+
+    def lookup(name):
+        try:
+            return group_of[name]
+        except KeyError:
+            raise KeyError(f"No group given for student '{name}'") from None
+    return lookup
+
+
+def analyze_group_levels(students, levels, subjects=None, pass_mark=PASS_MARK):
+    """
+    Analyze every group at several levels (e.g. section, grade, school) in one pass.
+
+    Args:
+        students (dict or MarksTable): {'StudentName': [marks...]}
+        levels (dict): {level name: group_of}, where group_of is a {name: key}
+                       mapping or a function taking the student name
+        subjects (sequence): Subject names for a plain dict
+        pass_mark (int): Lowest passing mark
+
+    Returns:
+        dict: {level name: {group key: summary}}, groups in order of first
+              appearance; each summary has the keys of RunningAnalysis.summary
+    """
+    subjects = subjects or subjects_of(students)
+    key_functions = [(level, _key_function(group_of)) for level, group_of in levels.items()]
+    accumulators = {level: {} for level in levels}
+
+    for name, marks in students.items():
+        for level, key_of in key_functions:
+            groups = accumulators[level]
+            key = key_of(name)
+            analysis = groups.get(key)
+            if analysis is None:
+                analysis = groups[key] = RunningAnalysis(subjects, pass_mark)
+            analysis.add(name, marks)
+
+    return {
+        level: {key: analysis.summary() for key, analysis in groups.items()}
+        for level, groups in accumulators.items()
+    }
+
+
+def analyze_groups(students, group_of, subjects=None, pass_mark=PASS_MARK):
+    """
+    Analyze every group of students in one pass.
+
+    Args:
+        students (dict or MarksTable): {'StudentName': [marks...]}
+        group_of: {name: key} mapping or a function taking the student name
+        subjects (sequence): Subject names for a plain dict
+        pass_mark (int): Lowest passing mark
+
+    Returns:
+        dict: {group key: summary}; each summary has student_count,
+              failed_students, class_topper, top_average, class_average,
+              subject_toppers and subject_averages
+    """
+    return analyze_group_levels(students, {None: group_of}, subjects, pass_mark)[None]
@@ -0,0 +1,127 @@
+"""
+Import-time budget check for Student Marks Analyzer.
+Imports each Streamlit app in a fresh interpreter with `python -X importtime`,
+reports what every module it pulls in costs, and fails if an app takes longer
+than the budget or loads a heavy module that should wait until it is used.
+
+Usage:
+    python import_budget.py                          # every app, default budget
+    python import_budget.py streamlit_app --budget 800 --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 1500
+
+# Modules each app must not load at startup; they are imported where first used.
+# The standalone apps render tables on their first page, so they may load pandas
+# (which brings pyarrow with it when installed).
+SERVICES = ('plotly.express', 'mysql', 'requests', 'dotenv')
+DEFERRED = {
+    'streamlit_app': ('pandas', 'pyarrow', *SERVICES),
+    'streamlit_standalone': SERVICES,
+    'simple_streamlit': SERVICES,
+}
+
+
+def import_times(module, python=sys.executable):
+    """
+    Import a module in a new interpreter and read its -X importtime report.
+
+    Returns:
+        list: (module name, self ms, cumulative ms, nesting depth) in import order
+
+    Raises:
+        RuntimeError: If the module fails to import
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    process = subprocess.run(
+        [python, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=directory, capture_output=True, text=True
+    )
+    if process.returncode:
+        raise RuntimeError(f"import {module} failed:\n{process.stderr.strip().splitlines()[-1]}")
+    return parse_importtime(process.stderr)
+
+
+def parse_importtime(report):
+    """Parse `import time: self [us] | cumulative | imported package` lines."""
+    entries = []
+    for line in report.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(fields[0]) / 1000, int(fields[1]) / 1000, depth))
+    return entries
+
+
+def subtree(entries, module):
+    """The report lines for a module and everything it imported, without interpreter startup."""
+    end = next(i for i, entry in enumerate(entries) if entry[0] == module and entry[3] == 0)
+    start = end
+    while start and entries[start - 1][3] > 0:
+        start -= 1
+    return entries[start:end + 1]
+
+
+def loaded(entries, modules):
+    """Which of the given modules (or any of their submodules) were imported."""
+    names = {name for name, _, _, _ in entries}
+    return [
+        module for module in modules
+        if module in names or any(name.startswith(module + '.') for name in names)
+    ]
+
+
+def check(module, budget_ms=DEFAULT_BUDGET_MS, deferred=(), top=10):
+    """
+    Print one app's import report.
+
+    Returns:
+        list: Problems found (empty when the app is within budget)
+    """
+    entries = subtree(import_times(module), module)
+    total = entries[-1][2]
+    print(f"\n{module}: {total:.0f} ms (budget {budget_ms} ms)")
+
+    # The app's own imports, most expensive first
+    direct = [entry for entry in entries if entry[3] == 1]
+    for name, _, cumulative, _ in sorted(direct, key=lambda entry: entry[2], reverse=True)[:top]:
+        print(f"  {cumulative:8.1f} ms  {name}")
+
+    problems = []
+    if total > budget_ms:
+        problems.append(f"{module} takes {total:.0f} ms to import, over the {budget_ms} ms budget")
+    for name in loaded(entries, deferred):
+        problems.append(f"{module} imports {name} at startup")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report and check the import time of the Streamlit apps")
+    parser.add_argument('modules', nargs='*', default=list(DEFERRED), help="app modules to check (default: all)")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS, help="most milliseconds an import may take")
+    parser.add_argument('--top', type=int, default=10, help="number of imports to list per app")
+    args = parser.parse_args()
+
+    problems = []
+    for module in args.modules:
+        problems += check(module, args.budget, DEFERRED.get(module, ()), args.top)
+
+    if problems:
+        print("\nFAILED:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print("\nAll imports within budget")
+
+
+if __name__ == "__main__":
+    main()
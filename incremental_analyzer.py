@@ -0,0 +1,249 @@
+"""
+Incremental analyzer for Student Marks Analyzer.
+Keeps running sums, per-subject max-heaps and the failed set up to date as
+single students are added, updated or removed, so live mark entry does not
+re-analyze the whole roster on every change.
+"""
+
+import heapq
+from itertools import count
+
+from marks_table import DEFAULT_SUBJECTS, PASS_MARK
+
+
+class _MaxTracker:
+    """
+    Max-heap of (score, roster position, name) with lazy deletion.
+
+    Stale entries are skipped when the top is read, so push and top are both
+    O(log n) amortized. Ties go to the earliest roster position, matching the
+    first-wins rule of analyze_student_marks.
+    """
+
+    def __init__(self):
+        self._heap = []
+
+    def push(self, score, position, name):
+        heapq.heappush(self._heap, (-score, position, name))
+
+    def top(self, is_current):
+        """Return (name, score) of the best live entry, or ('', 0) if empty."""
+        heap = self._heap
+        while heap:
+            neg_score, position, name = heap[0]
+            if is_current(name, position, -neg_score):
+                return name, -neg_score
+            heapq.heappop(heap)
+        return '', 0
+
+    def compact(self, live_entries):
+        """Rebuild the heap from live entries only."""
+        self._heap = [(-score, position, name) for score, position, name in live_entries]
+        heapq.heapify(self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class IncrementalAnalyzer:
+    """
+    Analysis results that are updated one student at a time.
+
+    add, update and remove each cost O(k log n) for k subjects; reading the
+    toppers is O(log n) amortized. results() returns the same dictionary as
+    analyze_student_marks for the current roster.
+    """
+
+    def __init__(self, subjects=DEFAULT_SUBJECTS, pass_mark=PASS_MARK):
+        self.subjects = tuple(subjects)
+        self.pass_mark = pass_mark
+        self._marks = {}
+        self._averages = {}
+        self._positions = {}
+        self._next_position = count()
+        self._failed = set()
+        self._subject_totals = [0] * len(self.subjects)
+        self._average_total = 0
+        self._average_heap = _MaxTracker()
+        self._subject_heaps = [_MaxTracker() for _ in self.subjects]
+
+    @classmethod
+    def from_students(cls, students, subjects=None, pass_mark=PASS_MARK):
+        """Build an analyzer pre-loaded with a students dict or MarksTable."""
+        analyzer = cls(subjects or getattr(students, 'subjects', DEFAULT_SUBJECTS), pass_mark)
+        for name, marks in students.items():
+            analyzer.add(name, marks)
+        return analyzer
+
+    def __contains__(self, name):
+        return name in self._marks
+
+    def __len__(self):
+        return len(self._marks)
+
+    def _check(self, name, marks):
+        if len(marks) != len(self.subjects):
+            raise ValueError(f"{name} has {len(marks)} marks, expected {len(self.subjects)}")
+
+    def _insert(self, name, marks, position):
+        marks = list(marks)
+        average = sum(marks) / len(marks)
+        self._marks[name] = marks
+        self._averages[name] = average
+        self._positions[name] = position
+
+        if min(marks) < self.pass_mark:
+            self._failed.add(name)
+        else:
+            self._failed.discard(name)
+
+        self._average_total += average
+        self._average_heap.push(average, position, name)
+        for i, mark in enumerate(marks):
+            self._subject_totals[i] += mark
+            self._subject_heaps[i].push(mark, position, name)
+
+    def _retract(self, name):
+        marks = self._marks[name]
+        self._average_total -= self._averages[name]
+        for i, mark in enumerate(marks):
+            self._subject_totals[i] -= mark
+
+    def add(self, name, marks):
+        """Add a new student at the end of the roster."""
+        if name in self._marks:
+            raise KeyError(f"Student '{name}' already exists")
+        self._check(name, marks)
+        self._insert(name, marks, next(self._next_position))
+        self._maybe_compact()
+
+    def update(self, name, marks):
+        """Replace a student's marks, keeping their place in the roster."""
+        self._check(name, marks)
+        self._retract(name)
+        self._insert(name, marks, self._positions[name])
+        self._maybe_compact()
+
+    def remove(self, name):
+        """Remove a student; their heap entries become stale and are skipped."""
+        self._retract(name)
+        del self._marks[name]
+        del self._averages[name]
+        del self._positions[name]
+        self._failed.discard(name)
+        self._maybe_compact()
+
+    def set(self, name, marks):
+        """Add the student, or update them if they are already present."""
+        if name in self._marks:
+            if list(marks) != self._marks[name]:
+                self.update(name, marks)
+        else:
+            self.add(name, marks)
+
+    def sync(self, students):
+        """
+        Bring the analyzer in line with a students dict, touching only the
+        students that were added, changed or removed since the last sync.
+
+        New students are added at the end; if that leaves the roster in a
+        different order from the dict (a student inserted or renamed in the
+        middle), the roster is reordered so ties still go to the student who
+        comes first in the dict.
+        """
+        for name in [name for name in self._marks if name not in students]:
+            self.remove(name)
+        for name, marks in students.items():
+            self.set(name, marks)
+        if list(self._marks) != list(students):
+            self.reorder(students)
+        return self
+
+    def reorder(self, names):
+        """
+        Put the roster in the given order, which decides ties from now on.
+
+        Costs O(n k), as every heap is rebuilt with the new positions.
+
+        Args:
+            names (iterable): Every current student's name, each exactly once
+
+        Raises:
+            ValueError: If names is not an ordering of the current roster
+        """
+        names = list(names)
+        if len(names) != len(self._marks) or set(names) != self._marks.keys():
+            raise ValueError("New order must list every student on the roster exactly once")
+        self._marks = {name: self._marks[name] for name in names}
+        self._averages = {name: self._averages[name] for name in names}
+        self._positions = {name: position for position, name in enumerate(names)}
+        self._next_position = count(len(names))
+        self._compact()
+
+    def _maybe_compact(self):
+        # Stale entries pile up on every update; rebuild once they dominate
+        limit = 2 * len(self._marks) + 64
+        if len(self._average_heap) > limit:
+            self._compact()
+
+    def _compact(self):
+        self._average_heap.compact(
+            (self._averages[name], self._positions[name], name) for name in self._marks
+        )
+        for i, tracker in enumerate(self._subject_heaps):
+            tracker.compact(
+                (marks[i], self._positions[name], name) for name, marks in self._marks.items()
+            )
+
+    def _is_current_average(self, name, position, score):
+        return self._positions.get(name) == position and self._averages[name] == score
+
+    def _subject_checker(self, i):
+        def is_current(name, position, score):
+            return self._positions.get(name) == position and self._marks[name][i] == score
+        return is_current
+
+    @property
+    def class_topper(self):
+        name, score = self._average_heap.top(self._is_current_average)
+        return name if score > 0 else ''
+
+    @property
+    def subject_toppers(self):
+        toppers = {}
+        for i, subject in enumerate(self.subjects):
+            name, score = self._subject_heaps[i].top(self._subject_checker(i))
+            toppers[subject] = name if score > 0 else ''
+        return toppers
+
+    @property
+    def failed_students(self):
+        """Failed students in roster order."""
+        return sorted(self._failed, key=self._positions.__getitem__)
+
+    @property
+    def failed_count(self):
+        return len(self._failed)
+
+    @property
+    def class_average(self):
+        return round(self._average_total / len(self._marks), 2) if self._marks else 0
+
+    def subject_average(self, subject):
+        i = self.subjects.index(subject)
+        return self._subject_totals[i] / len(self._marks) if self._marks else 0
+
+    def results(self):
+        """Return the full results dictionary for the current roster."""
+        # Updates keep a student's dict slot, so dict order is roster order
+        names = list(self._marks)
+        return {
+            'all_students': [
+                {'name': name, 'marks': dict(zip(self.subjects, self._marks[name]))}
+                for name in names
+            ],
+            'failed_students': self.failed_students,
+            'student_averages': {name: round(self._averages[name], 2) for name in names},
+            'class_topper': self.class_topper,
+            'subject_toppers': self.subject_toppers
+        }
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+from grading import DEFAULT_SCALE
 
 st.set_page_config(
     page_title="Student Marks Analyzer",
@@ -127,20 +128,8 @@ with col2:
 st.subheader("📈 All Student Averages")
 
 avg_data = []
-for name, avg in student_averages.items():
-    if avg >= 90:
-        grade = "A+"
-    elif avg >= 80:
-        grade = "A"
-    elif avg >= 70:
-        grade = "B"
-    elif avg >= 60:
-        grade = "C"
-    elif avg >= 50:
-        grade = "D"
-    else:
-        grade = "F"
-    
+grades = DEFAULT_SCALE.grade_all(student_averages.values())
+for (name, avg), grade in zip(student_averages.items(), grades):
     avg_data.append({
         'Student': name,
         'Average': avg,
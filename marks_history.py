@@ -0,0 +1,209 @@
+"""
+Multi-term marks history for Student Marks Analyzer.
+Each term is stored as the changes from the term before it: the first term's
+full roster, then only the students whose marks changed, joined or left.
+A per-student timeline points at those changes, so a student's trend is read
+from their own entries, and per-term headline results are recorded as each
+term is added by moving an IncrementalAnalyzer forward over the changes.
+"""
+
+from incremental_analyzer import IncrementalAnalyzer
+from marks_table import DEFAULT_SUBJECTS, PASS_MARK
+
+
+class TermDelta:
+    """
+    Changes in one term: new or changed marks, and students who left.
+
+    order is the term's full roster order, stored only when it is not the
+    previous order with new students appended (None otherwise).
+    """
+
+    __slots__ = ('label', 'changed', 'removed', 'order')
+
+    def __init__(self, label, changed, removed=(), order=None):
+        self.label = label
+        self.changed = changed
+        self.removed = tuple(removed)
+        self.order = tuple(order) if order is not None else None
+
+    def __repr__(self):
+        return f"TermDelta({self.label!r}, changed={len(self.changed)}, removed={len(self.removed)})"
+
+
+class MarksHistory:
+    """
+    Successive snapshots of a roster, stored as base plus deltas.
+
+    Adding a term costs O(n) to find what changed, plus O(c k log n) for the
+    c changed students. Reading one student's history costs O(terms), and
+    reading the per-term summaries costs nothing extra.
+    """
+
+    def __init__(self, subjects=DEFAULT_SUBJECTS, pass_mark=PASS_MARK):
+        self.subjects = tuple(subjects)
+        self.pass_mark = pass_mark
+        self._deltas = []
+        self._labels = {}
+        self._summaries = []
+        self._timeline = {}
+        self._latest = {}
+        self._analyzer = IncrementalAnalyzer(self.subjects, pass_mark)
+
+    @property
+    def terms(self):
+        """Term labels, oldest first."""
+        return [delta.label for delta in self._deltas]
+
+    def __len__(self):
+        return len(self._deltas)
+
+    def _term_index(self, label):
+        try:
+            return self._labels[label]
+        except KeyError:
+            raise KeyError(f"Unknown term '{label}'") from None
+
+    def add_term(self, label, students):
+        """
+        Record a full snapshot of the roster for a new term.
+
+        Only the students that differ from the previous term are stored.
+
+        Args:
+            label: Term name, e.g. '2025 Term 1'
+            students (dict or MarksTable): {'StudentName': [marks...]}
+
+        Returns:
+            TermDelta: What changed since the previous term
+        """
+        latest = self._latest
+        changed = {}
+        for name, marks in students.items():
+            marks = tuple(marks)
+            if latest.get(name) != marks:
+                changed[name] = marks
+        removed = [name for name in latest if name not in students]
+
+        # Ties go to whoever comes first, so keep the term's order when a
+        # student joined anywhere but the end
+        kept = [name for name in latest if name in students]
+        joined = [name for name in changed if name not in latest]
+        order = list(students)
+        return self.add_changes(label, changed, removed, None if order == kept + joined else order)
+
+    def add_changes(self, label, changed=None, removed=(), order=None):
+        """
+        Record a new term given only what changed since the previous one.
+
+        Args:
+            label: Term name
+            changed (dict): {'StudentName': [marks...]} for new or changed students
+            removed (iterable): Names of students who left
+            order (iterable): Every name on the new roster, in roster order;
+                              by default new students are added at the end
+
+        Returns:
+            TermDelta: The stored changes
+        """
+        if label in self._labels:
+            raise ValueError(f"Term '{label}' already exists")
+        changed = {name: tuple(marks) for name, marks in (changed or {}).items()}
+        for name, marks in changed.items():
+            if len(marks) != len(self.subjects):
+                raise ValueError(f"{name} has {len(marks)} marks, expected {len(self.subjects)}")
+        for name in removed:
+            if name not in self._latest:
+                raise KeyError(f"Student '{name}' is not on the roster")
+
+        if order is not None:
+            order = list(order)
+            roster = (self._latest.keys() - set(removed)) | changed.keys()
+            if len(order) != len(roster) or set(order) != roster:
+                raise ValueError("Term order must list every student on the roster exactly once")
+
+        term = len(self._deltas)
+        delta = TermDelta(label, changed, removed, order)
+        analyzer = self._analyzer
+        for name in delta.removed:
+            analyzer.remove(name)
+            del self._latest[name]
+            self._timeline[name].append((term, None))
+        for name, marks in changed.items():
+            analyzer.set(name, marks)
+            self._latest[name] = marks
+            self._timeline.setdefault(name, []).append((term, marks))
+        if delta.order is not None:
+            analyzer.reorder(delta.order)
+            self._latest = {name: self._latest[name] for name in delta.order}
+
+        self._deltas.append(delta)
+        self._labels[label] = term
+        self._summaries.append({
+            'term': label,
+            'student_count': len(analyzer),
+            'class_average': analyzer.class_average,
+            'class_topper': analyzer.class_topper,
+            'subject_toppers': analyzer.subject_toppers,
+            'failed_count': analyzer.failed_count
+        })
+        return delta
+
+    def delta(self, label):
+        """Return the changes stored for a term."""
+        return self._deltas[self._term_index(label)]
+
+    def term_summary(self, label):
+        """Headline results for a term: counts, class average and toppers."""
+        return self._summaries[self._term_index(label)]
+
+    def class_toppers(self):
+        """
+        Class topper of every term.
+
+        Returns:
+            list: (term label, topper name) pairs, oldest first
+        """
+        return [(summary['term'], summary['class_topper']) for summary in self._summaries]
+
+    def student_marks(self, name):
+        """
+        One student's marks in every term.
+
+        Returns:
+            list: (term label, marks tuple or None if not enrolled) pairs
+        """
+        entries = self._timeline.get(name, ())
+        history = []
+        marks = None
+        j = 0
+        for term, delta in enumerate(self._deltas):
+            while j < len(entries) and entries[j][0] == term:
+                marks = entries[j][1]
+                j += 1
+            history.append((delta.label, marks))
+        return history
+
+    def student_averages(self, name):
+        """
+        One student's average in every term.
+
+        Returns:
+            list: (term label, average rounded to 2 places, or None) pairs
+        """
+        return [
+            (label, round(sum(marks) / len(marks), 2) if marks is not None else None)
+            for label, marks in self.student_marks(name)
+        ]
+
+    def snapshot(self, label):
+        """Rebuild the full {'StudentName': [marks...]} roster of a term."""
+        students = {}
+        for delta in self._deltas[:self._term_index(label) + 1]:
+            for name in delta.removed:
+                del students[name]
+            for name, marks in delta.changed.items():
+                students[name] = list(marks)
+            if delta.order is not None:
+                students = {name: students[name] for name in delta.order}
+        return students
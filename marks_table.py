@@ -0,0 +1,301 @@
+"""
+Columnar marks table for Student Marks Analyzer.
+Stores one contiguous column of marks per subject and carries the subject
+names with the data, so rosters are not limited to Math, Science and English.
+"""
+
+from array import array
+from collections.abc import Mapping, Sequence
+
+DEFAULT_SUBJECTS = ('Math', 'Science', 'English')
+PASS_MARK = 40
+
+
+def _to_column(values):
+    """Pack marks into a typed array, using floats only when needed."""
+    try:
+        return array('i', values)
+    except TypeError:
+        return array('d', values)
+
+
+class MarksTable(Mapping):
+    """
+    Roster of students with one marks column per subject.
+
+    Behaves like the usual {'StudentName': [marks...]} dictionary, so it can be
+    passed anywhere a students dict is accepted, while per-subject statistics
+    read a single column instead of indexing into every student's list.
+    """
+
+    __slots__ = ('subjects', 'names', 'columns', '_index')
+
+    def __init__(self, subjects, names=(), columns=None):
+        self.subjects = tuple(subjects)
+        self.names = list(names)
+        if columns is None:
+            columns = [[] for _ in self.subjects]
+        self.columns = [col if isinstance(col, array) else _to_column(col) for col in columns]
+        self._index = None
+
+        if len(self.columns) != len(self.subjects):
+            raise ValueError(f"Expected {len(self.subjects)} columns, got {len(self.columns)}")
+        for subject, column in zip(self.subjects, self.columns):
+            if len(column) != len(self.names):
+                raise ValueError(f"Column '{subject}' has {len(column)} marks for {len(self.names)} students")
+
+    @classmethod
+    def from_rows(cls, rows, subjects=DEFAULT_SUBJECTS):
+        """Build a table from (name, marks) pairs."""
+        names = []
+        columns = [[] for _ in subjects]
+        for name, marks in rows:
+            if len(marks) != len(subjects):
+                raise ValueError(f"{name} has {len(marks)} marks, expected {len(subjects)}")
+            names.append(name)
+            for column, mark in zip(columns, marks):
+                column.append(mark)
+        return cls(subjects, names, columns)
+
+    @classmethod
+    def from_dict(cls, students, subjects=DEFAULT_SUBJECTS):
+        """Build a table from a {'StudentName': [marks...]} dictionary."""
+        return cls.from_rows(students.items(), subjects)
+
+    def column(self, subject):
+        """Return the marks column for a subject."""
+        return self.columns[self.subjects.index(subject)]
+
+    def rows(self):
+        """Iterate over each student's marks as a list, in roster order."""
+        return map(list, zip(*self.columns))
+
+    def items(self):
+        return zip(self.names, self.rows())
+
+    def to_dict(self):
+        """Return the roster as a plain {'StudentName': [marks...]} dictionary."""
+        return dict(self.items())
+
+    def subject_stats(self):
+        """
+        Average, highest and lowest mark for every subject.
+
+        Returns:
+            list: One {'Subject', 'Average', 'Highest', 'Lowest'} dict per subject
+        """
+        stats = []
+        for subject, column in zip(self.subjects, self.columns):
+            if not column:
+                continue
+            stats.append({
+                'Subject': subject,
+                'Average': sum(column) / len(column),
+                'Highest': max(column),
+                'Lowest': min(column)
+            })
+        return stats
+
+    def __getitem__(self, name):
+        if self._index is None:
+            self._index = {student: i for i, student in enumerate(self.names)}
+        i = self._index[name]
+        return [column[i] for column in self.columns]
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return f"MarksTable(subjects={self.subjects!r}, students={len(self)})"
+
+
+class PackedNames(Sequence):
+    """
+    Student names stored as one UTF-8 blob plus a uint32 offsets table.
+
+    Costs a few bytes per name instead of a full str object each; names are
+    decoded when they are read.
+    """
+
+    __slots__ = ('_blob', '_offsets')
+
+    def __init__(self, blob=b'', offsets=None):
+        self._blob = blob
+        self._offsets = array('I', [0]) if offsets is None else offsets
+
+    @classmethod
+    def from_names(cls, names):
+        blob = bytearray()
+        offsets = array('I', [0])
+        for name in names:
+            blob += name.encode('utf-8')
+            offsets.append(len(blob))
+        return cls(bytes(blob), offsets)
+
+    @property
+    def blob(self):
+        return self._blob
+
+    @property
+    def offsets(self):
+        return self._offsets
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("name index out of range")
+        return str(self._blob[self._offsets[i]:self._offsets[i + 1]], 'utf-8')
+
+    def __iter__(self):
+        blob = self._blob
+        offsets = self._offsets
+        for i in range(len(offsets) - 1):
+            yield str(blob[offsets[i]:offsets[i + 1]], 'utf-8')
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __eq__(self, other):
+        if isinstance(other, PackedNames):
+            return list(self) == list(other)
+        return list(self) == other
+
+    def __reduce__(self):
+        return (self.__class__, (bytes(self._blob), array('I', self._offsets)))
+
+
+class StudentRecord:
+    """One student's row in a StudentTable: a name and a view of their marks."""
+
+    __slots__ = ('name', 'marks')
+
+    def __init__(self, name, marks):
+        self.name = name
+        self.marks = marks
+
+    @property
+    def average(self):
+        return sum(self.marks) / len(self.marks)
+
+    def __repr__(self):
+        return f"StudentRecord({self.name!r}, {list(self.marks)!r})"
+
+
+class StudentTable(MarksTable):
+    """
+    Compact roster: packed names plus one row-major uint8 marks buffer.
+
+    Each student costs one byte per subject plus their UTF-8 name and a
+    4-byte offset, instead of a str object and a list of int objects. Any
+    buffer of n_students * n_subjects bytes can back the table (an
+    array('B'), bytes, or a memory-mapped file) and it is used without
+    copying. Columns are strided views into the same buffer.
+    """
+
+    __slots__ = ('_buffer', '_marks', '_width')
+
+    def __init__(self, subjects, names=(), marks=None):
+        self.subjects = tuple(subjects)
+        self.names = names if isinstance(names, PackedNames) else PackedNames.from_names(names)
+        self._index = None
+        self._width = len(self.subjects)
+        self._buffer = array('B') if marks is None else marks
+        self._marks = memoryview(self._buffer).cast('B')
+
+        if len(self._marks) != len(self.names) * self._width:
+            raise ValueError(f"Expected {len(self.names) * self._width} marks, got {len(self._marks)}")
+
+    @classmethod
+    def from_rows(cls, rows, subjects=DEFAULT_SUBJECTS):
+        """Pack (name, marks) pairs; every mark must be a whole number from 0 to 100."""
+        width = len(subjects)
+        blob = bytearray()
+        offsets = array('I', [0])
+        marks = array('B')
+        for name, row in rows:
+            if len(row) != width:
+                raise ValueError(f"{name} has {len(row)} marks, expected {width}")
+            try:
+                marks.extend(row)
+            except (TypeError, OverflowError):
+                raise ValueError(f"{name} has marks outside whole numbers 0-100: {list(row)}") from None
+            blob += name.encode('utf-8')
+            offsets.append(len(blob))
+        names = PackedNames(bytes(blob), offsets)
+        if marks and max(marks) > 100:
+            raise ValueError("Marks must be between 0 and 100")
+        return cls(subjects, names, marks)
+
+    @classmethod
+    def from_table(cls, table):
+        """Pack any students dict or MarksTable into a StudentTable."""
+        if isinstance(table, StudentTable):
+            return table
+        return cls.from_rows(table.items(), subjects_of(table))
+
+    @property
+    def buffer(self):
+        """The row-major marks as a flat uint8 memoryview."""
+        return self._marks
+
+    @property
+    def columns(self):
+        width = self._width
+        return [self._marks[j::width] for j in range(width)]
+
+    def column(self, subject):
+        return self._marks[self.subjects.index(subject)::self._width]
+
+    def row(self, i):
+        """Marks of the i-th student as a memoryview, without copying."""
+        start = i * self._width
+        return self._marks[start:start + self._width]
+
+    def rows(self):
+        return (self.row(i).tolist() for i in range(len(self.names)))
+
+    def records(self):
+        """Iterate over StudentRecord views of each row."""
+        return (StudentRecord(name, self.row(i)) for i, name in enumerate(self.names))
+
+    def __getitem__(self, name):
+        if self._index is None:
+            self._index = {student: i for i, student in enumerate(self.names)}
+        return self.row(self._index[name]).tolist()
+
+    def __reduce__(self):
+        # memoryviews cannot be pickled; ship the raw bytes instead
+        return (self.__class__, (self.subjects, self.names, array('B', self._marks)))
+
+    def __repr__(self):
+        return f"StudentTable(subjects={self.subjects!r}, students={len(self)})"
+
+
+def as_marks_table(students, subjects=None):
+    """Return students as a MarksTable, converting a plain dict if needed."""
+    if isinstance(students, MarksTable):
+        return students
+    return MarksTable.from_dict(students, subjects or DEFAULT_SUBJECTS)
+
+
+def subjects_of(students):
+    """Subject names for a roster: the table's own, or the default three."""
+    return getattr(students, 'subjects', DEFAULT_SUBJECTS)
+
+
+def roster_subjects(columns, name_column='Name'):
+    """
+    Subject columns of an uploaded roster: every column except the names.
+
+    CSV, Excel and Parquet uploads all use this rule, and every subject must
+    hold marks, so an extra column such as a roll number is rejected with its
+    name rather than analysed or silently dropped. Pass the subjects
+    explicitly to leave such a column out.
+    """
+    return [column for column in columns if column != name_column]
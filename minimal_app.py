@@ -1,4 +1,5 @@
 import streamlit as st
+from grading import DEFAULT_SCALE
 
 st.title("📊 Student Marks Analyzer")
 
@@ -45,6 +46,6 @@ st.write(f"**Science**: {science_topper}")
 st.write(f"**English**: {english_topper}")
 
 st.write("### All Averages (Sorted):")
-for name, avg in sorted(averages.items(), key=lambda x: x[1], reverse=True):
-    grade = "A+" if avg >= 90 else "A" if avg >= 80 else "B" if avg >= 70 else "C" if avg >= 60 else "D" if avg >= 50 else "F"
+ranked = sorted(averages.items(), key=lambda x: x[1], reverse=True)
+for (name, avg), grade in zip(ranked, DEFAULT_SCALE.grade_all([avg for _, avg in ranked])):
     st.write(f"**{name}**: {avg}% (Grade: {grade})")
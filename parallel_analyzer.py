@@ -0,0 +1,101 @@
+"""
+Sharded analysis for Student Marks Analyzer.
+Splits a roster into shards that are analyzed in a process pool. Each worker
+returns a mergeable RunningAnalysis (counts, sums, local toppers with their
+scores and failed names) and its shard's finished student averages. The
+partials are reduced in roster order into LazyResults, so the parent does not
+rebuild per-student rows unless 'all_students' is read.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from marks_table import PASS_MARK, subjects_of
+from streaming_analyzer import RunningAnalysis
+from student_marks_analyzer import LazyResults
+
+
+def _analyze_shard(shard):
+    """Worker: analyze one shard and return its partial result and 'student_averages'."""
+    subjects, pass_mark, names, rows, per_student = shard
+    partial = RunningAnalysis(subjects, pass_mark).update(zip(names, rows))
+    if not per_student:
+        return partial, None
+    return partial, {name: round(sum(marks) / len(marks), 2) for name, marks in zip(names, rows)}
+
+
+def iter_shards(students, shard_size):
+    """Yield (names, rows) chunks of a roster, in roster order."""
+    items = iter(students.items())
+    while True:
+        chunk = list(islice(items, shard_size))
+        if not chunk:
+            return
+        names, rows = zip(*chunk)
+        yield list(names), [list(marks) for marks in rows]
+
+
+def merge_partials(partials, subjects, pass_mark=PASS_MARK):
+    """Reduce partial results, given in roster order, into one RunningAnalysis."""
+    total = RunningAnalysis(subjects, pass_mark)
+    for partial in partials:
+        total.merge(partial)
+    return total
+
+
+def analyze_sharded(students, subjects=None, pass_mark=PASS_MARK, workers=None,
+                    shard_size=None, executor=None, per_student=True):
+    """
+    Analyze a roster across a pool of worker processes.
+
+    Args:
+        students (dict or MarksTable): {'StudentName': [marks...]}
+        subjects (sequence): Subject names; defaults to the roster's own
+        pass_mark (int): Marks below this value count as a fail
+        workers (int): Pool size; defaults to the number of CPUs
+        shard_size (int): Students per shard; defaults to about four shards per worker
+        executor: An existing executor to reuse when analyzing many classes
+        per_student (bool): Include 'all_students' and 'student_averages'; when
+                            False only the merged summary is returned
+
+    Returns:
+        LazyResults: The same results as analyze_student_marks, with
+                     'all_students' built from the roster when first read;
+                     or the streamed summary dict when per_student is False
+    """
+    if subjects is None:
+        subjects = subjects_of(students)
+    subjects = tuple(subjects)
+    workers = workers or os.cpu_count() or 1
+    if shard_size is None:
+        shard_size = max(1, -(-len(students) // (workers * 4)))
+
+    shards = (
+        (subjects, pass_mark, names, rows, per_student)
+        for names, rows in iter_shards(students, shard_size)
+    )
+
+    partials = []
+    averages = {}
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        # map() yields in submission order, which keeps roster order for ties
+        for partial, shard_averages in pool.map(_analyze_shard, shards):
+            partials.append(partial)
+            if shard_averages is not None:
+                averages.update(shard_averages)
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+    total = merge_partials(partials, subjects, pass_mark)
+    if not per_student:
+        return total.summary()
+
+    return LazyResults(students, subjects, pass_mark, computed={
+        'failed_students': total.failed_students,
+        'student_averages': averages,
+        'class_topper': total.class_topper,
+        'subject_toppers': dict(zip(subjects, total.subject_toppers))
+    })
@@ -0,0 +1,154 @@
+"""
+Ranking helpers for Student Marks Analyzer.
+Top-K and bottom-K leaderboards by subject or by average, using heap
+selection so that only K students are ever kept in order, and full class
+rankings (dense, competition and percentile ranks) from one sort per key.
+"""
+
+import heapq
+from operator import itemgetter
+
+from marks_table import MarksTable, subjects_of
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; ranks are then computed with sorted()
+    np = None
+
+AVERAGE = 'average'
+
+
+def iter_scores(students, by=AVERAGE):
+    """
+    Yield (name, score) pairs for one ranking criterion.
+
+    Args:
+        students (dict or MarksTable): {'StudentName': [marks...]}
+        by (str): A subject name, or 'average' for each student's average
+
+    Yields:
+        tuple: (student name, score), in roster order
+    """
+    if by == AVERAGE:
+        return ((name, sum(marks) / len(marks)) for name, marks in students.items())
+
+    position = list(subjects_of(students)).index(by)
+    if isinstance(students, MarksTable):
+        return zip(students.names, students.columns[position])
+    return ((name, marks[position]) for name, marks in students.items())
+
+
+def top_k_scores(scores, k):
+    """
+    Highest K entries of a {name: score} mapping or (name, score) iterable.
+
+    Runs in O(n log k). Ties keep roster order, so the first student with a
+    given score is listed first.
+    """
+    if hasattr(scores, 'items'):
+        scores = scores.items()
+    return heapq.nlargest(k, scores, key=itemgetter(1))
+
+
+def bottom_k_scores(scores, k):
+    """Lowest K entries of a {name: score} mapping or (name, score) iterable."""
+    if hasattr(scores, 'items'):
+        scores = scores.items()
+    return heapq.nsmallest(k, scores, key=itemgetter(1))
+
+
+def top_k(students, by=AVERAGE, k=3):
+    """
+    Best K students by a subject or by average.
+
+    Returns:
+        list: (name, score) pairs, highest score first
+    """
+    return top_k_scores(iter_scores(students, by), k)
+
+
+def bottom_k(students, by=AVERAGE, k=3):
+    """
+    Weakest K students by a subject or by average.
+
+    Returns:
+        list: (name, score) pairs, lowest score first
+    """
+    return bottom_k_scores(iter_scores(students, by), k)
+
+
+def _rank_sorted_python(values):
+    order = sorted(range(len(values)), key=values.__getitem__, reverse=True)
+    count = len(values)
+    dense = [0] * count
+    competition = [0] * count
+    percentile = [0.0] * count
+    previous = None
+    group_dense = group_start = 0
+    for position, i in enumerate(order):
+        if values[i] != previous:
+            previous = values[i]
+            group_dense += 1
+            group_start = position + 1
+        dense[i] = group_dense
+        competition[i] = group_start
+        percentile[i] = round((count - group_start + 1) * 100 / count, 2)
+    return dense, competition, percentile
+
+
+def rank_scores(scores):
+    """
+    Rank every score, highest first, with one O(n log n) sort.
+
+    Args:
+        scores (sequence): One score per student, in roster order
+
+    Returns:
+        dict: {'dense', 'competition', 'percentile'} lists in roster order.
+              Tied scores share a rank: dense ranks are 1, 2, 2, 3 and
+              competition ranks 1, 2, 2, 4. Percentile is the share of the
+              class scoring at or below the student.
+    """
+    count = len(scores)
+    if np is None or not count:
+        dense, competition, percentile = _rank_sorted_python(list(scores))
+        return {'dense': dense, 'competition': competition, 'percentile': percentile}
+
+    values = np.asarray(scores, dtype=np.float64)
+    order = np.argsort(-values, kind='stable')
+    ranked = values[order]
+    starts_group = np.empty(count, dtype=bool)
+    starts_group[0] = True
+    np.not_equal(ranked[1:], ranked[:-1], out=starts_group[1:])
+
+    # Each student takes the rank of the first student in their tie group
+    positions = np.arange(1, count + 1)
+    group_start = np.maximum.accumulate(np.where(starts_group, positions, 0))
+    dense = np.empty(count, dtype=np.int64)
+    competition = np.empty(count, dtype=np.int64)
+    dense[order] = np.cumsum(starts_group)
+    competition[order] = group_start
+    percentile = np.round((count - competition + 1) * 100 / count, 2)
+    return {'dense': dense.tolist(), 'competition': competition.tolist(), 'percentile': percentile.tolist()}
+
+
+def student_ranks(students):
+    """
+    Overall and per-subject ranks for every student.
+
+    The overall rank orders students by total marks, which is the same
+    order as their averages without rounding ties.
+
+    Returns:
+        dict: {'average': ranks, subject: ranks, ...}, each as returned by
+              rank_scores, in roster order
+    """
+    subjects = subjects_of(students)
+    if isinstance(students, MarksTable):
+        columns = students.columns
+    else:
+        columns = list(zip(*students.values())) or [() for _ in subjects]
+    ranks = {AVERAGE: rank_scores([sum(marks) for marks in zip(*columns)] if columns else [])}
+    for subject, column in zip(subjects, columns):
+        ranks[subject] = rank_scores(column)
+    return ranks
@@ -0,0 +1,237 @@
+"""
+On-disk results cache for Student Marks Analyzer.
+Analysis results are stored under a hash of the normalized roster (subjects,
+pass mark, names and marks), so the same class analyzed again, by another
+user or after a restart, is read back instead of recomputed. The directory
+is kept under a size limit by evicting the least recently used entries, and
+recent entries are also kept in memory for repeat hits within a process.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from array import array
+from collections import OrderedDict
+from itertools import accumulate, chain
+
+from engines import analyze_roster
+from marks_table import PASS_MARK, MarksTable, PackedNames, StudentTable, as_marks_table, subjects_of
+from sketches import distribution_summary, subject_histograms
+
+CACHE_VARIABLE = 'MARKS_CACHE_DIR'
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'student_marks')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+FORMAT_VERSION = 2
+_SUFFIX = '.json'
+_BAD_MARK = re.compile(rb'[\x65-\xff]')
+
+
+def _packed_names(names):
+    """A roster's names as the uint32 offsets and UTF-8 blob a StudentTable stores."""
+    if isinstance(names, PackedNames):
+        return names.offsets, names.blob
+    encoded = list(map(str.encode, names))
+    return array('I', chain((0,), accumulate(map(len, encoded)))), b''.join(encoded)
+
+
+def _uint8_marks(students, width):
+    """Row-major marks as bytes, or None unless every mark is a whole number 0-100."""
+    if isinstance(students, StudentTable):
+        return students.buffer
+    try:
+        if isinstance(students, MarksTable):
+            marks = bytearray(len(students) * width)
+            for j, column in enumerate(students.columns):
+                marks[j::width] = array('B', column)
+        else:
+            marks = bytearray(chain.from_iterable(students.values()))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return None if _BAD_MARK.search(marks) else marks
+
+
+def roster_digest(students, subjects=None, pass_mark=PASS_MARK):
+    """
+    Hash a roster's contents, independent of how it is stored.
+
+    A dict and a StudentTable with the same names and marks give the same
+    digest. Tables are hashed straight from their buffers, and dicts are
+    packed the same way with C-level iterators rather than a Python loop.
+
+    Returns:
+        str: Hex digest
+    """
+    subjects = tuple(subjects or subjects_of(students))
+    width = len(subjects)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(json.dumps([FORMAT_VERSION, subjects, pass_mark]).encode('utf-8'))
+
+    if not isinstance(students, MarksTable) and set(map(len, students.values())) - {width}:
+        # Ragged rows cannot be analyzed; hash them as text so they still differ
+        digest.update(json.dumps([[name, list(marks)] for name, marks in students.items()]).encode('utf-8'))
+        return digest.hexdigest()
+
+    offsets, blob = _packed_names(students.names if isinstance(students, MarksTable) else students)
+    digest.update(offsets)
+    digest.update(blob)
+
+    marks = _uint8_marks(students, width)
+    if marks is not None:
+        digest.update(b'uint8')
+        digest.update(marks)
+        return digest.hexdigest()
+
+    # Fractional marks: one float64 column per subject
+    digest.update(b'float64')
+    columns = students.columns if isinstance(students, MarksTable) else zip(*students.values())
+    for column in columns:
+        digest.update(array('d', column))
+    return digest.hexdigest()
+
+
+class ResultsCache:
+    """
+    Size-bounded cache of analysis payloads, keyed by roster digest.
+
+    Each entry is one JSON file, so reading a shared directory never runs
+    code; a hit refreshes the file's modification time, and writes evict the
+    oldest files once the directory is over max_bytes. Payloads must be
+    plain dicts, lists, strings and numbers.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES, memory_entries=32):
+        self.directory = directory or os.environ.get(CACHE_VARIABLE) or DEFAULT_DIRECTORY
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def _remember(self, key, payload):
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached payload for a key, or None on a miss."""
+        payload = self._memory.get(key)
+        if payload is not None:
+            self._memory.move_to_end(key)
+            return payload
+
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                payload = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):  # missing, or a corrupt or partial file
+            return None
+        self._remember(key, payload)
+        return payload
+
+    def put(self, key, payload):
+        """
+        Store a payload; failures to write (e.g. a read-only disk) are ignored.
+
+        Raises:
+            TypeError: If the payload cannot be stored as JSON
+        """
+        data = json.dumps(payload, separators=(',', ':'))
+        self._remember(key, payload)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(temporary, self._path(key))
+        except OSError:
+            return
+        self.evict()
+
+    def entries(self):
+        """(modified time, size, path) of every file in the cache, oldest first."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if name.endswith(_SUFFIX):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def size(self):
+        """Total bytes used on disk."""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        self._memory.clear()
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_default_cache = None
+
+
+def default_cache():
+    """The process-wide cache in MARKS_CACHE_DIR (or ~/.cache/student_marks)."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultsCache()
+    return _default_cache
+
+
+def cached_analysis(students, subjects=None, pass_mark=PASS_MARK, cache=None, engine=None, key=None):
+    """
+    Analyze a roster, or read the results back if it was analyzed before.
+
+    Args:
+        students (dict or MarksTable): {'StudentName': [marks...]}
+        subjects (sequence): Subject names for a plain dict
+        pass_mark (int): Marks below this value count as a fail
+        cache (ResultsCache): Defaults to default_cache()
+        engine (str): Engine for a cache miss (see engines.analyze_roster)
+        key (str): The roster's digest, if the caller has already computed it
+
+    Returns:
+        dict: {'results': results dict, 'subject_stats': rows, 'distribution': rows}
+    """
+    cache = cache or default_cache()
+    subjects = tuple(subjects or subjects_of(students))
+    key = key or roster_digest(students, subjects, pass_mark)
+    payload = cache.get(key)
+    if payload is None:
+        results = analyze_roster(students, subjects, pass_mark, engine)
+        table = as_marks_table(students, subjects)
+        payload = {
+            'results': dict(results.to_dict() if hasattr(results, 'to_dict') else results),
+            'subject_stats': table.subject_stats(),
+            'distribution': distribution_summary(subject_histograms(table))
+        }
+        cache.put(key, payload)
+    return payload
@@ -0,0 +1,186 @@
+"""
+Query layer over analysis results for Student Marks Analyzer.
+Sorts the roster once per subject and once by average, keeping the sorted
+student positions and scores as typed arrays. Filtering by a score range,
+sorting and paging are then a binary search plus a slice, O(log n + k) for
+k rows, instead of rebuilding and re-sorting a DataFrame for every view.
+A name search adds one scan of the names, remembered for the next page.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from marks_table import as_marks_table
+from ranking import AVERAGE
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the indexes are then sorted in Python
+    np = None
+
+
+def _typed(values, typecode):
+    result = array(typecode)
+    result.frombytes(values.tobytes())
+    return result
+
+
+class _SortedKey:
+    """Student positions sorted by one score, in both directions."""
+
+    __slots__ = ('ascending', 'descending', 'scores', 'negated')
+
+    def __init__(self, scores):
+        if np is not None:
+            # Stable argsorts of the scores and their negation keep ties in roster order
+            values = np.asarray(scores, dtype=np.float64)
+            ascending = np.argsort(values, kind='stable')
+            descending = np.argsort(-values, kind='stable')
+            self.ascending = _typed(ascending.astype(np.uint32), 'I')
+            self.descending = _typed(descending.astype(np.uint32), 'I')
+            self.scores = _typed(values[ascending], 'd')
+            self.negated = _typed(-values[descending], 'd')
+            return
+
+        # Python's sort is stable in both directions, so ties keep roster order
+        self.ascending = array('I', sorted(range(len(scores)), key=scores.__getitem__))
+        self.descending = array('I', sorted(range(len(scores)), key=scores.__getitem__, reverse=True))
+        self.scores = array('d', (scores[i] for i in self.ascending))
+        self.negated = array('d', (-scores[i] for i in self.descending))
+
+    def bounds(self, low, high, descending):
+        """Slice of the sorted order holding scores from low to high (inclusive)."""
+        if descending:
+            start = 0 if high is None else bisect_left(self.negated, -high)
+            stop = len(self.negated) if low is None else bisect_right(self.negated, -low)
+        else:
+            start = 0 if low is None else bisect_left(self.scores, low)
+            stop = len(self.scores) if high is None else bisect_right(self.scores, high)
+        return start, max(start, stop)
+
+
+class ResultsQuery:
+    """
+    Sorted indexes over a roster and its analysis results.
+
+    Building costs O(n log n) per key; each query afterwards costs
+    O(log n + k) for the k rows it returns.
+    """
+
+    def __init__(self, students, results):
+        table = as_marks_table(students)
+        self.subjects = table.subjects
+        self.names = table.names
+        self.columns = table.columns
+        self.averages = array('d', map(results['student_averages'].__getitem__, self.names))
+        self._keys = {AVERAGE: _SortedKey(self.averages)}
+        for subject, column in zip(self.subjects, self.columns):
+            self._keys[subject] = _SortedKey(column)
+        self._folded = None
+        self._search = (None, None)
+
+    @property
+    def keys(self):
+        """Names that can be sorted and filtered on: 'average' and each subject."""
+        return tuple(self._keys)
+
+    def named(self, text):
+        """
+        Which students have text in their name, ignoring case.
+
+        Returns:
+            A boolean NumPy array, or a set of roster positions without NumPy
+        """
+        text = text.casefold()
+        if self._search[0] == text:
+            return self._search[1]
+        if self._folded is None:
+            self._folded = [name.casefold() for name in self.names]
+        positions = [i for i, name in enumerate(self._folded) if text in name]
+        if np is not None:
+            matches = np.zeros(len(self.names), dtype=bool)
+            matches[positions] = True
+        else:
+            matches = set(positions)
+        self._search = (text, matches)
+        return matches
+
+    def _filter(self, order, name):
+        """Keep the positions in order whose student's name contains name."""
+        matches = self.named(name)
+        if np is None:
+            return array('I', (i for i in order if i in matches))
+        order = np.frombuffer(order, dtype=np.uint32)
+        return _typed(order[matches[order]], 'I')
+
+    def count(self, by=AVERAGE, low=None, high=None, name=None):
+        """Number of students with a score from low to high, in O(log n) without a name search."""
+        if name:
+            return len(self.search(by, low, high, name=name))
+        start, stop = self._keys[by].bounds(low, high, False)
+        return stop - start
+
+    def search(self, by=AVERAGE, low=None, high=None, descending=True, offset=0, limit=None, name=None):
+        """
+        Positions of students sorted and filtered by one score.
+
+        Args:
+            by (str): 'average' or a subject name
+            low, high: Inclusive score range; None leaves that end open
+            descending (bool): Highest scores first; ties keep roster order
+            offset (int): Matching students to skip (for pagination)
+            limit (int): Most students to return
+            name (str): Only students whose name contains this, ignoring case
+
+        Returns:
+            array: Roster positions of the matching students, in order
+        """
+        key = self._keys[by]
+        start, stop = key.bounds(low, high, descending)
+        order = key.descending if descending else key.ascending
+        if name:
+            order = self._filter(order[start:stop], name)
+            start, stop = 0, len(order)
+        start = min(start + offset, stop)
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return order[start:stop]
+
+    def rows(self, positions):
+        """
+        Table rows for roster positions.
+
+        Returns:
+            list: {'Student', <subject>..., 'Average'} dicts
+        """
+        rows = []
+        for i in positions:
+            row = {'Student': self.names[i]}
+            for subject, column in zip(self.subjects, self.columns):
+                row[subject] = column[i]
+            row['Average'] = self.averages[i]
+            rows.append(row)
+        return rows
+
+    def page_positions(self, by=AVERAGE, low=None, high=None, descending=True, page=1, page_size=25, name=None):
+        """
+        Roster positions on one page of students sorted and filtered by a score.
+
+        Returns:
+            tuple: (positions, total matching students)
+        """
+        offset = (page - 1) * page_size
+        if not name:
+            return self.search(by, low, high, descending, offset, page_size), self.count(by, low, high)
+        matches = self.search(by, low, high, descending, name=name)
+        return matches[offset:offset + page_size], len(matches)
+
+    def page(self, by=AVERAGE, low=None, high=None, descending=True, page=1, page_size=25, name=None):
+        """
+        One page of rows sorted and filtered by a score.
+
+        Returns:
+            tuple: (rows, total matching students)
+        """
+        positions, total = self.page_positions(by, low, high, descending, page, page_size, name)
+        return self.rows(positions), total
@@ -0,0 +1,214 @@
+"""
+Binary roster files for Student Marks Analyzer.
+A roster is saved once as a header, a names offsets table, the packed UTF-8
+names and a uint8 marks matrix. Opening it memory-maps the file and wraps
+those sections in a StudentTable without parsing or copying, so a million
+students load in milliseconds. Close the table (or open it in a with block)
+to unmap the file, which Windows keeps locked while it is mapped.
+
+File layout (little-endian):
+    header    magic b'SMRK', version (u16), subject count (u16),
+              student count (u64), names blob length (u64)
+    subjects  per subject: name length (u16) + UTF-8 name
+    padding   zero bytes up to a 4-byte boundary
+    offsets   student count + 1 uint32 offsets into the names blob
+    names     UTF-8 names, back to back
+    marks     student count x subject count uint8 marks, row-major
+"""
+
+import mmap
+import re
+import struct
+import sys
+from array import array
+
+from marks_table import PackedNames, StudentTable, subjects_of
+
+MAGIC = b'SMRK'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQQ')
+_SUBJECT_LENGTH = struct.Struct('<H')
+_BAD_MARK = re.compile(rb'[\x65-\xff]')
+
+
+def _padding(position):
+    return -position % 4
+
+
+def _little_endian(offsets):
+    if sys.byteorder == 'big':
+        offsets = array('I', offsets)
+        offsets.byteswap()
+    return offsets
+
+
+def write_roster(path, students, subjects=None):
+    """
+    Save a roster in the binary format.
+
+    Args:
+        path (str): Destination file
+        students (dict or MarksTable): {'StudentName': [marks...]}; marks must
+                                       be whole numbers from 0 to 100
+        subjects (sequence): Subject names for a plain dict (default: Math, Science, English)
+    """
+    if isinstance(students, StudentTable):
+        table = students
+    else:
+        table = StudentTable.from_rows(students.items(), subjects or subjects_of(students))
+
+    names = table.names
+    blob = names.blob
+    offsets = names.offsets
+    with open(path, 'wb') as f:
+        position = f.write(HEADER.pack(MAGIC, VERSION, len(table.subjects), len(names), len(blob)))
+        for subject in table.subjects:
+            encoded = subject.encode('utf-8')
+            position += f.write(_SUBJECT_LENGTH.pack(len(encoded)) + encoded)
+        f.write(bytes(_padding(position)))
+        f.write(_little_endian(offsets))
+        f.write(blob)
+        f.write(table.buffer)
+
+
+class MappedRoster(StudentTable):
+    """
+    A StudentTable whose names and marks are read from a memory-mapped file.
+
+    close() unmaps the file; the table cannot be read afterwards. Use it as a
+    context manager to close it when the block ends.
+    """
+
+    __slots__ = ('_map', '_views')
+
+    def __init__(self, subjects, names, marks, file_map, views):
+        super().__init__(subjects, names, marks)
+        self._map = file_map
+        self._views = views
+
+    @property
+    def closed(self):
+        return self._map.closed
+
+    def close(self):
+        """
+        Release the table's views of the file and unmap it.
+
+        Raises:
+            BufferError: If other views of the marks (e.g. a NumPy array built
+                         on table.buffer) are still in use
+        """
+        if self._map.closed:
+            return
+        for view in (self._marks, *self._views):
+            view.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __reduce__(self):
+        # A copy in memory; the mapping itself cannot be pickled
+        names = PackedNames(bytes(self.names.blob), array('I', self.names.offsets))
+        return (StudentTable, (self.subjects, names, array('B', self._marks)))
+
+
+def open_roster(path, validate=True):
+    """
+    Memory-map a binary roster file.
+
+    The returned table reads names and marks straight from the mapped file;
+    call its close() method, or open it in a with block, when done with it.
+
+    Args:
+        path (str): File written by write_roster
+        validate (bool): Check every mark is 0-100 (a scan of the marks
+                         matrix in C, without copying it) and that the name
+                         offsets are in order and inside the names blob
+
+    Returns:
+        MappedRoster: A StudentTable, ready to pass to analyze_student_marks
+
+    Raises:
+        ValueError: If the file is not a valid roster
+    """
+    with open(path, 'rb') as f:
+        file_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # Every view of the map is kept here so a failed open can still unmap the file
+    views = [memoryview(file_map)]
+    data = views[0]
+    try:
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a roster file")
+        magic, version, subject_count, student_count, blob_size = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a roster file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported roster file version {version}")
+
+        position = HEADER.size
+        subjects = []
+        for _ in range(subject_count):
+            # A name running past the end is caught by the size check below
+            if position + _SUBJECT_LENGTH.size > len(data):
+                raise ValueError(f"{path} is truncated or corrupt: subject names run past the end")
+            (length,) = _SUBJECT_LENGTH.unpack_from(data, position)
+            position += _SUBJECT_LENGTH.size
+            subjects.append(str(data[position:position + length], 'utf-8'))
+            position += length
+        position += _padding(position)
+
+        offsets_end = position + 4 * (student_count + 1)
+        blob_end = offsets_end + blob_size
+        marks_end = blob_end + student_count * subject_count
+        if len(data) != marks_end:
+            raise ValueError(f"{path} is truncated or corrupt: expected {marks_end} bytes, got {len(data)}")
+
+        views.append(data[position:offsets_end].cast('I'))
+        views.append(data[offsets_end:blob_end])
+        views.append(data[blob_end:marks_end])
+        raw_offsets, blob, marks = views[1:]
+        offsets = _little_endian(raw_offsets)
+        if validate:
+            if _BAD_MARK.search(marks):
+                raise ValueError(f"{path} contains marks above 100")
+            # Sorting an already sorted list is a single linear pass in C
+            order = offsets.tolist()
+            if order[-1] > blob_size or order != sorted(order):
+                raise ValueError(f"{path} has name offsets out of order or past the names blob")
+
+        return MappedRoster(subjects, PackedNames(blob, offsets), marks, file_map, views)
+    except BaseException:
+        for view in views:
+            view.release()
+        file_map.close()
+        raise
+
+
+def main():
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python roster_file.py ROSTER.csv ROSTER.smrk   (convert)")
+        print("       python roster_file.py ROSTER.smrk              (analyze)")
+        sys.exit(1)
+
+    if len(sys.argv) == 3:
+        from streaming_analyzer import csv_subjects, iter_csv_rows
+
+        source, destination = sys.argv[1:]
+        table = StudentTable.from_rows(iter_csv_rows(source), csv_subjects(source))
+        write_roster(destination, table)
+        print(f"Saved {len(table)} students to {destination}")
+        return
+
+    from results_cache import cached_analysis
+    from student_marks_analyzer import display_analysis
+
+    with open_roster(sys.argv[1]) as table:
+        display_analysis(cached_analysis(table)['results'])
+
+
+if __name__ == "__main__":
+    main()
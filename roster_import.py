@@ -0,0 +1,116 @@
+"""
+Bulk roster import for Student Marks Analyzer.
+Reads a CSV or Excel upload, or the rows of an edited grid, as one DataFrame
+and converts the whole marks block to a StudentTable in a single NumPy step:
+check the range, cast to uint8 and take the row-major bytes. Class and
+school rosters load without a widget or a Python list per student.
+"""
+
+import os
+from array import array
+
+import numpy as np
+import pandas as pd
+
+from marks_table import MarksTable, PackedNames, StudentTable, as_marks_table, roster_subjects
+
+UPLOAD_TYPES = ('csv', 'xlsx', 'xls', 'parquet')
+
+
+def table_from_dataframe(frame, subjects=None, name_column='Name'):
+    """
+    Convert a DataFrame with one row per student into a roster.
+
+    Rows without a name (such as blank rows added in an editor) are skipped.
+
+    Args:
+        frame (pandas.DataFrame): A name column and one column per subject
+        subjects (sequence): Subject columns to use; defaults to every other column
+        name_column (str): Column holding student names
+
+    Returns:
+        StudentTable, or a MarksTable if any marks are fractional
+
+    Raises:
+        ValueError: If a column is missing, a name is repeated, or a mark is
+                    missing, not a number or outside 0-100
+    """
+    if subjects is None:
+        subjects = roster_subjects(frame.columns, name_column)
+    subjects = list(subjects)
+    missing = [column for column in (name_column, *subjects) if column not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    names = frame[name_column].astype('string').str.strip()
+    named = names.notna() & (names != '')
+    names = names[named]
+    repeated = names[names.duplicated()]
+    if len(repeated):
+        raise ValueError(f"Student names must be unique: {', '.join(repeated.unique()[:5])}")
+
+    marks = frame.loc[named, subjects]
+    numeric = {}
+    for subject in subjects:
+        try:
+            numeric[subject] = pd.to_numeric(marks[subject])
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Marks must be numbers, but '{subject}' is not ({e})") from None
+    values = pd.DataFrame(numeric, index=marks.index, columns=subjects).to_numpy(dtype=np.float64)
+    blanks = np.isnan(values).any(axis=0)
+    if blanks.any():
+        raise ValueError(f"'{subjects[blanks.argmax()]}' has missing marks")
+    outside = ((values < 0) | (values > 100)).any(axis=0)
+    if outside.any():
+        raise ValueError(f"Marks must be between 0 and 100, but '{subjects[outside.argmax()]}' is not")
+
+    names = PackedNames.from_names(names.tolist())
+    if np.array_equal(values, np.round(values)):
+        return StudentTable(subjects, names, values.astype(np.uint8).tobytes())
+    return MarksTable(subjects, names, [array('d', values[:, j].tobytes()) for j in range(len(subjects))])
+
+
+def read_roster_file(source, filename=None, subjects=None, name_column='Name'):
+    """
+    Read an uploaded roster, choosing the format from the file extension.
+
+    Args:
+        source: Path or binary file object (e.g. a Streamlit upload)
+        filename (str): Name to take the extension from; defaults to source itself
+        subjects (sequence): Subject columns to use; defaults to every column but
+                             the names, for every format
+        name_column (str): Column holding student names
+
+    Returns:
+        StudentTable, or a MarksTable if any marks are fractional
+
+    Raises:
+        ValueError: If the format is not supported or the roster is invalid
+        ImportError: If the reader for the format is not installed
+    """
+    extension = os.path.splitext(filename or source)[1].lower().lstrip('.')
+    if extension == 'parquet':
+        from arrow_loader import read_parquet
+        return read_parquet(source, subjects, name_column)
+    if extension == 'csv':
+        frame = pd.read_csv(source, skipinitialspace=True)
+    elif extension in ('xlsx', 'xls'):
+        frame = pd.read_excel(source)
+    else:
+        raise ValueError(f"Unsupported roster format '.{extension}'; use one of {', '.join(UPLOAD_TYPES)}")
+    return table_from_dataframe(frame, subjects, name_column)
+
+
+def roster_dataframe(students, name_column='Name'):
+    """A roster as an editable DataFrame: the name column, then one column per subject."""
+    table = as_marks_table(students)
+    data = {name_column: list(table.names)}
+    for subject, column in zip(table.subjects, table.columns):
+        data[subject] = np.asarray(column)
+    return pd.DataFrame(data, columns=[name_column, *table.subjects])
+
+
+def blank_roster(subjects, name_column='Name', students=4, marks=(85, 90, 78)):
+    """An editable roster of unnamed students with default marks, to be filled in."""
+    row = [''] + [marks[j % len(marks)] for j in range(len(subjects))]
+    return pd.DataFrame([row] * students, columns=[name_column, *subjects])
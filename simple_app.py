@@ -1,4 +1,7 @@
 import streamlit as st
+from engines import analyze_roster
+from grading import DEFAULT_SCALE
+from marks_table import as_marks_table
 
 st.set_page_config(
     page_title="Student Marks Analyzer",
@@ -18,41 +21,11 @@ students = {
 }
 
 # Analysis
-failed_students = []
-student_averages = {}
-subject_toppers = {'Math': '', 'Science': '', 'English': ''}
-subject_highest = {'Math': 0, 'Science': 0, 'English': 0}
-highest_average = 0
-class_topper = ''
-
-for student_name, marks in students.items():
-    math, science, english = marks
-    
-    # Check for failing students (marks below 40)
-    if math < 40 or science < 40 or english < 40:
-        failed_students.append(student_name)
-    
-    # Calculate average marks
-    average = (math + science + english) / 3
-    student_averages[student_name] = round(average, 2)
-    
-    # Track class topper (highest average)
-    if average > highest_average:
-        highest_average = average
-        class_topper = student_name
-    
-    # Track subject-wise toppers
-    if math > subject_highest['Math']:
-        subject_highest['Math'] = math
-        subject_toppers['Math'] = student_name
-    
-    if science > subject_highest['Science']:
-        subject_highest['Science'] = science
-        subject_toppers['Science'] = student_name
-    
-    if english > subject_highest['English']:
-        subject_highest['English'] = english
-        subject_toppers['English'] = student_name
+results = analyze_roster(students)
+failed_students = results['failed_students']
+student_averages = results['student_averages']
+subject_toppers = results['subject_toppers']
+class_topper = results['class_topper']
 
 # Display results
 col1, col2, col3, col4 = st.columns(4)
@@ -75,9 +48,11 @@ st.markdown("---")
 # Student marks table
 st.subheader("📊 Student Marks Table")
 
-for name, marks in students.items():
+for student in results['all_students']:
+    name = student['name']
     status = '❌ Failed' if name in failed_students else '✅ Passed'
-    st.write(f"**{name}**: Math={marks[0]}, Science={marks[1]}, English={marks[2]}, Average={student_averages[name]}%, Status={status}")
+    marks = ", ".join(f"{subject}={mark}" for subject, mark in student['marks'].items())
+    st.write(f"**{name}**: {marks}, Average={student_averages[name]}%, Status={status}")
 
 # Failed students alert
 if failed_students:
@@ -99,30 +74,16 @@ with col1:
 with col2:
     st.subheader("📊 Performance Summary")
     
-    for subject in ['Math', 'Science', 'English']:
-        marks = [students[name][['Math', 'Science', 'English'].index(subject)] for name in students.keys()]
-        avg_mark = sum(marks) / len(marks)
-        highest_mark = max(marks)
-        lowest_mark = min(marks)
-        st.write(f"**{subject}**: Average={avg_mark:.1f}, Highest={highest_mark}, Lowest={lowest_mark}")
+    for stats in as_marks_table(students).subject_stats():
+        st.write(f"**{stats['Subject']}**: Average={stats['Average']:.1f}, "
+                 f"Highest={stats['Highest']}, Lowest={stats['Lowest']}")
 
 # All student averages
 st.subheader("📈 All Student Averages")
 
-for name, avg in sorted(student_averages.items(), key=lambda x: x[1], reverse=True):
-    if avg >= 90:
-        grade = "A+"
-    elif avg >= 80:
-        grade = "A"
-    elif avg >= 70:
-        grade = "B"
-    elif avg >= 60:
-        grade = "C"
-    elif avg >= 50:
-        grade = "D"
-    else:
-        grade = "F"
-    
+ranked = sorted(student_averages.items(), key=lambda x: x[1], reverse=True)
+grades = DEFAULT_SCALE.grade_all([avg for _, avg in ranked])
+for (name, avg), grade in zip(ranked, grades):
     st.write(f"**{name}**: {avg}% (Grade: {grade})")
 
 st.markdown("---")
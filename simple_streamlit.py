@@ -1,49 +1,9 @@
 import streamlit as st
-import pandas as pd
-
-def analyze_student_marks(students):
-    """Analyze student marks and provide comprehensive analysis."""
-    
-    results = {
-        'failed_students': [],
-        'student_averages': {},
-        'class_topper': '',
-        'subject_toppers': {'Math': '', 'Science': '', 'English': ''}
-    }
-    
-    subject_highest = {'Math': 0, 'Science': 0, 'English': 0}
-    highest_average = 0
-    
-    for student_name, marks in students.items():
-        math, science, english = marks
-        
-        # Check for failing students (marks below 40)
-        if math < 40 or science < 40 or english < 40:
-            results['failed_students'].append(student_name)
-        
-        # Calculate average marks
-        average = (math + science + english) / 3
-        results['student_averages'][student_name] = round(average, 2)
-        
-        # Track class topper (highest average)
-        if average > highest_average:
-            highest_average = average
-            results['class_topper'] = student_name
-        
-        # Track subject-wise toppers
-        if math > subject_highest['Math']:
-            subject_highest['Math'] = math
-            results['subject_toppers']['Math'] = student_name
-        
-        if science > subject_highest['Science']:
-            subject_highest['Science'] = science
-            results['subject_toppers']['Science'] = student_name
-        
-        if english > subject_highest['English']:
-            subject_highest['English'] = english
-            results['subject_toppers']['English'] = student_name
-    
-    return results
+from dataframes import averages_page_dataframe, marks_page_dataframe, summary_dataframe
+from ranking import student_ranks
+from results_cache import cached_analysis, roster_digest
+from results_query import ResultsQuery
+from widgets import failed_alert, get_custom_data, incremental_results, paged_positions
 
 def main():
     st.set_page_config(
@@ -78,35 +38,29 @@ def main():
     
     # Main analysis
     if students:
-        results = analyze_student_marks(students)
-        display_analysis(results, students)
-    
-def get_custom_data():
-    """Get custom student data from user input"""
-    st.sidebar.subheader("Add Students")
-    
-    students = {}
-    
-    # Number of students
-    num_students = st.sidebar.number_input("Number of students:", min_value=1, max_value=20, value=4)
-    
-    # Input fields for each student
-    for i in range(num_students):
-        st.sidebar.markdown(f"### Student {i+1}")
-        
-        name = st.sidebar.text_input(f"Name {i+1}:", key=f"name_{i}")
-        math = st.sidebar.number_input(f"Math {i+1}:", min_value=0, max_value=100, value=85, key=f"math_{i}")
-        science = st.sidebar.number_input(f"Science {i+1}:", min_value=0, max_value=100, value=90, key=f"science_{i}")
-        english = st.sidebar.number_input(f"English {i+1}:", min_value=0, max_value=100, value=78, key=f"english_{i}")
-        
-        if name:  # Only add if name is provided
-            students[name] = [math, science, english]
-    
-    return students
+        if data_option == "Sample Data":
+            # Unchanged rosters are read back from the results cache
+            tables = cached_analysis(students)
+            results = tables['results']
+        else:
+            results = incremental_results(students)
+            tables = None
+        display_analysis(results, students, tables)
+    
+@st.cache_resource(max_entries=8, show_spinner=False)
+def roster_views(digest, _students, _results):
+    """Sorted indexes, ranks and failures for a roster, built once per digest"""
+    return {
+        'query': ResultsQuery(_students, _results),
+        'ranks': student_ranks(_students),
+        'failed': frozenset(_results['failed_students'])
+    }
 
-def display_analysis(results, students):
+def display_analysis(results, students, tables=None):
     """Display analysis results in Streamlit format"""
     
+    views = roster_views(roster_digest(students), students, results)
+    
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -129,24 +83,12 @@ def display_analysis(results, students):
     # Student marks table
     st.subheader("📊 Student Marks Table")
     
-    # Create DataFrame for display
-    data = []
-    for name, marks in students.items():
-        data.append({
-            'Student': name,
-            'Math': marks[0],
-            'Science': marks[1],
-            'English': marks[2],
-            'Average': results['student_averages'][name],
-            'Status': '❌ Failed' if name in results['failed_students'] else '✅ Passed'
-        })
-    
-    df = pd.DataFrame(data)
-    st.dataframe(df, use_container_width=True)
+    # One page of marks with class and subject ranks
+    positions = paged_positions(views['query'], "marks")
+    st.dataframe(marks_page_dataframe(views['query'], positions, views['failed'], views['ranks']), use_container_width=True)
     
     # Failed students alert
-    if results['failed_students']:
-        st.error(f"⚠️ Students who failed: {', '.join(results['failed_students'])}")
+    failed_alert(results['failed_students'])
     
     st.markdown("---")
     
@@ -165,48 +107,15 @@ def display_analysis(results, students):
         st.subheader("📊 Performance Summary")
         
         # Create summary DataFrame
-        summary_data = []
-        for subject in ['Math', 'Science', 'English']:
-            marks = [students[name][['Math', 'Science', 'English'].index(subject)] for name in students.keys()]
-            summary_data.append({
-                'Subject': subject,
-                'Average': sum(marks) / len(marks),
-                'Highest': max(marks),
-                'Lowest': min(marks)
-            })
-        
-        summary_df = pd.DataFrame(summary_data)
+        summary_df = summary_dataframe(students, tables and tables['subject_stats'])
         st.dataframe(summary_df, use_container_width=True)
     
     # All student averages
     st.subheader("📈 All Student Averages")
     
-    avg_data = []
-    for name, avg in results['student_averages'].items():
-        avg_data.append({
-            'Student': name,
-            'Average': avg,
-            'Grade': get_grade(avg)
-        })
-    
-    avg_df = pd.DataFrame(avg_data)
-    avg_df = avg_df.sort_values('Average', ascending=False)
-    st.dataframe(avg_df, use_container_width=True)
-
-def get_grade(average):
-    """Convert average to grade"""
-    if average >= 90:
-        return "A+"
-    elif average >= 80:
-        return "A"
-    elif average >= 70:
-        return "B"
-    elif average >= 60:
-        return "C"
-    elif average >= 50:
-        return "D"
-    else:
-        return "F"
+    # Sorted indexes answer sorting, score ranges and paging without re-sorting
+    positions = paged_positions(views['query'], "averages")
+    st.dataframe(averages_page_dataframe(views['query'], positions), use_container_width=True)
 
 if __name__ == "__main__":
     main()
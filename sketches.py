@@ -0,0 +1,185 @@
+"""
+Per-subject distribution sketches for Student Marks Analyzer.
+Marks run from 0 to 100, so a 101-bucket count array holds a subject's full
+distribution in constant memory (fractional marks count at their whole mark). Sketches from different
+shards or terms merge by adding counts, and still give exact percentiles,
+grade counts and histograms.
+"""
+
+import math
+from array import array
+from collections import Counter
+
+from grading import DEFAULT_BANDS as GRADE_BANDS
+from marks_table import MarksTable, subjects_of
+
+BUCKETS = 101
+
+
+class MarkHistogram:
+    """Count of students at every mark from 0 to 100."""
+
+    __slots__ = ('counts',)
+
+    def __init__(self, counts=None):
+        self.counts = array('Q', counts if counts is not None else [0] * BUCKETS)
+        if len(self.counts) != BUCKETS:
+            raise ValueError(f"Expected {BUCKETS} buckets, got {len(self.counts)}")
+
+    @classmethod
+    def from_marks(cls, marks):
+        """Build a histogram from any iterable of marks."""
+        histogram = cls()
+        histogram.update(marks)
+        return histogram
+
+    def add(self, mark, count=1):
+        if mark != int(mark) or not 0 <= mark <= 100:
+            raise ValueError(f"Marks must be whole numbers from 0 to 100, got {mark}")
+        self.counts[int(mark)] += count
+
+    def update(self, marks):
+        """Add many marks; counting is done in C by Counter."""
+        for mark, count in Counter(marks).items():
+            self.add(mark, count)
+        return self
+
+    def merge(self, other):
+        """Add another histogram's counts to this one (e.g. another shard or term)."""
+        for mark, count in enumerate(other.counts):
+            self.counts[mark] += count
+        return self
+
+    @property
+    def total(self):
+        return sum(self.counts)
+
+    @property
+    def minimum(self):
+        return next((mark for mark, count in enumerate(self.counts) if count), None)
+
+    @property
+    def maximum(self):
+        return next((mark for mark in range(BUCKETS - 1, -1, -1) if self.counts[mark]), None)
+
+    def mean(self):
+        total = self.total
+        return sum(mark * count for mark, count in enumerate(self.counts)) / total if total else None
+
+    def _value_at(self, rank):
+        """Mark of the student at a 0-based position in sorted order."""
+        seen = 0
+        for mark, count in enumerate(self.counts):
+            seen += count
+            if seen > rank:
+                return mark
+        raise IndexError(rank)
+
+    def percentile(self, p):
+        """
+        Exact p-th percentile (0-100), interpolating between neighbouring
+        students the same way as numpy.percentile's default method.
+        """
+        total = self.total
+        if not total:
+            return None
+        position = (total - 1) * p / 100
+        lower = int(position)
+        low_value = self._value_at(lower)
+        if position == lower:
+            return low_value
+        high_value = self._value_at(lower + 1)
+        return low_value + (high_value - low_value) * (position - lower)
+
+    def median(self):
+        return self.percentile(50)
+
+    def quartiles(self):
+        """Return (Q1, median, Q3)."""
+        return self.percentile(25), self.percentile(50), self.percentile(75)
+
+    def grade_counts(self, bands=GRADE_BANDS):
+        """Number of students in each grade band, best grade first."""
+        counts = {}
+        upper = BUCKETS
+        for i, (lower, grade) in enumerate(bands):
+            # Marks below the lowest bound still get the lowest grade
+            start = max(0, math.ceil(lower)) if i < len(bands) - 1 else 0
+            counts[grade] = sum(self.counts[start:upper])
+            upper = start
+        return counts
+
+    def bins(self, width=10):
+        """
+        Histogram with fixed-width bins.
+
+        Returns:
+            list: (first mark, last mark, count) per bin; the last bin includes 100
+        """
+        result = []
+        for start in range(0, BUCKETS - 1, width):
+            end = start + width
+            if end >= BUCKETS - 1:
+                end = BUCKETS
+            result.append((start, end - 1, sum(self.counts[start:end])))
+            if end == BUCKETS:
+                break
+        return result
+
+    def __eq__(self, other):
+        return isinstance(other, MarkHistogram) and self.counts == other.counts
+
+    def __repr__(self):
+        return f"MarkHistogram(total={self.total})"
+
+
+def subject_histograms(students):
+    """
+    Build one histogram per subject, reading each column once.
+
+    A column with fractional marks (e.g. 85.5) is counted at the whole mark
+    below each one, so percentiles and grade counts for it are approximate.
+
+    Args:
+        students (dict or MarksTable): {'StudentName': [marks...]}
+
+    Returns:
+        dict: {subject: MarkHistogram}
+    """
+    subjects = subjects_of(students)
+    if isinstance(students, MarksTable):
+        columns = students.columns
+    else:
+        columns = list(zip(*students.values())) or [() for _ in subjects]
+    histograms = {}
+    for subject, column in zip(subjects, columns):
+        try:
+            histograms[subject] = MarkHistogram.from_marks(column)
+        except ValueError:
+            histograms[subject] = MarkHistogram.from_marks(map(int, column))
+    return histograms
+
+
+def merge_histograms(*histogram_sets):
+    """Merge several {subject: MarkHistogram} dicts into a new one."""
+    merged = {}
+    for histograms in histogram_sets:
+        for subject, histogram in histograms.items():
+            merged.setdefault(subject, MarkHistogram()).merge(histogram)
+    return merged
+
+
+def distribution_summary(histograms, bands=GRADE_BANDS):
+    """
+    Rows for a per-subject distribution table.
+
+    Returns:
+        list: One {'Subject', 'Q1', 'Median', 'Q3', <grade>...} dict per subject
+    """
+    rows = []
+    for subject, histogram in histograms.items():
+        q1, median, q3 = histogram.quartiles()
+        row = {'Subject': subject, 'Q1': q1, 'Median': median, 'Q3': q3}
+        row.update(histogram.grade_counts(bands))
+        rows.append(row)
+    return rows
@@ -0,0 +1,184 @@
+"""
+Streaming analyzer for Student Marks Analyzer.
+Consumes a roster one student at a time (from any iterator or a CSV file) and
+keeps only running aggregates, so very large exam exports are analyzed in
+bounded memory.
+"""
+
+import csv
+import sys
+
+from marks_table import DEFAULT_SUBJECTS, PASS_MARK
+
+
+def _parse_mark(value):
+    """Convert a CSV cell to an int mark, or a float if it has decimals."""
+    value = value.strip()
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+class RunningAnalysis:
+    """
+    Running totals for a roster seen one student at a time.
+
+    Only the failed names, per-subject sums and the current toppers are kept;
+    individual students are not stored.
+    """
+
+    def __init__(self, subjects=DEFAULT_SUBJECTS, pass_mark=PASS_MARK):
+        self.subjects = tuple(subjects)
+        self.pass_mark = pass_mark
+        self.student_count = 0
+        self.failed_students = []
+        self.subject_totals = [0] * len(self.subjects)
+        self.average_total = 0
+        self.class_topper = ''
+        self.highest_average = 0
+        self.subject_toppers = [''] * len(self.subjects)
+        self.subject_highest = [0] * len(self.subjects)
+
+    def add(self, student_name, marks):
+        """Fold one student's marks into the running totals."""
+        if len(marks) != len(self.subjects):
+            raise ValueError(f"{student_name} has {len(marks)} marks, expected {len(self.subjects)}")
+
+        self.student_count += 1
+
+        # Check for failing students (marks below 40)
+        if min(marks) < self.pass_mark:
+            self.failed_students.append(student_name)
+
+        average = sum(marks) / len(marks)
+        self.average_total += average
+
+        # Strict comparisons keep the first student with the highest score
+        if average > self.highest_average:
+            self.highest_average = average
+            self.class_topper = student_name
+
+        for i, mark in enumerate(marks):
+            self.subject_totals[i] += mark
+            if mark > self.subject_highest[i]:
+                self.subject_highest[i] = mark
+                self.subject_toppers[i] = student_name
+
+    def update(self, rows):
+        """Fold every (name, marks) pair from an iterable."""
+        for student_name, marks in rows:
+            self.add(student_name, marks)
+        return self
+
+    def merge(self, other):
+        """
+        Combine totals from a later part of the same roster into this one.
+
+        Partials must be merged in roster order so that ties still go to the
+        first student, as they do when the whole roster is read in one pass.
+        """
+        if other.subjects != self.subjects:
+            raise ValueError("Cannot merge analyses with different subjects")
+
+        self.student_count += other.student_count
+        self.failed_students.extend(other.failed_students)
+        self.average_total += other.average_total
+        if other.highest_average > self.highest_average:
+            self.highest_average = other.highest_average
+            self.class_topper = other.class_topper
+
+        for i in range(len(self.subjects)):
+            self.subject_totals[i] += other.subject_totals[i]
+            if other.subject_highest[i] > self.subject_highest[i]:
+                self.subject_highest[i] = other.subject_highest[i]
+                self.subject_toppers[i] = other.subject_toppers[i]
+        return self
+
+    def summary(self):
+        """
+        Summarize the students seen so far.
+
+        Returns:
+            dict: The usual results keys except the per-student sections
+                  ('all_students', 'student_averages'), plus counts and averages
+        """
+        count = self.student_count
+        return {
+            'student_count': count,
+            'failed_students': list(self.failed_students),
+            'class_topper': self.class_topper,
+            'top_average': round(self.highest_average, 2),
+            'class_average': round(self.average_total / count, 2) if count else 0,
+            'subject_toppers': dict(zip(self.subjects, self.subject_toppers)),
+            'subject_averages': {
+                subject: round(total / count, 2) if count else 0
+                for subject, total in zip(self.subjects, self.subject_totals)
+            }
+        }
+
+
+def iter_csv_rows(source, subjects=None, name_column='Name'):
+    """
+    Yield (name, marks) pairs from a CSV roster without loading it all.
+
+    The first row is the header: the name column plus one column per subject.
+
+    Args:
+        source: Path to a CSV file, or an open text file
+        subjects (sequence): Subject columns to read; defaults to every
+                             column other than the name column
+        name_column (str): Header of the column holding student names
+
+    Yields:
+        tuple: (student name, list of marks in subject order)
+    """
+    if isinstance(source, str):
+        with open(source, newline='', encoding='utf-8') as f:
+            yield from iter_csv_rows(f, subjects, name_column)
+        return
+
+    reader = csv.reader(source)
+    header = [column.strip() for column in next(reader)]
+    name_index = header.index(name_column)
+    if subjects is None:
+        subjects = [column for column in header if column != name_column]
+    indexes = [header.index(subject) for subject in subjects]
+
+    for row in reader:
+        if not row:
+            continue
+        yield row[name_index].strip(), [_parse_mark(row[i]) for i in indexes]
+
+
+def csv_subjects(path, name_column='Name'):
+    """Read the subject names from a CSV roster's header row."""
+    with open(path, newline='', encoding='utf-8') as f:
+        header = [column.strip() for column in next(csv.reader(f))]
+    return [column for column in header if column != name_column]
+
+
+def analyze_stream(rows, subjects=DEFAULT_SUBJECTS, pass_mark=PASS_MARK):
+    """Analyze an iterable of (name, marks) pairs in constant memory."""
+    return RunningAnalysis(subjects, pass_mark).update(rows).summary()
+
+
+def analyze_csv(path, subjects=None, name_column='Name', pass_mark=PASS_MARK):
+    """Analyze a CSV roster row by row."""
+    if subjects is None:
+        subjects = csv_subjects(path, name_column)
+    return analyze_stream(iter_csv_rows(path, subjects, name_column), subjects, pass_mark)
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python streaming_analyzer.py ROSTER.csv")
+        sys.exit(1)
+
+    from student_marks_analyzer import display_analysis
+
+    display_analysis(analyze_csv(sys.argv[1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,21 @@
 import streamlit as st
 import os
-import pandas as pd
 from auth import create_user, verify_user, load_users
 from auth import load_users as _load_users_internal, get_verify_token, set_verified
 from auth import regenerate_verify_token
-from db import ensure_schema, insert_user
-from email_utils import send_verification_email
+from bitmap_index import BitmapIndex
+from grading import DEFAULT_SCALE, GradeScale
+from ranking import student_ranks
+from results_cache import cached_analysis, roster_digest
+from results_query import ResultsQuery
+from widgets import failed_alert, get_custom_data, incremental_results, paged_positions
 
-def analyze_student_marks(students):
-    """Analyze student marks and provide comprehensive analysis."""
-    
-    results = {
-        'failed_students': [],
-        'student_averages': {},
-        'class_topper': '',
-        'subject_toppers': {'Math': '', 'Science': '', 'English': ''}
-    }
-    
-    subject_highest = {'Math': 0, 'Science': 0, 'English': 0}
-    highest_average = 0
-    
-    for student_name, marks in students.items():
-        math, science, english = marks
-        
-        # Check for failing students (marks below 40)
-        if math < 40 or science < 40 or english < 40:
-            results['failed_students'].append(student_name)
-        
-        # Calculate average marks
-        average = (math + science + english) / 3
-        results['student_averages'][student_name] = round(average, 2)
-        
-        # Track class topper (highest average)
-        if average > highest_average:
-            highest_average = average
-            results['class_topper'] = student_name
-        
-        # Track subject-wise toppers
-        if math > subject_highest['Math']:
-            subject_highest['Math'] = math
-            results['subject_toppers']['Math'] = student_name
-        
-        if science > subject_highest['Science']:
-            subject_highest['Science'] = science
-            results['subject_toppers']['Science'] = student_name
-        
-        if english > subject_highest['English']:
-            subject_highest['English'] = english
-            results['subject_toppers']['English'] = student_name
-    
-    return results
+# pandas (dataframes, roster_import), pyarrow (arrow_loader), mysql-connector (db)
+# and requests/dotenv (email_utils) are imported where they are first needed, so
+# the login page renders without loading them
+
+# Large rosters are shown a page at a time; this caps the matches sent in full
+MATCHES_SHOWN = 500
 
 def _ensure_session_state():
     if "authenticated" not in st.session_state:
@@ -89,6 +55,7 @@ def _render_auth():
                         if set_verified(username):
                             st.success("Email verified successfully!")
                             try:
+                                from db import ensure_schema, insert_user
                                 if ensure_schema():
                                     insert_user(
                                         username,
@@ -106,6 +73,7 @@ def _render_auth():
                 if 'resend' in locals() and resend:
                     new_token = regenerate_verify_token(username) or record.get("verify_token") or ""
                     if record.get("email"):
+                        from email_utils import send_verification_email
                         ok = send_verification_email(record.get("email"), username, new_token)
                         if ok:
                             st.info("A new verification code has been sent to your email.")
@@ -175,6 +143,7 @@ def _render_auth():
                         st.session_state["username"] = username
                         # Optional: Try persisting to MySQL if env is configured
                         try:
+                            from db import ensure_schema, insert_user
                             if ensure_schema():
                                 # Fetch salt/hash from JSON store to keep single source of truth
                                 record = _load_users_internal().get(username)
@@ -197,6 +166,7 @@ def _render_auth():
                         # Send verification email if email provided
                         if email:
                             token = get_verify_token(username) or ""
+                            from email_utils import send_verification_email
                             sent = send_verification_email(email, username, token)
                             if sent:
                                 st.info("Verification code sent to your email. Check your inbox.")
@@ -300,7 +270,7 @@ def main():
     # Option to use sample data or custom data
     data_option = st.sidebar.selectbox(
         "Choose data source:",
-        ["Sample Data", "Custom Input"]
+        ["Sample Data", "Custom Input", "Upload Parquet"]
     )
     
     if data_option == "Sample Data":
@@ -312,39 +282,106 @@ def main():
         }
         st.sidebar.success("Using sample data")
         
+    elif data_option == "Upload Parquet":
+        students = get_uploaded_data()
+        
     else:
         students = get_custom_data()
     
+    scale = get_grade_scale()
+    
     # Main analysis
     if students:
-        results = analyze_student_marks(students)
-        display_analysis(results, students)
+        # One hash of the roster keys every cached result and table below
+        digest = roster_digest(students)
+        if data_option == "Custom Input":
+            results = incremental_results(students)
+            tables = None
+        else:
+            # Unchanged rosters are read back from the results cache
+            tables = analyze_cached(digest, students)
+            results = tables['results']
+        display_analysis(results, students, tables, scale, digest)
+    
+@st.cache_resource(max_entries=8, show_spinner=False)
+def analyze_cached(digest, _students):
+    """Results and summary tables for a roster, kept in memory across reruns"""
+    return cached_analysis(_students, key=digest)
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def roster_views(digest, _students, _results, _tables):
+    """
+    Tables and indexes that depend only on the roster, built once per digest.
     
-def get_custom_data():
-    """Get custom student data from user input"""
-    st.sidebar.subheader("Add Students")
+    Reruns with the same marks reuse these objects, so they must not be
+    modified by the caller.
+    """
+    from dataframes import summary_dataframe
     
-    students = {}
+    averages = _results['student_averages']
+    return {
+        'class_average': sum(averages.values()) / len(averages),
+        'ranks': student_ranks(_students),
+        'failed': frozenset(_results['failed_students']),
+        'summary': summary_dataframe(_students, _tables and _tables['subject_stats']),
+        'query': ResultsQuery(_students, _results)
+    }
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def graded_views(digest, bands, _students, _tables):
+    """Bitmap index and distribution table for a roster under one grade scale"""
+    from dataframes import distribution_dataframe
+    
+    scale = GradeScale(bands)
+    cached = _tables['distribution'] if _tables and scale == DEFAULT_SCALE else None
+    return {
+        'index': BitmapIndex.from_students(_students, bands=bands),
+        'distribution': distribution_dataframe(_students, cached, scale)
+    }
+
+def get_uploaded_data():
+    """Load a roster from an uploaded Parquet file, reading only the columns needed"""
+    from arrow_loader import pyarrow_available, read_parquet
     
-    # Number of students
-    num_students = st.sidebar.number_input("Number of students:", min_value=1, max_value=20, value=4)
+    if not pyarrow_available():
+        st.sidebar.error("Parquet upload requires pyarrow: pip install pyarrow")
+        return None
     
-    # Input fields for each student
-    for i in range(num_students):
-        st.sidebar.markdown(f"### Student {i+1}")
-        
-        name = st.sidebar.text_input(f"Name {i+1}:", key=f"name_{i}")
-        math = st.sidebar.number_input(f"Math {i+1}:", min_value=0, max_value=100, value=85, key=f"math_{i}")
-        science = st.sidebar.number_input(f"Science {i+1}:", min_value=0, max_value=100, value=90, key=f"science_{i}")
-        english = st.sidebar.number_input(f"English {i+1}:", min_value=0, max_value=100, value=78, key=f"english_{i}")
-        
-        if name:  # Only add if name is provided
-            students[name] = [math, science, english]
+    uploaded = st.sidebar.file_uploader("Parquet roster:", type=["parquet"])
+    if uploaded is None:
+        st.sidebar.info("Upload a file with a Name column and one column per subject")
+        return None
+    
+    name_column = st.sidebar.text_input("Name column:", value="Name")
+    subjects_text = st.sidebar.text_input("Subjects (comma-separated, blank for all):", value="")
+    subjects = [subject.strip() for subject in subjects_text.split(",") if subject.strip()] or None
     
+    try:
+        students = read_parquet(uploaded, subjects, name_column)
+    except ValueError as e:
+        st.sidebar.error(f"Could not read roster: {e}")
+        return None
+    
+    st.sidebar.success(f"Loaded {len(students)} students")
     return students
 
-def display_analysis(results, students):
+def get_grade_scale():
+    """Grade bands for this school, e.g. "A+=90, A=80, B=70, C=60, D=50, F=0" """
+    text = st.sidebar.text_input("Grade bands:", value=str(DEFAULT_SCALE), key="grade_bands")
+    try:
+        return GradeScale.parse(text)
+    except ValueError as e:
+        st.sidebar.error(f"Invalid grade bands, using the default: {e}")
+        return DEFAULT_SCALE
+
+def display_analysis(results, students, tables=None, scale=DEFAULT_SCALE, digest=None):
     """Display analysis results in Streamlit format"""
+    from dataframes import averages_page_dataframe, marks_page_dataframe
+    
+    # Derived tables come from the cache unless the marks have changed
+    digest = digest or roster_digest(students)
+    views = roster_views(digest, students, results, tables)
+    graded = graded_views(digest, scale.bands, students, tables)
     
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -356,8 +393,7 @@ def display_analysis(results, students):
         st.metric("Failed Students", len(results['failed_students']))
     
     with col3:
-        class_avg = sum(results['student_averages'].values()) / len(results['student_averages'])
-        st.metric("Class Average", f"{class_avg:.2f}%")
+        st.metric("Class Average", f"{views['class_average']:.2f}%")
     
     with col4:
         top_avg = results['student_averages'][results['class_topper']]
@@ -368,24 +404,31 @@ def display_analysis(results, students):
     # Student marks table
     st.subheader("📊 Student Marks Table")
     
-    # Create DataFrame for display
-    data = []
-    for name, marks in students.items():
-        data.append({
-            'Student': name,
-            'Math': marks[0],
-            'Science': marks[1],
-            'English': marks[2],
-            'Average': results['student_averages'][name],
-            'Status': '❌ Failed' if name in results['failed_students'] else '✅ Passed'
-        })
-    
-    df = pd.DataFrame(data)
-    st.dataframe(df, width='stretch')
+    # One page of marks with class and subject ranks
+    positions = paged_positions(views['query'], "marks")
+    st.dataframe(marks_page_dataframe(views['query'], positions, views['failed'], views['ranks']), width='stretch')
     
     # Failed students alert
-    if results['failed_students']:
-        st.error(f"⚠️ Students who failed: {', '.join(results['failed_students'])}")
+    failed_alert(results['failed_students'])
+    
+    # Compound pass/fail and grade queries over the bitmap index
+    with st.expander("🔎 Find Students"):
+        index = graded['index']
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            failed = st.multiselect("Failed in:", index.subjects, key="query_failed")
+        with col2:
+            passed = st.multiselect("Passed in:", [s for s in index.subjects if s not in failed], key="query_passed")
+        with col3:
+            grades = st.multiselect("Average grade:", index.grades, key="query_grades")
+        
+        if failed or passed or grades:
+            matches = index.query(failed, passed, grades)
+            names = index.names_of(matches)
+            st.write(f"**{len(names)}** matching students")
+            st.dataframe({'Student': names[:MATCHES_SHOWN]}, width='stretch')
+            if len(names) > MATCHES_SHOWN:
+                st.caption(f"Showing the first {MATCHES_SHOWN}")
     
     st.markdown("---")
     
@@ -403,49 +446,18 @@ def display_analysis(results, students):
     with col2:
         st.subheader("📊 Performance Summary")
         
-        # Create summary DataFrame
-        summary_data = []
-        for subject in ['Math', 'Science', 'English']:
-            marks = [students[name][['Math', 'Science', 'English'].index(subject)] for name in students.keys()]
-            summary_data.append({
-                'Subject': subject,
-                'Average': sum(marks) / len(marks),
-                'Highest': max(marks),
-                'Lowest': min(marks)
-            })
+        st.dataframe(views['summary'], width='stretch')
         
-        summary_df = pd.DataFrame(summary_data)
-        st.dataframe(summary_df, width='stretch')
+        # Median, quartiles and grade counts from per-subject histograms
+        st.subheader("📐 Subject Distribution")
+        st.dataframe(graded['distribution'], width='stretch')
     
     # All student averages
     st.subheader("📈 All Student Averages")
     
-    avg_data = []
-    for name, avg in results['student_averages'].items():
-        avg_data.append({
-            'Student': name,
-            'Average': avg,
-            'Grade': get_grade(avg)
-        })
-    
-    avg_df = pd.DataFrame(avg_data)
-    avg_df = avg_df.sort_values('Average', ascending=False)
-    st.dataframe(avg_df, width='stretch')
-
-def get_grade(average):
-    """Convert average to grade"""
-    if average >= 90:
-        return "A+"
-    elif average >= 80:
-        return "A"
-    elif average >= 70:
-        return "B"
-    elif average >= 60:
-        return "C"
-    elif average >= 50:
-        return "D"
-    else:
-        return "F"
+    # Sorted indexes answer sorting, score ranges and paging without re-sorting
+    positions = paged_positions(views['query'], "averages")
+    st.dataframe(averages_page_dataframe(views['query'], positions, scale), width='stretch')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,79 +1,18 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from dataframes import (averages_page_dataframe, box_dataframe, distribution_dataframe,
+                        histogram_dataframe, marks_dataframe, marks_page_dataframe, summary_dataframe)
+from marks_table import as_marks_table
+from ranking import student_ranks, top_k_scores
+from results_cache import cached_analysis, roster_digest
+from results_query import ResultsQuery
+from sketches import MarkHistogram, subject_histograms
+from widgets import FAILED_SHOWN, failed_alert, get_custom_data, incremental_results, paged_positions
 
-def analyze_student_marks(students):
-    """
-    Analyze student marks and provide comprehensive analysis.
-    
-    Args:
-        students (dict): Dictionary with student names as keys and lists of marks as values
-                         Format: {'StudentName': [Math, Science, English]}
-    
-    Returns:
-        dict: Analysis results containing all required information
-    """
-    
-    # Initialize results dictionary
-    results = {
-        'all_students': [],
-        'failed_students': [],
-        'student_averages': {},
-        'class_topper': '',
-        'subject_toppers': {
-            'Math': '',
-            'Science': '',
-            'English': ''
-        }
-    }
-    
-    # Track highest marks for each subject
-    subject_highest = {'Math': 0, 'Science': 0, 'English': 0}
-    highest_average = 0
-    
-    # Analyze each student
-    for student_name, marks in students.items():
-        math, science, english = marks
-        
-        # Store student information
-        student_info = {
-            'name': student_name,
-            'marks': {
-                'Math': math,
-                'Science': science,
-                'English': english
-            }
-        }
-        results['all_students'].append(student_info)
-        
-        # Check for failing students (marks below 40)
-        if math < 40 or science < 40 or english < 40:
-            results['failed_students'].append(student_name)
-        
-        # Calculate average marks
-        average = (math + science + english) / 3
-        results['student_averages'][student_name] = round(average, 2)
-        
-        # Track class topper (highest average)
-        if average > highest_average:
-            highest_average = average
-            results['class_topper'] = student_name
-        
-        # Track subject-wise toppers
-        if math > subject_highest['Math']:
-            subject_highest['Math'] = math
-            results['subject_toppers']['Math'] = student_name
-        
-        if science > subject_highest['Science']:
-            subject_highest['Science'] = science
-            results['subject_toppers']['Science'] = student_name
-        
-        if english > subject_highest['English']:
-            subject_highest['English'] = english
-            results['subject_toppers']['English'] = student_name
-    
-    return results
+# Plotly is imported by the chart functions, so it only loads when the Charts tab is opened
+
+# Above this many students the charts switch from one bar per student to distributions
+CHART_STUDENT_LIMIT = 50
+WEBGL_POINT_LIMIT = 50_000
 
 def main():
     st.set_page_config(
@@ -108,58 +47,62 @@ def main():
     
     # Main analysis
     if students:
-        results = analyze_student_marks(students)
-        display_streamlit_analysis(results, students)
-    
-def get_custom_data():
-    """Get custom student data from user input"""
-    st.sidebar.subheader("Add Students")
-    
-    students = {}
-    
-    # Number of students
-    num_students = st.sidebar.number_input("Number of students:", min_value=1, max_value=20, value=4)
-    
-    # Input fields for each student
-    for i in range(num_students):
-        st.sidebar.markdown(f"### Student {i+1}")
-        
-        name = st.sidebar.text_input(f"Name {i+1}:", key=f"name_{i}")
-        math = st.sidebar.number_input(f"Math {i+1}:", min_value=0, max_value=100, value=85, key=f"math_{i}")
-        science = st.sidebar.number_input(f"Science {i+1}:", min_value=0, max_value=100, value=90, key=f"science_{i}")
-        english = st.sidebar.number_input(f"English {i+1}:", min_value=0, max_value=100, value=78, key=f"english_{i}")
-        
-        if name:  # Only add if name is provided
-            students[name] = [math, science, english]
-    
-    return students
+        if data_option == "Sample Data":
+            # Unchanged rosters are read back from the results cache
+            tables = cached_analysis(students)
+            results = tables['results']
+        else:
+            results = incremental_results(students)
+            tables = None
+        display_streamlit_analysis(results, students, tables)
+    
+@st.cache_resource(max_entries=8, show_spinner=False)
+def roster_views(digest, _students, _results):
+    """Sorted indexes, ranks and failures for a roster, built once per digest"""
+    return {
+        'query': ResultsQuery(_students, _results),
+        'ranks': student_ranks(_students),
+        'failed': frozenset(_results['failed_students']),
+        'histograms': subject_histograms(_students),
+        'average_histogram': MarkHistogram.from_marks(map(int, _results['student_averages'].values()))
+    }
 
-def display_streamlit_analysis(results, students):
+def display_streamlit_analysis(results, students, tables=None):
     """Display analysis results in Streamlit format"""
     
-    # Create tabs for different views
-    tab1, tab2, tab3, tab4 = st.tabs(["📋 Overview", "📊 Charts", "📈 Analysis", "🎯 Details"])
+    views = roster_views(roster_digest(students), students, results)
+    
+    # Create tabs for different views; only the open tab runs where Streamlit supports it
+    labels = ["📋 Overview", "📊 Charts", "📈 Analysis", "🎯 Details"]
+    try:
+        tab1, tab2, tab3, tab4 = st.tabs(labels, key="analysis_tab", on_change="rerun")
+    except TypeError:  # older Streamlit runs every tab on each rerun
+        tab1, tab2, tab3, tab4 = st.tabs(labels)
     
     with tab1:
-        display_overview(results, students)
+        if getattr(tab1, 'open', True):
+            display_overview(results, views)
     
     with tab2:
-        display_charts(results, students)
+        if getattr(tab2, 'open', True):
+            display_charts(results, students, views)
     
     with tab3:
-        display_analysis_tab(results, students)
+        if getattr(tab3, 'open', True):
+            display_analysis_tab(results, students, tables)
     
     with tab4:
-        display_details(results)
+        if getattr(tab4, 'open', True):
+            display_details(results, views)
 
-def display_overview(results, students):
+def display_overview(results, views):
     """Display overview of results"""
     
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Students", len(students))
+        st.metric("Total Students", len(views['query'].names))
     
     with col2:
         st.metric("Failed Students", len(results['failed_students']))
@@ -177,40 +120,53 @@ def display_overview(results, students):
     # Student marks table
     st.subheader("📊 Student Marks Table")
     
-    # Create DataFrame for display
-    data = []
-    for name, marks in students.items():
-        data.append({
-            'Student': name,
-            'Math': marks[0],
-            'Science': marks[1],
-            'English': marks[2],
-            'Average': results['student_averages'][name],
-            'Status': '❌ Failed' if name in results['failed_students'] else '✅ Passed'
-        })
-    
-    df = pd.DataFrame(data)
-    st.dataframe(df, use_container_width=True)
+    # One page of marks with class and subject ranks
+    positions = paged_positions(views['query'], "marks")
+    st.dataframe(marks_page_dataframe(views['query'], positions, views['failed'], views['ranks']), use_container_width=True)
     
     # Failed students alert
-    if results['failed_students']:
-        st.error(f"⚠️ Students who failed: {', '.join(results['failed_students'])}")
+    failed_alert(results['failed_students'])
 
-def display_charts(results, students):
+def display_charts(results, students, views):
     """Display interactive charts"""
+    import plotly.graph_objects as go
+    
+    table = as_marks_table(students)
+    if len(table) > CHART_STUDENT_LIMIT:
+        display_distribution_charts(table, views)
+    else:
+        display_student_charts(results, table)
+    
+    # Chart 3: Radar chart for top 3 students
+    st.subheader("🎯 Performance Radar Chart (Top 3)")
+    
+    # Get top 3 students by average
+    top_3 = top_k_scores(results['student_averages'], 3)
+    
+    fig_radar = go.Figure()
+    
+    for name, avg in top_3:
+        marks = table[name]
+        fig_radar.add_trace(go.Scatterpolar(
+            r=marks + [marks[0]],  # Close the shape
+            theta=list(table.subjects) + [table.subjects[0]],
+            fill='toself',
+            name=name
+        ))
+    
+    fig_radar.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        showlegend=True,
+        height=400
+    )
+    st.plotly_chart(fig_radar, use_container_width=True)
+
+def display_student_charts(results, table):
+    """One bar per student, for classes small enough to read them"""
+    import plotly.express as px
     
     # Prepare data for charts
-    data = []
-    for name, marks in students.items():
-        data.append({
-            'Student': name,
-            'Math': marks[0],
-            'Science': marks[1],
-            'English': marks[2],
-            'Average': results['student_averages'][name]
-        })
-    
-    df = pd.DataFrame(data)
+    df = marks_dataframe(results, table)
     
     # Chart 1: Subject-wise comparison
     st.subheader("📈 Subject-wise Performance")
@@ -218,7 +174,7 @@ def display_charts(results, students):
     fig_subjects = px.bar(
         df, 
         x='Student', 
-        y=['Math', 'Science', 'English'],
+        y=list(table.subjects),
         title="Marks by Subject",
         barmode='group'
     )
@@ -238,32 +194,70 @@ def display_charts(results, students):
     )
     fig_avg.update_layout(height=400)
     st.plotly_chart(fig_avg, use_container_width=True)
+
+def display_distribution_charts(table, views):
+    """Binned counts and quartiles computed on the server, for large rosters"""
+    import plotly.express as px
+    import plotly.graph_objects as go
     
-    # Chart 3: Radar chart for top 3 students
-    st.subheader("🎯 Performance Radar Chart (Top 3)")
-    
-    # Get top 3 students by average
-    top_3 = sorted(results['student_averages'].items(), key=lambda x: x[1], reverse=True)[:3]
+    st.caption(f"{len(table)} students: showing distributions instead of one bar per student")
+    histograms = views['histograms']
     
-    fig_radar = go.Figure()
+    # Chart 1: Students per mark range in each subject
+    st.subheader("📈 Subject-wise Performance")
     
-    for name, avg in top_3:
-        marks = students[name]
-        fig_radar.add_trace(go.Scatterpolar(
-            r=marks + [marks[0]],  # Close the shape
-            theta=['Math', 'Science', 'English', 'Math'],
-            fill='toself',
-            name=name
+    bins = next(iter(histograms.values())).bins(10)
+    fig_heatmap = go.Figure(go.Heatmap(
+        z=[[count for _, _, count in histogram.bins(10)] for histogram in histograms.values()],
+        x=[f"{first}-{last}" for first, last, _ in bins],
+        y=list(histograms),
+        colorscale='RdYlGn',
+        colorbar=dict(title="Students")
+    ))
+    fig_heatmap.update_layout(title="Students per Mark Range", xaxis_title="Marks", height=400)
+    st.plotly_chart(fig_heatmap, use_container_width=True)
+    
+    # Box plots from quartiles, without sending every mark
+    boxes = box_dataframe(histograms)
+    fig_box = go.Figure()
+    for row in boxes.itertuples(index=False):
+        fig_box.add_trace(go.Box(
+            name=row.Subject, x=[row.Subject],
+            lowerfence=[row.Min], q1=[row.Q1], median=[row.Median], q3=[row.Q3], upperfence=[row.Max]
         ))
+    fig_box.update_layout(title="Marks Spread by Subject", yaxis=dict(range=[0, 100]), showlegend=False, height=400)
+    st.plotly_chart(fig_box, use_container_width=True)
     
-    fig_radar.update_layout(
-        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-        showlegend=True,
-        height=400
+    # Chart 2: Distribution of averages
+    st.subheader("🏆 Average Marks Comparison")
+    
+    averages_df = histogram_dataframe({'Average': views['average_histogram']}, width=5)
+    fig_avg = px.bar(
+        averages_df,
+        x='Marks',
+        y='Students',
+        title="Students per Average Range",
+        color='Students',
+        color_continuous_scale='RdYlGn'
     )
-    st.plotly_chart(fig_radar, use_container_width=True)
+    fig_avg.update_layout(height=400)
+    st.plotly_chart(fig_avg, use_container_width=True)
+    
+    # Every student as a WebGL point, thinned to a fixed budget
+    if st.checkbox("Plot every student (WebGL)", key="charts_webgl"):
+        query = views['query']
+        step = max(1, -(-len(table) // WEBGL_POINT_LIMIT))
+        fig_points = go.Figure()
+        for subject, column in zip(table.subjects, table.columns):
+            fig_points.add_trace(go.Scattergl(
+                x=query.averages[::step].tolist(), y=column[::step].tolist(),
+                mode='markers', marker=dict(size=3, opacity=0.4), name=subject
+            ))
+        title = "Subject Marks against Average" + (f" (every {step}th student)" if step > 1 else "")
+        fig_points.update_layout(title=title, xaxis_title="Average", yaxis_title="Marks", height=500)
+        st.plotly_chart(fig_points, use_container_width=True)
 
-def display_analysis_tab(results, students):
+def display_analysis_tab(results, students, tables=None):
     """Display detailed analysis"""
     
     col1, col2 = st.columns(2)
@@ -280,19 +274,14 @@ def display_analysis_tab(results, students):
         st.subheader("📊 Performance Summary")
         
         # Create summary DataFrame
-        summary_data = []
-        for subject in ['Math', 'Science', 'English']:
-            marks = [students[name][['Math', 'Science', 'English'].index(subject)] for name in students.keys()]
-            summary_data.append({
-                'Subject': subject,
-                'Average': sum(marks) / len(marks),
-                'Highest': max(marks),
-                'Lowest': min(marks)
-            })
-        
-        summary_df = pd.DataFrame(summary_data)
+        summary_df = summary_dataframe(students, tables and tables['subject_stats'])
         st.dataframe(summary_df, use_container_width=True)
         
+        # Median, quartiles and grade counts from per-subject histograms
+        st.subheader("📐 Subject Distribution")
+        distribution_df = distribution_dataframe(students, tables and tables['distribution'])
+        st.dataframe(distribution_df, use_container_width=True)
+        
         # Class statistics
         st.subheader("📈 Class Statistics")
         averages = list(results['student_averages'].values())
@@ -300,7 +289,7 @@ def display_analysis_tab(results, students):
         st.metric("Highest Average", f"{max(averages):.2f}%")
         st.metric("Lowest Average", f"{min(averages):.2f}%")
 
-def display_details(results):
+def display_details(results, views):
     """Display detailed breakdown"""
     
     st.subheader("📋 Detailed Breakdown")
@@ -308,46 +297,24 @@ def display_details(results):
     # Failed students details
     if results['failed_students']:
         st.error("### ❌ Failed Students")
-        for student in results['failed_students']:
+        failed = results['failed_students']
+        for student in failed[:FAILED_SHOWN]:
             st.write(f"**{student}** - Needs attention")
+        if len(failed) > FAILED_SHOWN:
+            st.write(f"...and {len(failed) - FAILED_SHOWN} more")
     
     # All student averages
     st.subheader("📊 All Student Averages")
     
-    avg_data = []
-    for name, avg in results['student_averages'].items():
-        avg_data.append({
-            'Student': name,
-            'Average': avg,
-            'Grade': get_grade(avg)
-        })
-    
-    avg_df = pd.DataFrame(avg_data)
-    avg_df = avg_df.sort_values('Average', ascending=False)
-    st.dataframe(avg_df, use_container_width=True)
+    # Sorted indexes answer sorting, score ranges and paging without re-sorting
+    positions = paged_positions(views['query'], "averages")
+    st.dataframe(averages_page_dataframe(views['query'], positions), use_container_width=True)
     
     # Subject analysis
     st.subheader("📚 Subject Analysis")
     
-    subjects = ['Math', 'Science', 'English']
-    for subject in subjects:
-        topper = results['subject_toppers'][subject]
+    for subject, topper in results['subject_toppers'].items():
         st.write(f"**{subject} Topper**: {topper}")
 
-def get_grade(average):
-    """Convert average to grade"""
-    if average >= 90:
-        return "A+"
-    elif average >= 80:
-        return "A"
-    elif average >= 70:
-        return "B"
-    elif average >= 60:
-        return "C"
-    elif average >= 50:
-        return "D"
-    else:
-        return "F"
-
 if __name__ == "__main__":
     main()
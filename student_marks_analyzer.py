@@ -1,206 +1,143 @@
-<<<<<<< HEAD
-def analyze_student_marks(students):
-
-    # Initialize results dictionary
-    results = {
-        'all_students': [],
-        'failed_students': [],
-        'student_averages': {},
-        'class_topper': '',
-        'subject_toppers': {
-            'Math': '',
-            'Science': '',
-            'English': ''
-        }
-    }
-    
-    # Track highest marks for each subject
-    subject_highest = {'Math': 0, 'Science': 0, 'English': 0}
-    highest_average = 0
-    
-    # Analyze each student
-    for student_name, marks in students.items():
-        math, science, english = marks
-        
-        # Store student information
-        student_info = {
-            'name': student_name,
-            'marks': {
-                'Math': math,
-                'Science': science,
-                'English': english
-            }
-        }
-        results['all_students'].append(student_info)
-        
-        # Check for failing students (marks below 40)
-        if math < 40 or science < 40 or english < 40:
-            results['failed_students'].append(student_name)
-        
-        # Calculate average marks
-        average = (math + science + english) / 3
-        results['student_averages'][student_name] = round(average, 2)
-        
-        # Track class topper (highest average)
-        if average > highest_average:
-            highest_average = average
-            results['class_topper'] = student_name
-        
-        # Track subject-wise toppers
-        if math > subject_highest['Math']:
-            subject_highest['Math'] = math
-            results['subject_toppers']['Math'] = student_name
-        
-        if science > subject_highest['Science']:
-            subject_highest['Science'] = science
-            results['subject_toppers']['Science'] = student_name
-        
-        if english > subject_highest['English']:
-            subject_highest['English'] = english
-            results['subject_toppers']['English'] = student_name
-    
-    return results
-
-def display_analysis(results):
- 
-    print("=" * 60)
-    print("STUDENT MARKS ANALYZER")
-    print("=" * 60)
-    
-    # Display all students and their marks
-    print("\n ALL STUDENTS AND THEIR MARKS:")
-    print("-" * 40)
-    for student in results['all_students']:
-        print(f"{student['name']}: Math={student['marks']['Math']}, "
-              f"Science={student['marks']['Science']}, English={student['marks']['English']}")
-    
-    # Display failed students
-    print(f"\n  STUDENTS WHO FAILED ANY SUBJECT (Marks < 40):")
-    print("-" * 50)
-    if results['failed_students']:
-        for student in results['failed_students']:
-            print(f"• {student}")
-    else:
-        print("• No students failed any subject!")
-    
-    # Display average marks for each student
-    print(f"\n AVERAGE MARKS FOR EACH STUDENT:")
-    print("-" * 40)
-    for student_name, average in results['student_averages'].items():
-        print(f"{student_name}: {average}%")
-    
-    # Display class topper
-    print(f"\n CLASS TOPPER (Highest Average):")
-    print("-" * 35)
-    print(f"• {results['class_topper']} with {results['student_averages'][results['class_topper']]}% average")
-    
-    # Display subject-wise toppers
-    print(f"\n SUBJECT-WISE TOPPERS:")
-    print("-" * 25)
-    for subject, topper in results['subject_toppers'].items():
-        print(f"• {subject}: {topper}")
-    
-    print("\n" + "=" * 60)
-
-def main():
-    # Sample input data
-    students = {
-        'Alice': [85, 90, 78],
-        'Bob': [72, 88, 91],
-        'Charlie': [95, 85, 89],
-        'David': [35, 65, 70] 
-    }
-    
-    print("Student Marks Analyzer - Analysis Results")
-    print("Sample Data Used:")
-    for name, marks in students.items():
-        print(f"  {name}: {marks}")
-    
-    # Analysis
-    results = analyze_student_marks(students)
-    
-    # Display results
-    display_analysis(results)
-
-if __name__ == "__main__":
-    main()
-cd "d:\Cogniquest py\Student marks analyzer"
-git init
-=======
-def analyze_student_marks(students):
-
-    # Initialize results dictionary
-    results = {
-        'all_students': [],
-        'failed_students': [],
-        'student_averages': {},
-        'class_topper': '',
-        'subject_toppers': {
-            'Math': '',
-            'Science': '',
-            'English': ''
-        }
-    }
-    
-    # Track highest marks for each subject
-    subject_highest = {'Math': 0, 'Science': 0, 'English': 0}
-    highest_average = 0
-    
-    # Analyze each student
-    for student_name, marks in students.items():
-        math, science, english = marks
-        
-        # Store student information
-        student_info = {
-            'name': student_name,
-            'marks': {
-                'Math': math,
-                'Science': science,
-                'English': english
-            }
-        }
-        results['all_students'].append(student_info)
-        
+import argparse
+from collections.abc import Mapping
+from operator import indexOf
+
+from bitmap_index import BitmapIndex
+from marks_table import PASS_MARK, MarksTable, subjects_of
+from ranking import AVERAGE, student_ranks, top_k_scores
+
+
+class LazyResults(Mapping):
+    """
+    Analysis results that are computed section by section on first access.
+
+    Reads like the results dictionary (results['failed_students'] and so on),
+    but a section such as 'all_students' is only built if someone asks for
+    it, and is then kept for later lookups. The roster is read when a section
+    is first computed, so it should not be changed while the results are in use.
+
+    Engines that work out some sections another way pass them as computed;
+    those are returned as given and the rest are still built on demand.
+    """
+
+    SECTIONS = ('all_students', 'failed_students', 'student_averages', 'class_topper', 'subject_toppers')
+
+    def __init__(self, students, subjects, pass_mark=PASS_MARK, computed=None):
+        self._students = students
+        self._subjects = tuple(subjects)
+        self._pass_mark = pass_mark
+        self._cache = dict(computed or {})
+        self._raw_averages = None
+        self._name_list = None
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            if key not in self.SECTIONS:
+                raise KeyError(key)
+            self._cache[key] = getattr(self, '_compute_' + key)()
+        return self._cache[key]
+
+    def __contains__(self, key):
+        # Checking for a section must not compute it
+        return key in self.SECTIONS
+
+    def __iter__(self):
+        return iter(self.SECTIONS)
+
+    def __len__(self):
+        return len(self.SECTIONS)
+
+    def __repr__(self):
+        return f"LazyResults(students={len(self._students)}, computed={list(self._cache)})"
+
+    def to_dict(self):
+        """Compute every section and return a plain results dictionary."""
+        return {key: self[key] for key in self.SECTIONS}
+
+    def _names(self):
+        if self._name_list is None:
+            students = self._students
+            self._name_list = students.names if isinstance(students, MarksTable) else list(students)
+        return self._name_list
+
+    def _columns(self):
+        students = self._students
+        if isinstance(students, MarksTable):
+            return students.columns
+        return list(zip(*students.values())) or [() for _ in self._subjects]
+
+    def _averages(self):
+        # Unrounded averages, shared by 'student_averages' and 'class_topper'
+        if self._raw_averages is None:
+            self._raw_averages = [sum(marks) / len(marks) for marks in self._students.values()]
+        return self._raw_averages
+
+    def _compute_all_students(self):
+        subjects = self._subjects
+        return [
+            {'name': name, 'marks': dict(zip(subjects, marks))}
+            for name, marks in self._students.items()
+        ]
+
+    def _compute_failed_students(self):
         # Check for failing students (marks below 40)
-        if math < 40 or science < 40 or english < 40:
-            results['failed_students'].append(student_name)
-        
-        # Calculate average marks
-        average = (math + science + english) / 3
-        results['student_averages'][student_name] = round(average, 2)
-        
-        # Track class topper (highest average)
-        if average > highest_average:
-            highest_average = average
-            results['class_topper'] = student_name
-        
-        # Track subject-wise toppers
-        if math > subject_highest['Math']:
-            subject_highest['Math'] = math
-            results['subject_toppers']['Math'] = student_name
-        
-        if science > subject_highest['Science']:
-            subject_highest['Science'] = science
-            results['subject_toppers']['Science'] = student_name
-        
-        if english > subject_highest['English']:
-            subject_highest['English'] = english
-            results['subject_toppers']['English'] = student_name
-    
-    return results
+        pass_mark = self._pass_mark
+        return [name for name, marks in self._students.items() if min(marks) < pass_mark]
+
+    def _compute_student_averages(self):
+        return dict(zip(self._names(), [round(average, 2) for average in self._averages()]))
+
+    def _first_highest(self, scores):
+        # First student with the highest score wins; nobody wins with 0
+        if not scores:
+            return ''
+        best = max(scores)
+        return self._names()[indexOf(scores, best)] if best > 0 else ''
 
-def display_analysis(results):
+    def _compute_class_topper(self):
+        return self._first_highest(self._averages())
+
+    def _compute_subject_toppers(self):
+        return {
+            subject: self._first_highest(column)
+            for subject, column in zip(self._subjects, self._columns())
+        }
+
+
+def analyze_student_marks(students, subjects=None, pass_mark=PASS_MARK):
+
+    # Subjects come from the roster itself when it carries a schema
+    if subjects is None:
+        subjects = subjects_of(students)
+
+    # Tables are rectangular by construction; plain dicts are checked up front
+    if not isinstance(students, MarksTable):
+        for student_name, marks in students.items():
+            if len(marks) != len(subjects):
+                raise ValueError(f"{student_name} has {len(marks)} marks, expected {len(subjects)}")
+
+    # Each section is worked out the first time it is read
+    return LazyResults(students, subjects, pass_mark)
+
+def display_analysis(results, leaderboard=0, ranks=False):
  
     print("=" * 60)
     print("STUDENT MARKS ANALYZER")
     print("=" * 60)
     
+    # Streamed summaries carry counts instead of per-student sections
+    per_student = 'all_students' in results
+    
     # Display all students and their marks
-    print("\n ALL STUDENTS AND THEIR MARKS:")
-    print("-" * 40)
-    for student in results['all_students']:
-        print(f"{student['name']}: Math={student['marks']['Math']}, "
-              f"Science={student['marks']['Science']}, English={student['marks']['English']}")
+    if per_student:
+        print("\n ALL STUDENTS AND THEIR MARKS:")
+        print("-" * 40)
+        for student in results['all_students']:
+            marks = ", ".join(f"{subject}={mark}" for subject, mark in student['marks'].items())
+            print(f"{student['name']}: {marks}")
+    else:
+        print(f"\n STUDENTS ANALYZED: {results['student_count']}")
+        print(f" CLASS AVERAGE: {results['class_average']}%")
     
     # Display failed students
     print(f"\n  STUDENTS WHO FAILED ANY SUBJECT (Marks < 40):")
@@ -212,15 +149,30 @@ def display_analysis(results):
         print("• No students failed any subject!")
     
     # Display average marks for each student
-    print(f"\n AVERAGE MARKS FOR EACH STUDENT:")
-    print("-" * 40)
-    for student_name, average in results['student_averages'].items():
-        print(f"{student_name}: {average}%")
+    if per_student:
+        print(f"\n AVERAGE MARKS FOR EACH STUDENT:")
+        print("-" * 40)
+        for student_name, average in results['student_averages'].items():
+            print(f"{student_name}: {average}%")
+        top_average = results['student_averages'][results['class_topper']]
+    else:
+        top_average = results['top_average']
+    
+    # Display the top students by average, if asked for
+    if leaderboard and per_student:
+        print(f"\n TOP {leaderboard} STUDENTS (By Average):")
+        print("-" * 35)
+        for rank, (student_name, average) in enumerate(top_k_scores(results['student_averages'], leaderboard), 1):
+            print(f"{rank}. {student_name}: {average}%")
+    
+    # Display every student's class and subject ranks, if asked for
+    if ranks and per_student:
+        display_ranks(results)
     
     # Display class topper
     print(f"\n CLASS TOPPER (Highest Average):")
     print("-" * 35)
-    print(f"• {results['class_topper']} with {results['student_averages'][results['class_topper']]}% average")
+    print(f"• {results['class_topper']} with {top_average}% average")
     
     # Display subject-wise toppers
     print(f"\n SUBJECT-WISE TOPPERS:")
@@ -230,7 +182,47 @@ def display_analysis(results):
     
     print("\n" + "=" * 60)
 
+def display_ranks(results):
+    """Print the class ranking with each student's dense rank, percentile and subject ranks"""
+    students = {student['name']: list(student['marks'].values()) for student in results['all_students']}
+    if not students:
+        return
+    subjects = list(results['all_students'][0]['marks'])
+    ranked = student_ranks(MarksTable.from_dict(students, subjects))
+    names = list(students)
+    overall = ranked[AVERAGE]
+    
+    print(f"\n CLASS RANKING (By Average):")
+    print("-" * 35)
+    for i in sorted(range(len(names)), key=overall['competition'].__getitem__):
+        subject_ranks = ", ".join(f"{subject} #{ranked[subject]['competition'][i]}" for subject in subjects)
+        print(f"{overall['competition'][i]}. {names[i]}: {results['student_averages'][names[i]]}% "
+              f"(dense {overall['dense'][i]}, percentile {overall['percentile'][i]}; {subject_ranks})")
+
+def display_query(index, failed=(), passed=(), grades=()):
+    """Print the students matching a compound pass/fail and grade query"""
+    conditions = [f"failed {subject}" for subject in failed]
+    conditions += [f"passed {subject}" for subject in passed]
+    if grades:
+        conditions.append(f"graded {' or '.join(grades)}")
+    
+    matches = index.names_of(index.query(failed, passed, grades))
+    print(f"\n STUDENTS WHO {' AND '.join(conditions).upper()}:")
+    print("-" * 40)
+    if matches:
+        for student in matches:
+            print(f"• {student}")
+    else:
+        print("• No students match")
+
 def main():
+    parser = argparse.ArgumentParser(description="Analyze the sample class")
+    parser.add_argument('--failed', nargs='+', default=[], metavar='SUBJECT', help="list students who failed these subjects")
+    parser.add_argument('--passed', nargs='+', default=[], metavar='SUBJECT', help="...and passed these subjects")
+    parser.add_argument('--grade', nargs='+', default=[], metavar='GRADE', help="...with an average in any of these grades")
+    parser.add_argument('--ranks', action='store_true', help="show every student's class and subject ranks")
+    args = parser.parse_args()
+    
     # Sample input data
     students = {
         'Alice': [85, 90, 78],
@@ -239,19 +231,31 @@ def main():
         'David': [35, 65, 70] 
     }
     
+    # Compound queries are answered from the bitmap index; check their
+    # subjects and grades before printing anything
+    index = None
+    if args.failed or args.passed or args.grade:
+        index = BitmapIndex.from_students(students)
+        unknown = [subject for subject in args.failed + args.passed if subject not in index.subjects]
+        unknown += [grade for grade in args.grade if grade not in index.grades]
+        if unknown:
+            parser.error(f"unknown subject or grade: {', '.join(unknown)}")
+    
     print("Student Marks Analyzer - Analysis Results")
     print("Sample Data Used:")
     for name, marks in students.items():
         print(f"  {name}: {marks}")
     
-    # Analysis
-    results = analyze_student_marks(students)
+    # Analysis, read back from the results cache when this class was seen before
+    # (the cache's engines import this module, so load it here)
+    from results_cache import cached_analysis
+    results = cached_analysis(students)['results']
     
     # Display results
-    display_analysis(results)
+    display_analysis(results, ranks=args.ranks)
+    
+    if index is not None:
+        display_query(index, args.failed, args.passed, args.grade)
 
 if __name__ == "__main__":
     main()
-cd "d:\Cogniquest py\Student marks analyzer"
-git init
->>>>>>> 0a3fb8d (Initial commit: Student Marks Analyzer project)
@@ -157,6 +157,23 @@ def demonstrate_function_usage():
     total_average = sum(results['student_averages'].values()) / len(results['student_averages'])
     print(f"Class average: {total_average:.2f}%")
 
+def test_results_sections_are_computed_on_demand():
+    """Only the sections that are read get computed."""
+    students = {
+        'John': [85, 90, 88],
+        'Sarah': [92, 87, 91],
+        'Mike': [35, 75, 80]
+    }
+    
+    results = analyze_student_marks(students)
+    assert results['class_topper'] == 'Sarah'
+    assert 'all_students' in results
+    assert 'all_students' not in repr(results)
+    
+    assert results['failed_students'] == ['Mike']
+    assert results['all_students'][2] == {'name': 'Mike', 'marks': {'Math': 35, 'Science': 75, 'English': 80}}
+    assert results.to_dict()['student_averages'] == {'John': 87.67, 'Sarah': 90.0, 'Mike': 63.33}
+
 if __name__ == "__main__":
     test_different_data_sets()
     demonstrate_function_usage()
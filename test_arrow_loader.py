@@ -0,0 +1,85 @@
+"""
+Tests for Parquet/Arrow roster loading.
+"""
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from arrow_loader import read_parquet, table_from_arrow  # noqa: E402
+from marks_table import MarksTable, StudentTable  # noqa: E402
+from results_cache import ResultsCache, cached_analysis  # noqa: E402
+from student_marks_analyzer import analyze_student_marks  # noqa: E402
+
+STUDENTS = {
+    'Alice': [85, 90, 78],
+    'Bob': [72, 88, 91],
+    'Charlie': [95, 85, 89],
+    'David': [35, 65, 70]
+}
+
+
+def roster(**extra):
+    columns = {'Name': list(STUDENTS)}
+    for j, subject in enumerate(('Math', 'Science', 'English')):
+        columns[subject] = [marks[j] for marks in STUDENTS.values()]
+    columns.update(extra)
+    return pa.table(columns)
+
+
+def test_parquet_reads_only_requested_columns(tmp_path):
+    """Subject columns are pruned and packed into a StudentTable."""
+    path = tmp_path / 'roster.parquet'
+    pq.write_table(roster(Notes=['a', 'b', 'c', 'd'], Art=[50, 60, 70, 80]), path)
+
+    table = read_parquet(path, ['Math', 'Science', 'English'])
+    assert isinstance(table, StudentTable)
+    assert table.to_dict() == STUDENTS
+    assert analyze_student_marks(table) == analyze_student_marks(STUDENTS)
+
+    with pytest.raises(ValueError, match="'Notes' is not a numeric column"):
+        read_parquet(path)
+
+
+def test_sliced_and_chunked_tables():
+    """Arrow offsets and chunk boundaries are respected."""
+    table = pa.concat_tables([roster(), roster()]).slice(2, 4)
+
+    assert list(table_from_arrow(table).items()) == list(STUDENTS.items())[2:] + list(STUDENTS.items())[:2]
+
+
+def test_fractional_marks_fall_back_to_marks_table():
+    table = table_from_arrow(roster(Math=[85.5, 72.0, 95.0, 35.0]))
+
+    assert isinstance(table, MarksTable)
+    assert table['Alice'] == [85.5, 90, 78]
+
+
+def test_fractional_parquet_is_analysed_through_the_cache(tmp_path):
+    """The Upload Parquet path: read, analyse, summarise and cache."""
+    path = tmp_path / 'roster.parquet'
+    pq.write_table(roster(Math=[85.5, 72.0, 95.0, 35.25]), path)
+
+    table = read_parquet(path)
+    payload = cached_analysis(table, cache=ResultsCache(tmp_path / 'cache'))
+    expected = dict(STUDENTS, Alice=[85.5, 90, 78], David=[35.25, 65, 70])
+    assert payload['results'] == analyze_student_marks(expected)
+    assert payload['distribution'][0]['Subject'] == 'Math'
+    assert payload['distribution'][0]['F'] == 1
+
+
+def test_bad_rosters_are_rejected():
+    for bad in (roster(Math=[85, 72, 101, 35]), roster(Math=[85, None, 95, 35]), roster().drop(['Name'])):
+        with pytest.raises(ValueError):
+            table_from_arrow(bad)
+
+
+def test_null_and_nan_marks_are_rejected():
+    """All-null and NaN columns raise ValueError rather than TypeError or slipping through."""
+    all_null = pa.table({'Name': ['a', 'b'], 'Math': pa.array([None, None], pa.int64())})
+    with pytest.raises(ValueError, match="missing marks"):
+        table_from_arrow(all_null)
+
+    with pytest.raises(ValueError, match="not numbers"):
+        table_from_arrow(roster(Math=[85.5, float('nan'), 95.0, 35.0]))
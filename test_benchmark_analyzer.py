@@ -0,0 +1,45 @@
+"""
+Tests for the benchmark suite.
+"""
+
+from collections import Counter
+
+from benchmark_analyzer import compare, load_baseline, make_roster, run_benchmarks, save_baseline
+from marks_table import StudentTable
+
+CASES = ['analyze_student_marks', 'analyze_stream', 'display_analysis']
+
+
+def test_synthetic_rosters_are_reproducible():
+    """The same seed gives the same marks, as a dict or a StudentTable."""
+    roster = make_roster(50, seed=7)
+    compact = make_roster(50, seed=7, compact=True)
+
+    assert roster == make_roster(50, seed=7)
+    assert isinstance(compact, StudentTable)
+    assert compact.to_dict() == roster
+    assert all(0 <= mark <= 100 for marks in roster.values() for mark in marks)
+
+
+def test_synthetic_marks_are_uniform():
+    """Every mark from 0 to 100 is about as likely as any other."""
+    counts = Counter(mark for marks in make_roster(20_000).values() for mark in marks)
+
+    assert sorted(counts) == list(range(101))
+    assert max(counts.values()) < 1.25 * min(counts.values())
+
+
+def test_baseline_round_trip_flags_regressions(tmp_path):
+    """Saved baselines load back and slower runs are reported."""
+    measurements = run_benchmarks([200], CASES, repeat=1, report=None)
+    path = tmp_path / 'baseline.json'
+    save_baseline(measurements, path)
+    baseline = load_baseline(path)
+
+    assert [entry['case'] for entry in baseline['results']] == CASES
+    assert all(entry['peak_bytes'] > 0 for entry in baseline['results'])
+    assert not any(row['regressed'] for row in compare(measurements, baseline))
+
+    for entry in baseline['results']:
+        entry['seconds'] /= 2
+    assert all(row['regressed'] for row in compare(measurements, baseline))
@@ -0,0 +1,56 @@
+"""
+Tests for the failure and grade-band bitmap index.
+Every query is checked against a scan of the marks.
+"""
+
+import random
+
+import pytest
+
+from bitmap_index import BitmapIndex
+from marks_table import MarksTable, StudentTable
+from student_marks_analyzer import analyze_student_marks
+
+STUDENTS = {
+    'Alice': [85, 90, 78],
+    'Bob': [72, 38, 91],
+    'Charlie': [95, 85, 89],
+    'David': [35, 25, 70]
+}
+
+
+def test_compound_queries():
+    index = BitmapIndex.from_students(STUDENTS)
+
+    assert index.names_of(index.query(failed=['Math', 'Science'], passed=['English'])) == ['David']
+    assert index.names_of(index.query(failed=['Science'])) == ['Bob', 'David']
+    assert index.names_of(index.query(grades=['A+', 'A'])) == ['Alice', 'Charlie']
+    assert index.names_of(index.failed_any()) == analyze_student_marks(STUDENTS)['failed_students']
+    assert index.count(index.band('F')) == 1
+
+
+def test_random_rosters_match_scans():
+    """Dicts, float tables and StudentTables all index the same way."""
+    rng = random.Random(9)
+    students = {f"S{i}": [rng.choice([0, 39, 40, 100, rng.randint(0, 100)]) for _ in range(3)] for i in range(700)}
+    fractional = dict(students, S0=[39.5, 40.5, 89.99])
+
+    for roster in (students, StudentTable.from_dict(students), MarksTable.from_dict(fractional)):
+        index = BitmapIndex.from_students(roster)
+        expected = [name for name, marks in roster.items() if marks[0] < 40 and marks[2] >= 40]
+        assert index.names_of(index.query(failed=['Math'], passed=['English'])) == expected
+        for grade, lower, upper in (('A+', 90, 101), ('C', 60, 70), ('F', 0, 50)):
+            expected = [name for name, marks in roster.items() if lower <= round(sum(marks) / 3, 2) < upper]
+            assert index.names_of(index.band(grade)) == expected
+
+
+def test_unknown_query_names_fail_before_the_report(monkeypatch, capsys):
+    import student_marks_analyzer
+
+    monkeypatch.setattr('sys.argv', ['student_marks_analyzer.py', '--failed', 'Art'])
+    with pytest.raises(SystemExit) as error:
+        student_marks_analyzer.main()
+
+    out, err = capsys.readouterr()
+    assert error.value.code == 2 and out == ''
+    assert 'unknown subject or grade: Art' in err
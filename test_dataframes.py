@@ -0,0 +1,57 @@
+"""
+Tests for the shared table and chart-data builders.
+"""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from dataframes import (box_dataframe, distribution_dataframe, histogram_dataframe,  # noqa: E402
+                        marks_dataframe, marks_page_dataframe)
+from marks_table import MarksTable  # noqa: E402
+from ranking import student_ranks  # noqa: E402
+from results_query import ResultsQuery  # noqa: E402
+from sketches import subject_histograms  # noqa: E402
+from student_marks_analyzer import analyze_student_marks  # noqa: E402
+
+STUDENTS = {
+    'Alice': [85, 90, 78],
+    'Bob': [72, 88, 91],
+    'Charlie': [95, 85, 89],
+    'David': [35, 65, 70]
+}
+
+
+def test_marks_page_matches_full_table():
+    """A page holds the same rows as the full table, in the page's order."""
+    results = analyze_student_marks(STUDENTS)
+    query = ResultsQuery(STUDENTS, results)
+    positions, total = query.page_positions(page=1, page_size=2)
+    page = marks_page_dataframe(query, positions, set(results['failed_students']), student_ranks(STUDENTS))
+
+    full = marks_dataframe(results, STUDENTS).set_index('Student')
+    assert total == 4 and list(page['Student']) == ['Charlie', 'Alice']
+    page = page.set_index('Student')
+    assert page[full.columns].to_dict() == full.loc[['Charlie', 'Alice']].to_dict()
+    assert list(page['Rank']) == [1, 2] and list(page['Math Rank']) == [1, 2]
+    assert list(page['Status']) == ['✅ Passed', '✅ Passed']
+
+
+def test_chart_data_is_binned_on_the_server():
+    histograms = subject_histograms(STUDENTS)
+    bins = histogram_dataframe(histograms)
+    assert len(bins) == 3 * 10
+    assert bins.groupby('Subject')['Students'].sum().to_dict() == {'Math': 4, 'Science': 4, 'English': 4}
+    assert bins[(bins.Subject == 'Math') & (bins.Marks == '90-100')]['Students'].item() == 1
+
+    boxes = box_dataframe(histograms).set_index('Subject')
+    assert boxes.loc['Math'].to_dict() == {'Min': 35, 'Q1': 62.75, 'Median': 78.5, 'Q3': 87.5, 'Max': 95}
+
+
+def test_fractional_marks_are_charted_at_whole_marks():
+    table = MarksTable(['Math'], ['Alice', 'Bob'], [[85.5, 40.25]])
+    assert subject_histograms(table)['Math'].counts[85] == 1
+
+    uploaded = dict(STUDENTS, Alice=[85.5, 90, 78])
+    distribution = distribution_dataframe(uploaded).set_index('Subject')
+    assert distribution.loc['Math', 'A'] == 1 and distribution['F'].sum() == 1
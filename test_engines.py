@@ -0,0 +1,67 @@
+"""
+Tests for the analysis engine registry.
+"""
+
+import os
+
+import pytest
+
+import engines
+from benchmark_analyzer import make_roster
+from engines import ENGINE_VARIABLE, analyze_roster, available_engines, select_engine
+from student_marks_analyzer import analyze_student_marks
+from vectorized_analyzer import numpy_available
+
+
+def test_engine_chosen_by_size(monkeypatch):
+    monkeypatch.delenv(ENGINE_VARIABLE, raising=False)
+
+    assert select_engine(make_roster(10)).name == 'python'
+    if numpy_available():
+        assert select_engine(make_roster(1000)).name == 'vectorized'
+
+
+def test_auto_mode_reaches_every_threshold(monkeypatch):
+    """Each engine is picked above its own min_size, whatever the registration order."""
+    monkeypatch.delenv(ENGINE_VARIABLE, raising=False)
+    monkeypatch.setattr(os, 'cpu_count', lambda: 4)
+    small, medium, large = make_roster(10), make_roster(1000), dict.fromkeys(range(200_000))
+
+    monkeypatch.setattr(engines, 'numpy_available', lambda: True)
+    assert [select_engine(roster).name for roster in (small, medium, large)] == ['python', 'vectorized', 'vectorized']
+
+    monkeypatch.setattr(engines, 'numpy_available', lambda: False)
+    assert [select_engine(roster).name for roster in (small, medium, large)] == ['python', 'python', 'sharded']
+    assert select_engine(small, engine='sharded').name == 'sharded'
+
+    monkeypatch.setattr(os, 'cpu_count', lambda: 1)
+    assert select_engine(large).name == 'python'
+
+
+def test_auto_mode_results_are_lazy():
+    """Reading the headline sections does not build the per-student ones."""
+    results = analyze_roster(make_roster(1000, seed=2))
+    expected = analyze_student_marks(make_roster(1000, seed=2))
+
+    assert results['class_topper'] == expected['class_topper']
+    assert results['failed_students'] == expected['failed_students']
+    assert 'all_students' not in repr(results)
+    assert 'student_averages' not in repr(results)
+
+
+def test_every_engine_gives_the_same_results():
+    students = make_roster(300, seed=4)
+    expected = analyze_student_marks(students)
+
+    for name in available_engines():
+        assert analyze_roster(students, engine=name) == expected
+
+
+def test_override_by_argument_or_environment(monkeypatch):
+    monkeypatch.setenv(ENGINE_VARIABLE, 'python')
+    assert select_engine(make_roster(1000)).name == 'python'
+    for name in available_engines():
+        assert select_engine(make_roster(10), engine=name).name == name
+
+    with pytest.raises(ValueError):
+        select_engine(make_roster(10), engine='gpu')
@@ -0,0 +1,52 @@
+"""
+Tests for configurable grade bands.
+"""
+
+import random
+
+import pytest
+
+import grading
+from grading import DEFAULT_SCALE, GradeScale, get_grade
+from sketches import MarkHistogram
+
+
+def ladder(average):
+    """The if/elif ladder the apps used before grade scales."""
+    if average >= 90:
+        return "A+"
+    elif average >= 80:
+        return "A"
+    elif average >= 70:
+        return "B"
+    elif average >= 60:
+        return "C"
+    elif average >= 50:
+        return "D"
+    return "F"
+
+
+def test_default_scale_matches_the_old_ladder(monkeypatch):
+    rng = random.Random(1)
+    averages = [round(rng.uniform(0, 100), 2) for _ in range(2000)] + [0, 49.99, 50, 89.99, 90, 100]
+    expected = [ladder(average) for average in averages]
+
+    assert [get_grade(average) for average in averages] == expected
+    for numpy in (grading.np, None):
+        monkeypatch.setattr(grading, 'np', numpy)
+        assert DEFAULT_SCALE.grade_all(averages) == expected
+        assert DEFAULT_SCALE.counts(averages) == {grade: expected.count(grade) for grade in DEFAULT_SCALE.grades}
+
+
+def test_school_scales_are_parsed_and_applied():
+    scale = GradeScale.parse("Merit=70, Pass=40, Distinction=85")
+
+    assert scale.grades == ('Distinction', 'Merit', 'Pass')
+    assert scale.grade_all([90, 70, 45, 12]) == ['Distinction', 'Merit', 'Pass', 'Pass']
+    assert GradeScale.parse(str(scale)) == scale
+    assert MarkHistogram.from_marks([90, 70, 45, 12]).grade_counts(scale.bands) == {
+        'Distinction': 1, 'Merit': 1, 'Pass': 2
+    }
+    for bad in ("A+90", "=90", "A=90, B=90"):
+        with pytest.raises(ValueError):
+            GradeScale.parse(bad)
@@ -0,0 +1,50 @@
+"""
+Tests for group-by analysis.
+Every group is checked against analyzing that group's slice of the roster.
+"""
+
+import random
+
+import pytest
+
+from group_analyzer import analyze_group_levels, analyze_groups
+from student_marks_analyzer import analyze_student_marks
+
+STUDENTS = {
+    'Alice': [85, 90, 78],
+    'Bob': [72, 88, 91],
+    'Charlie': [95, 85, 89],
+    'David': [35, 65, 70]
+}
+SECTIONS = {'Alice': '5A', 'Bob': '5B', 'Charlie': '5A', 'David': '5B'}
+
+
+def test_groups_match_analyzing_each_slice():
+    rng = random.Random(11)
+    students = {f"S{i}": [rng.choice([0, 39, 100, rng.randint(0, 100)]) for _ in range(3)] for i in range(500)}
+    sections = {name: f"{rng.randint(1, 3)}{rng.choice('ABC')}" for name in students}
+
+    levels = analyze_group_levels(students, {'section': sections, 'grade': lambda name: sections[name][0]})
+
+    for level, key_of in (('section', sections.get), ('grade', lambda name: sections[name][0])):
+        for key, summary in levels[level].items():
+            group = {name: marks for name, marks in students.items() if key_of(name) == key}
+            results = analyze_student_marks(group)
+            assert summary['student_count'] == len(group)
+            assert summary['failed_students'] == results['failed_students']
+            assert summary['class_topper'] == results['class_topper']
+            assert summary['subject_toppers'] == results['subject_toppers']
+
+
+def test_groups_in_order_of_first_appearance():
+    groups = analyze_groups(STUDENTS, SECTIONS)
+
+    assert list(groups) == ['5A', '5B']
+    assert groups['5A']['class_topper'] == 'Charlie'
+    assert groups['5B']['failed_students'] == ['David']
+    assert groups['5B']['subject_averages'] == {'Math': 53.5, 'Science': 76.5, 'English': 80.5}
+
+
+def test_missing_group_is_reported():
+    with pytest.raises(KeyError, match='David'):
+        analyze_groups(STUDENTS, {'Alice': '5A', 'Bob': '5B', 'Charlie': '5A'})
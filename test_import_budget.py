@@ -0,0 +1,29 @@
+"""
+Tests for the import-time budget check.
+"""
+
+import pytest
+
+from import_budget import DEFERRED, check, loaded, parse_importtime, subtree
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | site
+import time:       900 |        900 |     numpy.core
+import time:       400 |       1300 |   numpy
+import time:        50 |         50 |   pandas_helpers
+import time:       200 |       1550 | app
+"""
+
+
+def test_report_is_parsed_into_the_module_subtree():
+    entries = subtree(parse_importtime(REPORT), 'app')
+    assert [name for name, _, _, _ in entries] == ['numpy.core', 'numpy', 'pandas_helpers', 'app']
+    assert entries[-1][2] == 1.55
+    assert loaded(entries, ('numpy', 'pandas', 'site')) == ['numpy']
+
+
+def test_streamlit_app_defers_heavy_imports():
+    """The login page loads without pandas, pyarrow, plotly, MySQL or the email client."""
+    pytest.importorskip("streamlit")
+    assert check('streamlit_app', budget_ms=float('inf'), deferred=DEFERRED['streamlit_app']) == []
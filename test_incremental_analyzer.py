@@ -0,0 +1,85 @@
+"""
+Tests for the incremental analyzer.
+Every change is checked against a full re-analysis of the same roster.
+"""
+
+import random
+
+from incremental_analyzer import IncrementalAnalyzer
+from student_marks_analyzer import analyze_student_marks
+
+
+def test_random_edits_match_full_analysis():
+    """Adds, updates and removals keep results identical to a fresh run."""
+    rng = random.Random(3)
+    students = {}
+    analyzer = IncrementalAnalyzer()
+
+    for step in range(600):
+        action = rng.random()
+        marks = [rng.choice([0, 39, 40, 95, 100, rng.randint(0, 100)]) for _ in range(3)]
+        if action < 0.45 or not students:
+            name = f"Student{step}"
+            students[name] = marks
+            analyzer.add(name, marks)
+        elif action < 0.8:
+            name = rng.choice(list(students))
+            students[name] = marks
+            analyzer.update(name, marks)
+        else:
+            name = rng.choice(list(students))
+            del students[name]
+            analyzer.remove(name)
+
+        assert analyzer.results() == analyze_student_marks(students)
+
+
+def test_topper_recomputed_when_removed_or_downgraded():
+    """The next best student takes over when the topper leaves or drops."""
+    analyzer = IncrementalAnalyzer.from_students({
+        'Alice': [85, 90, 78],
+        'Bob': [72, 88, 91],
+        'Charlie': [95, 85, 89]
+    })
+    assert analyzer.class_topper == 'Charlie'
+
+    analyzer.update('Charlie', [10, 10, 10])
+    assert analyzer.class_topper == 'Alice'
+    assert analyzer.subject_toppers['Math'] == 'Alice'
+    assert analyzer.failed_students == ['Charlie']
+
+    analyzer.remove('Alice')
+    assert analyzer.class_topper == 'Bob'
+    assert analyzer.subject_toppers['Science'] == 'Bob'
+
+
+def test_sync_applies_only_the_differences():
+    """sync() follows a students dict through edits and deletions."""
+    analyzer = IncrementalAnalyzer()
+    students = {'Alice': [85, 90, 78], 'David': [35, 65, 70]}
+    analyzer.sync(students)
+
+    students = {'Alice': [85, 90, 99], 'Eve': [60, 60, 60]}
+    analyzer.sync(students)
+
+    assert 'David' not in analyzer
+    assert analyzer.results() == analyze_student_marks(students)
+
+
+def test_sync_follows_insertions_and_renames():
+    """Ties go to the student who comes first in the synced dict."""
+    analyzer = IncrementalAnalyzer()
+    analyzer.sync({'A': [90, 90, 90], 'B': [50, 50, 50], 'C': [70, 70, 70]})
+
+    # B is renamed to X in place, and X ties with C
+    students = {'A': [90, 90, 90], 'X': [95, 95, 95], 'C': [95, 95, 95]}
+    analyzer.sync(students)
+    assert analyzer.class_topper == 'X'
+    assert analyzer.results() == analyze_student_marks(students)
+    assert list(analyzer.results()['student_averages']) == ['A', 'X', 'C']
+
+    # Later additions still take positions after the reordered roster
+    students = {'Z': [95, 95, 95], **students, 'W': [99, 99, 99]}
+    analyzer.sync(students)
+    assert analyzer.results() == analyze_student_marks(students)
+    assert [row['name'] for row in analyzer.results()['all_students']] == ['Z', 'A', 'X', 'C', 'W']
@@ -0,0 +1,103 @@
+"""
+Tests for the multi-term marks history.
+Every term is checked against a full analysis of that term's snapshot.
+"""
+
+import random
+
+import pytest
+
+from marks_history import MarksHistory
+from student_marks_analyzer import analyze_student_marks
+
+TERM_1 = {
+    'Alice': [85, 90, 78],
+    'Bob': [72, 88, 91],
+    'Charlie': [95, 85, 89],
+    'David': [35, 65, 70]
+}
+
+
+def test_terms_store_only_changes():
+    """Later terms keep just the students whose marks changed."""
+    history = MarksHistory()
+    history.add_term('T1', TERM_1)
+    term_2 = dict(TERM_1, David=[55, 65, 70], Eve=[99, 98, 97])
+    del term_2['Bob']
+    delta = history.add_term('T2', term_2)
+
+    assert delta.changed == {'David': (55, 65, 70), 'Eve': (99, 98, 97)}
+    assert delta.removed == ('Bob',)
+    assert history.terms == ['T1', 'T2']
+    assert history.snapshot('T2') == term_2
+    assert history.class_toppers() == [('T1', 'Charlie'), ('T2', 'Eve')]
+    assert history.student_averages('Bob') == [('T1', 83.67), ('T2', None)]
+    assert history.student_averages('David') == [('T1', 56.67), ('T2', 63.33)]
+    assert history.term_summary('T2')['failed_count'] == 0
+
+
+def test_random_terms_match_full_analysis():
+    rng = random.Random(5)
+    history = MarksHistory()
+    students = {}
+    for term in range(12):
+        for step in range(40):
+            name = f"S{rng.randint(0, 60)}"
+            if rng.random() < 0.2:
+                students.pop(name, None)
+            else:
+                students[name] = [rng.choice([0, 50, 100, rng.randint(0, 100)]) for _ in range(3)]
+        history.add_term(term, students)
+
+        snapshot = history.snapshot(term)
+        assert snapshot == students
+        results = analyze_student_marks(snapshot)
+        assert history.term_summary(term)['class_topper'] == results['class_topper']
+        assert history.term_summary(term)['subject_toppers'] == results['subject_toppers']
+        for name in students:
+            assert history.student_averages(name)[-1] == (term, results['student_averages'][name])
+
+
+def test_term_summaries_follow_roster_order():
+    """Students joining mid-roster break ties as they would in a full analysis."""
+    rng = random.Random(8)
+    history = MarksHistory()
+    history.add_term('T1', {'A': [90, 90, 90], 'B': [50, 50, 50], 'C': [70, 70, 70]})
+    history.add_term('T2', {'A': [90, 90, 90], 'X': [95, 95, 95], 'C': [95, 95, 95]})
+    assert history.class_toppers() == [('T1', 'A'), ('T2', 'X')]
+
+    students = history.snapshot('T2')
+    for term in range(3, 12):
+        names = list(students)
+        for step in range(6):
+            names.insert(rng.randint(0, len(names)), f"S{term}_{step}")
+        if term % 4 == 0:
+            rng.shuffle(names)
+        students = {
+            name: students.get(name) or [rng.choice([60, 95, rng.randint(0, 100)]) for _ in range(3)]
+            for name in names if rng.random() > 0.1
+        }
+        history.add_term(f"T{term}", students)
+
+    for label in history.terms:
+        snapshot = history.snapshot(label)
+        results = analyze_student_marks(snapshot)
+        summary = history.term_summary(label)
+        assert summary['class_topper'] == results['class_topper']
+        assert summary['subject_toppers'] == results['subject_toppers']
+        assert summary['failed_count'] == len(results['failed_students'])
+        assert summary['student_count'] == len(snapshot)
+    assert list(history.snapshot('T11')) == list(students)
+
+
+def test_invalid_changes_are_rejected():
+    history = MarksHistory()
+    history.add_term('T1', TERM_1)
+    with pytest.raises(ValueError):
+        history.add_term('T1', TERM_1)
+    with pytest.raises(ValueError):
+        history.add_changes('T2', {'Alice': [50, 60]})
+    with pytest.raises(KeyError):
+        history.add_changes('T2', removed=['Zed'])
+    with pytest.raises(ValueError):
+        history.add_changes('T2', {'Eve': [50, 60, 70]}, order=['Eve', 'Alice'])
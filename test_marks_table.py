@@ -0,0 +1,74 @@
+"""
+Tests for the columnar marks table and subject-schema support.
+"""
+
+import pickle
+
+import pytest
+
+from marks_table import MarksTable, StudentTable, as_marks_table
+from student_marks_analyzer import analyze_student_marks
+
+STUDENTS = {
+    'Alice': [85, 90, 78, 66, 91, 70],
+    'Bob': [72, 88, 91, 35, 60, 82],
+    'Charlie': [95, 85, 89, 77, 58, 90]
+}
+SUBJECTS = ('Math', 'Science', 'English', 'History', 'Art', 'Music')
+
+
+def test_table_behaves_like_students_dict():
+    """A table can stand in for the {'Name': [marks]} dictionary."""
+    table = MarksTable.from_dict(STUDENTS, SUBJECTS)
+
+    assert len(table) == 3
+    assert list(table) == ['Alice', 'Bob', 'Charlie']
+    assert table['Bob'] == STUDENTS['Bob']
+    assert table.to_dict() == STUDENTS
+    assert list(table.column('History')) == [66, 35, 77]
+    assert as_marks_table(table) is table
+
+
+def test_subject_stats_reads_each_column_once():
+    """Per-subject summary matches the values in each column."""
+    stats = {row['Subject']: row for row in MarksTable.from_dict(STUDENTS, SUBJECTS).subject_stats()}
+
+    assert list(stats) == list(SUBJECTS)
+    assert stats['Art'] == {'Subject': 'Art', 'Average': 209 / 3, 'Highest': 91, 'Lowest': 58}
+
+
+def test_analyzer_uses_table_subjects():
+    """Toppers and failures follow the table's own subject list."""
+    results = analyze_student_marks(MarksTable.from_dict(STUDENTS, SUBJECTS))
+
+    assert list(results['subject_toppers']) == list(SUBJECTS)
+    assert results['subject_toppers']['Music'] == 'Charlie'
+    assert results['failed_students'] == ['Bob']
+    assert results['all_students'][0]['marks']['Art'] == 91
+
+
+def test_wrong_number_of_marks_is_rejected():
+    """Rows that do not match the schema raise a clear error."""
+    with pytest.raises(ValueError):
+        MarksTable.from_dict({'Dan': [50, 60]}, SUBJECTS)
+    with pytest.raises(ValueError):
+        analyze_student_marks({'Dan': [50, 60]})
+
+
+def test_student_table_is_compact_and_equivalent():
+    """StudentTable packs marks into one byte each and analyzes the same."""
+    table = StudentTable.from_dict(STUDENTS, SUBJECTS)
+
+    assert table.buffer.nbytes == len(STUDENTS) * len(SUBJECTS)
+    assert table.to_dict() == STUDENTS
+    assert list(table.column('Art')) == [91, 60, 58]
+    assert [record.name for record in table.records() if record.average > 75] == ['Alice', 'Charlie']
+    assert analyze_student_marks(table) == analyze_student_marks(STUDENTS, SUBJECTS)
+    assert pickle.loads(pickle.dumps(table)).to_dict() == STUDENTS
+
+
+def test_student_table_rejects_out_of_range_marks():
+    """Only whole marks from 0 to 100 fit the uint8 buffer."""
+    for bad in ([50, 60, 101], [50, 60, -1], [50, 60, 75.5]):
+        with pytest.raises(ValueError):
+            StudentTable.from_dict({'Dan': bad})
@@ -0,0 +1,55 @@
+"""
+Tests for process-pool sharded analysis.
+"""
+
+import random
+
+from parallel_analyzer import analyze_sharded, iter_shards, merge_partials
+from streaming_analyzer import RunningAnalysis, analyze_stream
+from student_marks_analyzer import analyze_student_marks
+
+
+def _roster(size, seed=11):
+    rng = random.Random(seed)
+    return {
+        f"Student{i}": [rng.choice([0, 39, 100, rng.randint(0, 100)]) for _ in range(3)]
+        for i in range(size)
+    }
+
+
+def test_merged_partials_match_single_pass():
+    """Merging shard partials in order equals one pass over the roster."""
+    students = _roster(250)
+    partials = [
+        RunningAnalysis().update(zip(names, rows))
+        for names, rows in iter_shards(students, 17)
+    ]
+
+    merged = merge_partials(partials, ('Math', 'Science', 'English'))
+    assert merged.summary() == analyze_stream(students.items())
+
+
+def test_sharded_results_match_loop_analyzer():
+    """The process pool returns the standard results dictionary."""
+    students = _roster(300)
+
+    assert analyze_sharded(students, workers=2, shard_size=40) == analyze_student_marks(students)
+
+
+def test_sharded_rows_are_built_on_demand():
+    """Workers return finished averages; the parent only builds rows when they are read."""
+    students = _roster(120)
+    results = analyze_sharded(students, workers=2, shard_size=25)
+
+    assert 'all_students' not in repr(results)
+    assert 'student_averages' in repr(results)
+    assert results.to_dict() == analyze_student_marks(students).to_dict()
+
+
+def test_sharded_summary_only():
+    """per_student=False skips the per-student sections."""
+    students = _roster(50)
+    summary = analyze_sharded(students, workers=2, per_student=False)
+
+    assert 'all_students' not in summary
+    assert summary['student_count'] == 50
@@ -0,0 +1,71 @@
+"""
+Tests for the heap-based top-K / bottom-K ranking helpers and class ranks.
+"""
+
+from marks_table import StudentTable
+import ranking
+from ranking import bottom_k, rank_scores, student_ranks, top_k, top_k_scores
+from student_marks_analyzer import analyze_student_marks, display_analysis
+
+STUDENTS = {
+    'Alice': [85, 90, 78],
+    'Bob': [72, 88, 91],
+    'Charlie': [95, 85, 89],
+    'David': [35, 65, 70],
+    'Eve': [95, 60, 50]
+}
+
+
+def test_top_and_bottom_by_average():
+    """Leaderboards by average match a full sort."""
+    assert [name for name, _ in top_k(STUDENTS, 'average', 3)] == ['Charlie', 'Alice', 'Bob']
+    assert [name for name, _ in bottom_k(STUDENTS, 'average', 2)] == ['David', 'Eve']
+
+
+def test_top_by_subject_keeps_roster_order_on_ties():
+    """Charlie and Eve both scored 95 in Math; Charlie comes first."""
+    assert top_k(STUDENTS, 'Math', 2) == [('Charlie', 95), ('Eve', 95)]
+    assert top_k(StudentTable.from_dict(STUDENTS), 'Math', 2) == [('Charlie', 95), ('Eve', 95)]
+
+
+def test_top_k_scores_from_results(capsys):
+    """Results averages can be ranked and printed as a console leaderboard."""
+    results = analyze_student_marks(STUDENTS)
+
+    assert top_k_scores(results['student_averages'], 1) == [('Charlie', 89.67)]
+
+    display_analysis(results, leaderboard=2)
+    output = capsys.readouterr().out
+    assert "TOP 2 STUDENTS" in output
+    assert "1. Charlie: 89.67%" in output
+
+
+def test_rank_scores_share_ranks_on_ties():
+    """Dense ranks close the gap after a tie; competition ranks skip it."""
+    ranks = rank_scores([70, 90, 80, 80])
+    assert ranks['dense'] == [3, 1, 2, 2]
+    assert ranks['competition'] == [4, 1, 2, 2]
+    assert ranks['percentile'] == [25.0, 100.0, 75.0, 75.0]
+
+
+def test_rank_scores_python_fallback(monkeypatch):
+    """Without NumPy the ranks are the same."""
+    scores = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+    expected = rank_scores(scores)
+    monkeypatch.setattr(ranking, 'np', None)
+    assert rank_scores(scores) == expected
+    assert rank_scores([]) == {'dense': [], 'competition': [], 'percentile': []}
+
+
+def test_student_ranks_overall_and_per_subject(capsys):
+    """Overall ranks follow averages; Charlie and Eve tie for first in Math."""
+    ranks = student_ranks(StudentTable.from_dict(STUDENTS))
+    assert ranks['average']['competition'] == [2, 3, 1, 5, 4]
+    assert ranks['Math']['competition'] == [3, 4, 1, 5, 1]
+    assert ranks['Math']['dense'] == [2, 3, 1, 4, 1]
+    assert student_ranks(STUDENTS) == ranks
+
+    display_analysis(analyze_student_marks(STUDENTS), ranks=True)
+    output = capsys.readouterr().out
+    assert "CLASS RANKING" in output
+    assert "1. Charlie: 89.67% (dense 1, percentile 100.0; Math #1, Science #3, English #2)" in output
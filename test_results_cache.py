@@ -0,0 +1,102 @@
+"""
+Tests for the content-addressed results cache.
+"""
+
+import json
+import os
+
+import pytest
+
+from marks_table import MarksTable, StudentTable
+from results_cache import ResultsCache, cached_analysis, roster_digest
+from student_marks_analyzer import analyze_student_marks
+
+STUDENTS = {
+    'Alice': [85, 90, 78],
+    'Bob': [72, 88, 91],
+    'Charlie': [95, 85, 89],
+    'David': [35, 65, 70]
+}
+
+
+def test_digest_depends_on_content_not_storage():
+    digest = roster_digest(STUDENTS)
+
+    assert roster_digest(StudentTable.from_dict(STUDENTS)) == digest
+    assert roster_digest(dict(STUDENTS, David=[35, 65, 71])) != digest
+    assert roster_digest(STUDENTS, pass_mark=50) != digest
+    assert roster_digest(dict(STUDENTS, David=[35.5, 65, 70])) != digest
+    assert roster_digest(dict(STUDENTS, David=[35, 65])) != digest
+
+    fractional = dict(STUDENTS, David=[35.5, 65, 70])
+    assert roster_digest(MarksTable.from_dict(STUDENTS)) == digest
+    assert roster_digest(MarksTable.from_dict(fractional)) == roster_digest(fractional)
+
+
+def test_repeat_analysis_is_read_back(tmp_path):
+    """A new cache on the same directory (a restart) hits on disk."""
+    payload = cached_analysis(STUDENTS, cache=ResultsCache(tmp_path))
+    assert payload['results'] == analyze_student_marks(STUDENTS)
+    assert payload['subject_stats'][0]['Subject'] == 'Math'
+
+    restarted = ResultsCache(tmp_path)
+    assert restarted.get(roster_digest(STUDENTS)) == payload
+    assert cached_analysis(StudentTable.from_dict(STUDENTS), cache=restarted) == payload
+
+
+def test_entries_are_stored_as_json(tmp_path):
+    """Cache files hold plain JSON, never anything that runs code when read."""
+    cache = ResultsCache(tmp_path)
+    payload = cached_analysis(STUDENTS, cache=cache)
+    with open(cache._path(roster_digest(STUDENTS)), encoding='utf-8') as f:
+        assert json.load(f) == payload
+
+    with pytest.raises(TypeError):
+        cache.put('bad', {'results': object()})
+    assert cache.get('bad') is None
+
+
+def test_fractional_rosters_are_cached(tmp_path):
+    students = dict(STUDENTS, David=[35.5, 65, 70.25])
+    cache = ResultsCache(tmp_path)
+    first = cached_analysis(students, cache=cache)
+    assert first['results'] == analyze_student_marks(students)
+    assert cached_analysis(students, cache=cache) == first
+    math = first['distribution'][0]
+    assert (math['Subject'], math['Q1'], math['F']) == ('Math', 62.75, 1)
+
+
+def test_precomputed_digest_is_used_as_key(tmp_path):
+    """Callers that already hashed the roster pass the digest instead of rehashing."""
+    cache = ResultsCache(tmp_path)
+    payload = cached_analysis(STUDENTS, cache=cache, key=roster_digest(STUDENTS))
+    assert cached_analysis(STUDENTS, cache=cache) is payload
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResultsCache(tmp_path, memory_entries=0)
+    for key in 'abc':
+        cache.put(key, 'x' * 1000)
+        os.utime(cache._path(key), (ord(key), ord(key)))
+    cache.get('a')
+    cache.max_bytes = 2 * cache.size() // 3
+    cache.evict()
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+
+
+def test_console_analyzer_uses_the_cache(tmp_path, monkeypatch, capsys):
+    """The console CLI stores its analysis, so a second run is a cache hit."""
+    import results_cache
+    import student_marks_analyzer
+
+    monkeypatch.setenv(results_cache.CACHE_VARIABLE, str(tmp_path))
+    monkeypatch.setattr(results_cache, '_default_cache', None)
+    monkeypatch.setattr('sys.argv', ['student_marks_analyzer.py'])
+    student_marks_analyzer.main()
+
+    assert [entry[2] for entry in results_cache.default_cache().entries()] == [
+        str(tmp_path / (roster_digest(STUDENTS) + '.json'))
+    ]
+    assert 'Charlie with 89.67% average' in capsys.readouterr().out
@@ -0,0 +1,63 @@
+"""
+Tests for the sorted-index query layer.
+Every query is checked against sorting and filtering the results directly.
+"""
+
+import random
+
+import results_query
+from marks_table import StudentTable
+from ranking import top_k
+from results_query import ResultsQuery
+from student_marks_analyzer import analyze_student_marks
+
+
+def roster(seed=2, size=400):
+    rng = random.Random(seed)
+    return {f"S{i}": [rng.choice([40, 75, rng.randint(0, 100)]) for _ in range(3)] for i in range(size)}
+
+
+def test_ranges_sorting_and_pages_match_a_full_sort(monkeypatch):
+    for numpy in (results_query.np, None):
+        monkeypatch.setattr(results_query, 'np', numpy)
+        check_against_full_sort()
+
+
+def check_against_full_sort():
+    students = roster()
+    results = analyze_student_marks(students)
+    averages = results['student_averages']
+    query = ResultsQuery(StudentTable.from_dict(students), results)
+
+    in_range = [name for name in averages if 60 <= averages[name] <= 70]
+    descending = sorted(in_range, key=averages.__getitem__, reverse=True)
+    ascending = sorted(in_range, key=averages.__getitem__)
+
+    assert query.count(low=60, high=70) == len(in_range)
+    assert [query.names[i] for i in query.search(low=60, high=70)] == descending
+    assert [query.names[i] for i in query.search(low=60, high=70, descending=False)] == ascending
+
+    rows, total = query.page(low=60, high=70, page=2, page_size=10)
+    assert total == len(in_range)
+    assert [row['Student'] for row in rows] == descending[10:20]
+    assert rows[0]['Average'] == averages[rows[0]['Student']]
+
+    # A name search keeps the sort order and counts only the matches
+    named = [name for name in descending if 'S1' in name]
+    assert query.count(low=60, high=70, name='s1') == len(named)
+    rows, total = query.page(low=60, high=70, page=2, page_size=5, name='s1')
+    assert total == len(named)
+    assert [row['Student'] for row in rows] == named[5:10]
+
+
+def test_subject_keys_follow_top_k():
+    """Ties keep roster order, as in the ranking helpers."""
+    students = roster(5)
+    query = ResultsQuery(students, analyze_student_marks(students))
+
+    assert query.keys == ('average', 'Math', 'Science', 'English')
+    assert [query.names[i] for i in query.search('Science', limit=15)] == [
+        name for name, _ in top_k(students, by='Science', k=15)
+    ]
+    assert len(query.search('Math', low=101)) == 0
+    assert query.page('Math', page=100)[0] == []
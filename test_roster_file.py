@@ -0,0 +1,94 @@
+"""
+Tests for the memory-mapped binary roster format.
+"""
+
+import pytest
+
+from marks_table import StudentTable
+from roster_file import HEADER, open_roster, write_roster
+from student_marks_analyzer import analyze_student_marks
+
+STUDENTS = {
+    'Alice': [85, 90, 78, 66],
+    'Bob': [72, 88, 91, 35],
+    'Zoë': [95, 85, 89, 77]
+}
+SUBJECTS = ('Math', 'Science', 'English', 'Géographie')
+
+
+def test_roster_round_trips_without_copying(tmp_path):
+    """A saved roster reopens as a StudentTable over the mapped file."""
+    path = tmp_path / 'class.smrk'
+    write_roster(path, STUDENTS, SUBJECTS)
+    table = open_roster(path)
+
+    assert isinstance(table, StudentTable)
+    assert table.subjects == SUBJECTS
+    assert list(table.names) == ['Alice', 'Bob', 'Zoë']
+    assert table.to_dict() == STUDENTS
+    assert isinstance(table.buffer.obj, type(table.names.blob.obj))
+    assert analyze_student_marks(table) == analyze_student_marks(STUDENTS, SUBJECTS)
+
+
+def test_empty_roster(tmp_path):
+    path = tmp_path / 'empty.smrk'
+    write_roster(path, {})
+
+    assert len(open_roster(path)) == 0
+
+
+def test_invalid_files_are_rejected(tmp_path):
+    """Foreign, truncated and out-of-range files raise ValueError."""
+    path = tmp_path / 'class.smrk'
+    write_roster(path, STUDENTS, SUBJECTS)
+    data = path.read_bytes()
+
+    bad = tmp_path / 'bad.smrk'
+    for content in (b'name,math\n', data[:-1], b'XXXX' + data[4:], data[:-1] + bytes([101])):
+        bad.write_bytes(content)
+        with pytest.raises(ValueError):
+            open_roster(bad)
+
+
+def test_truncated_subject_header_is_rejected(tmp_path):
+    """A file cut inside the subject names raises ValueError, not struct.error."""
+    path = tmp_path / 'class.smrk'
+    write_roster(path, STUDENTS, SUBJECTS)
+    data = path.read_bytes()
+
+    bad = tmp_path / 'bad.smrk'
+    for size in (HEADER.size, HEADER.size + 1, HEADER.size + 4):
+        bad.write_bytes(data[:size])
+        with pytest.raises(ValueError, match='truncated or corrupt'):
+            open_roster(bad)
+
+
+def test_close_unmaps_the_file(tmp_path):
+    """Closing the table releases the mapping, so the file can be replaced."""
+    path = tmp_path / 'class.smrk'
+    write_roster(path, STUDENTS, SUBJECTS)
+
+    with open_roster(path) as table:
+        assert table.to_dict() == STUDENTS
+    assert table.closed
+    with pytest.raises(ValueError):
+        list(table.names)
+    table.close()
+
+    write_roster(path, {'Eve': [50, 60, 70, 80]}, SUBJECTS)
+    assert open_roster(path).to_dict() == {'Eve': [50, 60, 70, 80]}
+
+
+def test_bad_name_offsets_are_rejected(tmp_path):
+    """Offsets that go backwards or past the names blob raise ValueError."""
+    path = tmp_path / 'class.smrk'
+    write_roster(path, STUDENTS, SUBJECTS)
+    data = bytearray(path.read_bytes())
+    offsets_start = len(data) - len(STUDENTS) * len(SUBJECTS) - len('AliceBobZoë'.encode('utf-8')) - 4 * 4
+
+    for index, value in ((1, 9), (3, 200)):
+        bad = data[:]
+        bad[offsets_start + 4 * index:offsets_start + 4 * index + 4] = value.to_bytes(4, 'little')
+        path.write_bytes(bad)
+        with pytest.raises(ValueError, match="name offsets"):
+            open_roster(path)
@@ -0,0 +1,89 @@
+"""
+Tests for bulk CSV/Excel and edited-grid roster import.
+"""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from marks_table import MarksTable, StudentTable  # noqa: E402
+from roster_import import blank_roster, read_roster_file, roster_dataframe, table_from_dataframe  # noqa: E402
+from student_marks_analyzer import analyze_student_marks  # noqa: E402
+
+STUDENTS = {
+    'Alice': [85, 90, 78],
+    'Bob': [72, 88, 91],
+    'Charlie': [95, 85, 89],
+    'David': [35, 65, 70]
+}
+
+
+def test_csv_upload_matches_dict_analysis(tmp_path):
+    """A CSV roster loads as a compact table with the same results."""
+    path = tmp_path / "roster.csv"
+    path.write_text("Name, Math, Science, English\n" + "".join(
+        f"{name}, {', '.join(map(str, marks))}\n" for name, marks in STUDENTS.items()
+    ))
+    table = read_roster_file(str(path))
+    assert isinstance(table, StudentTable)
+    assert table.subjects == ('Math', 'Science', 'English')
+    assert analyze_student_marks(table) == analyze_student_marks(STUDENTS)
+
+
+def test_edited_grid_skips_unnamed_rows():
+    """Blank rows added in the editor are ignored; fractional marks keep their precision."""
+    frame = roster_dataframe(STUDENTS)
+    assert list(frame.columns) == ['Name', 'Math', 'Science', 'English']
+    subjects = ['Math', 'Science', 'English']
+    frame.loc[len(frame)] = [None, None, None, None]
+    assert dict(table_from_dataframe(frame, subjects)) == STUDENTS
+
+    frame.loc[0, 'Math'] = 85.5
+    table = table_from_dataframe(frame, subjects)
+    assert isinstance(table, MarksTable) and table['Alice'] == [85.5, 90, 78]
+
+    assert len(table_from_dataframe(blank_roster(['Math', 'Physics']))) == 0
+
+
+@pytest.mark.parametrize('change, message', [
+    ({'Name': ['Alice', 'Alice']}, "unique"),
+    ({'Math': [101, 50]}, "between 0 and 100"),
+    ({'Math': [None, 50]}, "missing marks"),
+    ({'Math': ['ten', 50]}, "must be numbers"),
+])
+def test_invalid_rosters_are_rejected(change, message):
+    frame = pd.DataFrame({'Name': ['Alice', 'Bob'], 'Math': [80, 50], **change})
+    with pytest.raises(ValueError, match=message):
+        table_from_dataframe(frame, ['Math'])
+
+
+def test_text_in_a_subject_column_is_rejected(tmp_path):
+    """Every column but the names is a subject, so a stray word is an error, not a dropped subject."""
+    path = tmp_path / "roster.csv"
+    path.write_text("Name,Math,Science,English\na,90,80,abs\n")
+    with pytest.raises(ValueError, match="Marks must be numbers"):
+        read_roster_file(str(path))
+
+
+@pytest.mark.parametrize('roll_numbers', [['R01', 'R02', 'R03', 'R04'], [1001, 1002, 1003, 1004]])
+@pytest.mark.parametrize('extension', ['csv', 'parquet'])
+def test_identifier_columns_are_rejected_in_every_format(tmp_path, extension, roll_numbers):
+    """An ID column is never analysed as marks; naming the subjects leaves it out."""
+    frame = roster_dataframe(STUDENTS)
+    frame.insert(1, 'Roll No', roll_numbers)
+    path = tmp_path / f"roster.{extension}"
+    if extension == 'parquet':
+        pytest.importorskip("pyarrow")
+        frame.to_parquet(path)
+    else:
+        frame.to_csv(path, index=False)
+
+    with pytest.raises(ValueError, match="'Roll No' is not"):
+        read_roster_file(str(path))
+    table = read_roster_file(str(path), subjects=['Math', 'Science', 'English'])
+    assert analyze_student_marks(table) == analyze_student_marks(STUDENTS)
+
+
+def test_unsupported_format_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported"):
+        read_roster_file("roster.txt")
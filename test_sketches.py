@@ -0,0 +1,61 @@
+"""
+Tests for the 101-bucket mark histogram sketches.
+"""
+
+import random
+import statistics
+
+import pytest
+
+from sketches import MarkHistogram, distribution_summary, merge_histograms, subject_histograms
+
+STUDENTS = {
+    'Alice': [85, 90, 78],
+    'Bob': [72, 88, 91],
+    'Charlie': [95, 85, 89],
+    'David': [35, 65, 70]
+}
+
+
+def test_percentiles_are_exact():
+    """Median and quartiles match the sorted marks exactly."""
+    rng = random.Random(5)
+    marks = [rng.randint(0, 100) for _ in range(999)]
+    histogram = MarkHistogram.from_marks(marks)
+
+    assert histogram.total == 999
+    assert histogram.median() == statistics.median(marks)
+    assert histogram.quartiles() == tuple(statistics.quantiles(marks, n=4, method='inclusive'))
+    assert (histogram.minimum, histogram.maximum) == (min(marks), max(marks))
+
+
+def test_grade_counts_and_bins():
+    """Grade bands follow get_grade; bins cover 0-100 with 100 in the last bin."""
+    histogram = MarkHistogram.from_marks([100, 90, 89, 80, 65, 50, 49, 0])
+
+    assert histogram.grade_counts() == {'A+': 2, 'A': 2, 'B': 0, 'C': 1, 'D': 1, 'F': 2}
+    bins = histogram.bins(10)
+    assert bins[0] == (0, 9, 1)
+    assert bins[-1] == (90, 100, 2)
+    assert sum(count for _, _, count in bins) == 8
+
+
+def test_merging_shards_equals_one_pass():
+    """Per-subject sketches merge across shards."""
+    first = dict(list(STUDENTS.items())[:2])
+    second = dict(list(STUDENTS.items())[2:])
+
+    merged = merge_histograms(subject_histograms(first), subject_histograms(second))
+    assert merged == subject_histograms(STUDENTS)
+
+    rows = {row['Subject']: row for row in distribution_summary(merged)}
+    assert rows['Math']['Median'] == 78.5
+    assert rows['Science']['A+'] == 1
+
+
+def test_rejects_marks_outside_buckets():
+    """Only whole marks from 0 to 100 can be counted."""
+    with pytest.raises(ValueError):
+        MarkHistogram.from_marks([101])
+    with pytest.raises(ValueError):
+        MarkHistogram.from_marks([55.5])
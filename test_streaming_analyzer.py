@@ -0,0 +1,66 @@
+"""
+Tests for the streaming, constant-memory analyzer.
+"""
+
+import io
+
+from streaming_analyzer import RunningAnalysis, analyze_csv, analyze_stream, iter_csv_rows
+from student_marks_analyzer import analyze_student_marks, display_analysis
+
+STUDENTS = {
+    'Emma': [92, 88, 95],
+    'Frank': [45, 78, 82],
+    'Grace': [38, 42, 35],
+    'Henry': [88, 92, 90],
+    'Ivy': [75, 68, 72]
+}
+
+CSV_TEXT = """Name,Math,Science,English
+Emma,92,88,95
+Frank,45,78,82
+Grace,38,42,35
+Henry,88,92,90
+Ivy,75,68,72
+"""
+
+
+def test_summary_matches_full_analysis():
+    """Streaming keeps the same failures and toppers as the full analyzer."""
+    summary = analyze_stream(STUDENTS.items())
+    results = analyze_student_marks(STUDENTS)
+
+    assert summary['student_count'] == 5
+    assert summary['failed_students'] == results['failed_students']
+    assert summary['class_topper'] == results['class_topper']
+    assert summary['subject_toppers'] == results['subject_toppers']
+    assert summary['top_average'] == results['student_averages'][results['class_topper']]
+    assert summary['subject_averages']['Math'] == round(338 / 5, 2)
+
+
+def test_csv_rows_are_read_lazily_and_by_column_name():
+    """Subject columns are picked by header, in the requested order."""
+    rows = iter_csv_rows(io.StringIO(CSV_TEXT), subjects=['English', 'Math'])
+
+    assert next(rows) == ('Emma', [95, 92])
+    assert next(rows) == ('Frank', [82, 45])
+
+
+def test_analyze_csv_file(tmp_path, capsys):
+    """A CSV file on disk is analyzed and can be displayed."""
+    path = tmp_path / "roster.csv"
+    path.write_text(CSV_TEXT, encoding="utf-8")
+
+    summary = analyze_csv(str(path))
+    assert summary == analyze_stream(STUDENTS.items())
+
+    display_analysis(summary)
+    assert "STUDENTS ANALYZED: 5" in capsys.readouterr().out
+
+
+def test_empty_stream():
+    """An empty roster gives an empty summary rather than an error."""
+    summary = RunningAnalysis().summary()
+
+    assert summary['student_count'] == 0
+    assert summary['class_topper'] == ''
+    assert summary['class_average'] == 0
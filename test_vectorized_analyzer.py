@@ -0,0 +1,80 @@
+"""
+Tests for the vectorized analysis engine.
+Checks that it returns exactly what the loop-based analyzer returns.
+"""
+
+import random
+
+import pytest
+
+from marks_table import MarksTable, StudentTable
+from student_marks_analyzer import analyze_student_marks
+
+pytest.importorskip("numpy")
+
+from vectorized_analyzer import analyze_student_marks_vectorized, marks_matrix
+
+
+def test_matches_loop_analyzer_on_sample_data():
+    """Both engines agree on the sample data set."""
+    students = {
+        'Alice': [85, 90, 78],
+        'Bob': [72, 88, 91],
+        'Charlie': [95, 85, 89],
+        'David': [35, 65, 70]
+    }
+
+    assert analyze_student_marks_vectorized(students) == analyze_student_marks(students)
+
+
+def test_matches_loop_analyzer_on_random_rosters():
+    """Ties, zero marks and failures are resolved the same way."""
+    rng = random.Random(7)
+    for size in (1, 5, 200):
+        students = {
+            f"Student{i}": [rng.choice([0, 39, 40, 100, rng.randint(0, 100)]) for _ in range(3)]
+            for i in range(size)
+        }
+        assert analyze_student_marks_vectorized(students) == analyze_student_marks(students)
+
+
+def test_empty_and_all_zero_rosters():
+    """No topper is reported when nobody scored above zero."""
+    assert analyze_student_marks_vectorized({}) == analyze_student_marks({})
+
+    students = {'Zero': [0, 0, 0], 'Also_Zero': [0, 0, 0]}
+    results = analyze_student_marks_vectorized(students)
+    assert results['class_topper'] == ''
+    assert results['failed_students'] == ['Zero', 'Also_Zero']
+
+
+def test_accepts_marks_table_with_custom_subjects():
+    """Columns of a MarksTable feed the engine directly."""
+    students = {
+        'Alice': [85, 90, 78, 66, 91],
+        'Bob': [72, 88, 91, 35, 60],
+        'Charlie': [95, 85, 89, 77, 58]
+    }
+    table = MarksTable.from_dict(students, ('Math', 'Science', 'English', 'History', 'Art'))
+
+    assert analyze_student_marks_vectorized(table) == analyze_student_marks(table)
+
+
+def test_student_table_buffer_is_used_without_copying():
+    """A StudentTable's uint8 marks are analyzed in place."""
+    students = {'Alice': [85, 90, 78], 'Bob': [72, 88, 91], 'David': [35, 65, 70]}
+    table = StudentTable.from_dict(students)
+
+    _, matrix = marks_matrix(table)
+    assert matrix.dtype.name == 'uint8' and not matrix.flags.owndata
+    assert analyze_student_marks_vectorized(table) == analyze_student_marks(students)
+
+
+def test_ragged_rows_are_rejected():
+    """A row with too few or too many marks raises instead of shifting marks."""
+    students = {'Alice': [85, 90], 'Bob': [72, 88, 91, 60]}
+
+    with pytest.raises(ValueError, match="Alice has 2 marks, expected 3"):
+        analyze_student_marks_vectorized(students)
+    with pytest.raises(ValueError, match="Alice has 2 marks, expected 3"):
+        analyze_student_marks(students)
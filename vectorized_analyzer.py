@@ -0,0 +1,143 @@
+"""
+Vectorized analysis engine for Student Marks Analyzer.
+Loads every student's marks into one (n_students, n_subjects) NumPy array and
+computes failures, averages and toppers with whole-array operations instead of
+a Python loop per student, each section on first access.
+"""
+
+from itertools import chain
+
+from marks_table import PASS_MARK, MarksTable, StudentTable, subjects_of
+from student_marks_analyzer import LazyResults
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; callers fall back to the pure-Python loop
+    np = None
+
+
+def numpy_available():
+    """Return True if NumPy can be used by this engine."""
+    return np is not None
+
+
+def marks_matrix(students, subjects=None):
+    """
+    Build the marks array for a roster.
+
+    Args:
+        students (dict or MarksTable): {'StudentName': [mark per subject]}
+        subjects (sequence): Subject names, in the order marks are listed
+
+    Returns:
+        tuple: (names list, array of shape (n_students, n_subjects)); a
+               StudentTable's uint8 buffer is viewed without copying, other
+               rosters are loaded as float64
+
+    Raises:
+        ValueError: If a student does not have one mark per subject
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the vectorized analysis engine")
+
+    if isinstance(students, StudentTable):
+        matrix = np.frombuffer(students.buffer, dtype=np.uint8)
+        return list(students.names), matrix.reshape(len(students), len(students.subjects))
+
+    if isinstance(students, MarksTable):
+        # Columns are already contiguous, so stack them without touching rows
+        columns = [np.asarray(column, dtype=np.float64) for column in students.columns]
+        if not columns:
+            return list(students.names), np.empty((len(students), 0))
+        return list(students.names), np.column_stack(columns)
+
+    if subjects is None:
+        subjects = subjects_of(students)
+    names = list(students.keys())
+    width = len(subjects)
+    # A short row followed by a long one would otherwise shift marks between students
+    lengths = np.fromiter(map(len, students.values()), dtype=np.int64, count=len(names))
+    ragged = np.flatnonzero(lengths != width)
+    if ragged.size:
+        index = int(ragged[0])
+        raise ValueError(f"{names[index]} has {lengths[index]} marks, expected {width}")
+    flat = np.fromiter(
+        chain.from_iterable(students.values()),
+        dtype=np.float64,
+        count=len(names) * width,
+    )
+    return names, flat.reshape(len(names), width)
+
+
+def _topper(names, scores):
+    """Name with the first highest score, or '' if nobody scored above 0."""
+    if not len(scores):
+        return ''
+    index = int(np.argmax(scores))
+    return names[index] if scores[index] > 0 else ''
+
+
+class VectorizedResults(LazyResults):
+    """
+    LazyResults computed from the marks array with whole-array operations.
+
+    Sections are still only built when read, so asking for the topper and
+    the failed students never builds a dictionary per student.
+    """
+
+    def __init__(self, students, subjects, pass_mark, names, marks):
+        super().__init__(students, subjects, pass_mark)
+        self._name_list = names
+        self._marks = marks
+
+    def _averages(self):
+        # Averages are compared unrounded, as in the loop version
+        if self._raw_averages is None:
+            self._raw_averages = self._marks.sum(axis=1) / len(self._subjects)
+        return self._raw_averages
+
+    def _compute_failed_students(self):
+        # Students with any mark below the pass mark
+        failed_mask = (self._marks < self._pass_mark).any(axis=1)
+        return [self._name_list[i] for i in np.flatnonzero(failed_mask).tolist()]
+
+    def _compute_student_averages(self):
+        return dict(zip(self._name_list, np.round(self._averages(), 2).tolist()))
+
+    def _compute_class_topper(self):
+        return _topper(self._name_list, self._averages())
+
+    def _compute_subject_toppers(self):
+        return {
+            subject: _topper(self._name_list, self._marks[:, column])
+            for column, subject in enumerate(self._subjects)
+        }
+
+
+def analyze_student_marks_vectorized(students, subjects=None, pass_mark=PASS_MARK):
+    """
+    Analyze student marks using NumPy array operations.
+
+    Produces the same results as
+    student_marks_analyzer.analyze_student_marks, including its tie-breaking:
+    the first student in roster order with the highest score is the topper.
+    The marks array is built (and checked) up front; each section is
+    computed from it the first time it is read.
+
+    Args:
+        students (dict or MarksTable): Dictionary with student names as keys and lists of marks as values
+                         Format: {'StudentName': [Math, Science, English]}
+        subjects (sequence): Subject names, in the order marks are listed;
+                             defaults to the table's subjects or Math/Science/English
+        pass_mark (int): Marks below this value count as a fail
+
+    Returns:
+        VectorizedResults: Reads like the results dictionary
+
+    Raises:
+        ValueError: If a student does not have one mark per subject
+    """
+    if subjects is None:
+        subjects = subjects_of(students)
+    names, marks = marks_matrix(students, subjects)
+    return VectorizedResults(students, subjects, pass_mark, names, marks)
@@ -0,0 +1,103 @@
+"""
+Input widgets shared by the Streamlit apps.
+Roster entry (file upload plus an editable grid), incremental analysis of
+edited rosters, and the sort/search/page controls and failure alert shown
+above the paged tables. pandas is only imported when a roster is entered.
+"""
+
+import streamlit as st
+
+from incremental_analyzer import IncrementalAnalyzer
+from marks_table import DEFAULT_SUBJECTS
+
+# Large rosters are shown a page at a time; this caps the failed names listed in full
+FAILED_SHOWN = 20
+
+
+def incremental_results(students):
+    """Update the session's analyzer with only the students that changed"""
+    analyzer = st.session_state.get("incremental_analyzer")
+    if analyzer is None or analyzer.subjects != tuple(students.subjects):
+        analyzer = IncrementalAnalyzer(students.subjects)
+        st.session_state["incremental_analyzer"] = analyzer
+    return analyzer.sync(students).results()
+
+
+def get_custom_data():
+    """Get a roster from an uploaded CSV/Excel file or an editable grid"""
+    from roster_import import blank_roster, table_from_dataframe
+
+    st.sidebar.subheader("Add Students")
+
+    # A whole class or school can be uploaded; otherwise start from a blank grid
+    uploaded = st.sidebar.file_uploader("Roster file (CSV or Excel):", type=["csv", "xlsx", "xls"])
+    name_column = st.sidebar.text_input("Name column:", value="Name")
+    if uploaded is not None:
+        try:
+            roster = load_roster_file(uploaded.file_id, name_column, uploaded)
+        except (ValueError, ImportError) as e:
+            st.sidebar.error(f"Could not read roster: {e}")
+            return None
+        st.sidebar.success(f"Loaded {len(roster)} students")
+        editor_key = f"roster_editor_{uploaded.file_id}"
+    else:
+        subjects_text = st.sidebar.text_input("Subjects (comma-separated):", value=", ".join(DEFAULT_SUBJECTS))
+        subjects = [subject.strip() for subject in subjects_text.split(",") if subject.strip()] or list(DEFAULT_SUBJECTS)
+        roster = blank_roster(subjects, name_column)
+        editor_key = "roster_editor"
+
+    # Names and marks are edited in one grid; new rows can be added at the bottom
+    with st.expander("✏️ Edit Students", expanded=uploaded is None):
+        marks_column = st.column_config.NumberColumn(min_value=0, max_value=100)
+        edited = st.data_editor(
+            roster,
+            num_rows="dynamic",
+            hide_index=True,
+            column_config={subject: marks_column for subject in roster.columns[1:]},
+            key=editor_key
+        )
+
+    # The edited grid is converted in one vectorized step
+    try:
+        return table_from_dataframe(edited, list(roster.columns[1:]), name_column)
+    except ValueError as e:
+        st.error(f"Please fix the roster: {e}")
+        return None
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def load_roster_file(file_id, name_column, _uploaded):
+    """An uploaded roster as an editable DataFrame, parsed once per upload"""
+    from roster_import import read_roster_file, roster_dataframe
+
+    return roster_dataframe(read_roster_file(_uploaded, _uploaded.name, name_column=name_column), name_column)
+
+
+def paged_positions(query, key):
+    """Sort, score range, name search and page controls; returns the roster positions on screen"""
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        by = st.selectbox("Sort by:", query.keys, format_func=str.title, key=f"{key}_sort")
+    with col2:
+        order = st.selectbox("Order:", ["Highest first", "Lowest first"], key=f"{key}_order")
+    with col3:
+        name = st.text_input("Search names:", key=f"{key}_search").strip()
+    with col4:
+        page_size = st.number_input("Students per page:", min_value=1, max_value=500,
+                                    value=50, key=f"{key}_page_size")
+    low, high = st.slider("Score range:", 0.0, 100.0, (0.0, 100.0), key=f"{key}_range")
+
+    # Only the visible page is sliced from the sorted indexes and sent to the browser
+    pages = max(1, -(-query.count(by, low, high, name) // page_size))
+    page = st.number_input("Page:", min_value=1, max_value=pages, value=1, key=f"{key}_page")
+    positions, total = query.page_positions(by, low, high, order == "Highest first", page, page_size, name)
+    st.caption(f"Page {page} of {pages} · {total} matching students")
+    return positions
+
+
+def failed_alert(failed, shown=FAILED_SHOWN):
+    """Name the first few failed students and count the rest"""
+    if failed:
+        more = f" and {len(failed) - shown} more" if len(failed) > shown else ""
+        st.error(f"⚠️ Students who failed: {', '.join(failed[:shown])}{more}")
+